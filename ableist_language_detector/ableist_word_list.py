@@ -1,12 +1,25 @@
 """Module to create ableist language dataclass instance collection from csv wordlist."""
 
+import hashlib
+import json
 import os
 from csv import DictReader
-from dataclasses import dataclass
-from typing import List, Union
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
 
-__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+import srsly
+
+__location__ = os.path.dirname(os.path.realpath(__file__))
 WORDLIST_CSV_PATH = os.path.join(__location__, "ableist_word_list.csv")
+# Precompiled wordlists written by `build_wordlist.py`. Bump the version whenever the
+# artifact layout or the matcher patterns change so stale artifacts are rejected.
+WORDLIST_ARTIFACT_SUFFIX = ".msgpack"
+WORDLIST_ARTIFACT_VERSION = 1
+# Artifact of the packaged csv, used instead of parsing the csv while it is up to date
+WORDLIST_ARTIFACT_PATH = (
+    os.path.splitext(WORDLIST_CSV_PATH)[0] + WORDLIST_ARTIFACT_SUFFIX
+)
 
 
 @dataclass
@@ -47,16 +60,196 @@ class AbleistLanguage:
                     f"cannot be mapped to boolean."
                 )
 
-        # TODO: Check to see if input is actually in lemma form?
+
+def get_wordlist_fingerprint(ableist_verbs: Dict[str, AbleistLanguage]) -> str:
+    """Return a content hash of a collection of ableist verbs; the fingerprint changes
+    whenever any verb or its data changes, so it can be used as a cache key.
+
+    Parameters
+    ----------
+    ableist_verbs : Dict[str, AbleistLanguage]
+        Collection of ableist verbs, where the key is the string representation of the
+        verb and the value is the dataclass object containing the verb's data
+
+    Returns
+    -------
+    str
+        Hex digest of the wordlist contents
+    """
+    payload = json.dumps(
+        [asdict(ableist_verbs[verb]) for verb in sorted(ableist_verbs)],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_ableist_verbs(
+    wordlist_csv_path: str = WORDLIST_CSV_PATH,
+) -> Dict[str, AbleistLanguage]:
+    """Parse a wordlist csv into a collection of ableist verb data objects.
+
+    Parameters
+    ----------
+    wordlist_csv_path : str, optional
+        Path to the wordlist csv, by default the csv packaged with this module
+
+    Returns
+    -------
+    Dict[str, AbleistLanguage]
+        Collection of ableist verbs, where the key is the string representation of the
+        verb and the value is the dataclass object containing the verb's data
+    """
+    ableist_verbs = {}
+    with open(wordlist_csv_path, "r") as wordlist_csv:
+        reader = DictReader(wordlist_csv)
+        for row in reader:
+            row_data = AbleistLanguage(**row)
+            ableist_verbs[row_data.verb] = row_data
+    return ableist_verbs
+
+
+@dataclass
+class WordlistArtifact:
+    """Precompiled wordlist: the validated entries, their fingerprint and the matcher
+    patterns built from them.
+    """
+
+    ableist_verbs: Dict[str, AbleistLanguage]
+    fingerprint: str
+    patterns: Dict[str, list]
+    source_hash: str
+
+
+def get_file_hash(path: str) -> str:
+    """Return the sha256 hex digest of a file's bytes."""
+    with open(path, "rb") as source_file:
+        return hashlib.sha256(source_file.read()).hexdigest()
+
+
+def is_wordlist_artifact(wordlist_path: str) -> bool:
+    """Return whether a wordlist path points to a precompiled artifact rather than a
+    csv.
+    """
+    return wordlist_path.endswith(WORDLIST_ARTIFACT_SUFFIX)
+
+
+def load_wordlist_artifact(artifact_path: str) -> WordlistArtifact:
+    """Load a wordlist artifact written by `build_wordlist.py`. The entries were
+    validated and the fingerprint computed at build time, so neither is redone here.
+
+    Parameters
+    ----------
+    artifact_path : str
+        Path to the artifact
+
+    Returns
+    -------
+    WordlistArtifact
+        Wordlist entries, fingerprint and matcher patterns
+
+    Raises
+    ------
+    ValueError
+        If the artifact was written with a different artifact version
+    """
+    data = srsly.read_msgpack(artifact_path)
+    if data.get("version") != WORDLIST_ARTIFACT_VERSION:
+        raise ValueError(
+            f"Wordlist artifact {artifact_path} has version {data.get('version')}, "
+            f"expected {WORDLIST_ARTIFACT_VERSION}. Rebuild it with build_wordlist.py."
+        )
+    return WordlistArtifact(
+        ableist_verbs={
+            entry["verb"]: AbleistLanguage(**entry) for entry in data["entries"]
+        },
+        fingerprint=data["fingerprint"],
+        patterns=data["patterns"],
+        source_hash=data["source_hash"],
+    )
+
+
+_default_wordlist_path = WORDLIST_CSV_PATH
+
+
+def set_default_wordlist(wordlist_path: str = WORDLIST_CSV_PATH) -> None:
+    """Set the wordlist returned by `get_ableist_verbs`, e.g. a copy shipped with a
+    saved model. Call this before the first document is processed.
+
+    Parameters
+    ----------
+    wordlist_path : str, optional
+        Path to a wordlist csv, or to a precompiled artifact ending in ".msgpack", by
+        default the csv packaged with this module
+    """
+    global _default_wordlist_path
+    _default_wordlist_path = wordlist_path
+    get_default_wordlist_artifact.cache_clear()
+    get_ableist_verbs.cache_clear()
+    get_ableist_verbs_fingerprint.cache_clear()
+
+
+def get_default_wordlist_path() -> str:
+    """Return the wordlist path set by `set_default_wordlist`."""
+    return _default_wordlist_path
+
+
+@lru_cache(maxsize=None)
+def get_default_wordlist_artifact() -> Optional[WordlistArtifact]:
+    """Return the default wordlist artifact, loaded on first use only. The packaged
+    csv is loaded from its packaged artifact as long as the artifact was built from
+    the csv's current contents with the current artifact version. Returns None if the
+    default wordlist is a csv without an up to date artifact.
+    """
+    if is_wordlist_artifact(_default_wordlist_path):
+        return load_wordlist_artifact(_default_wordlist_path)
+    if _default_wordlist_path != WORDLIST_CSV_PATH or not os.path.exists(
+        WORDLIST_ARTIFACT_PATH
+    ):
+        return None
+    try:
+        artifact = load_wordlist_artifact(WORDLIST_ARTIFACT_PATH)
+    except ValueError:
+        return None
+    if artifact.source_hash != get_file_hash(WORDLIST_CSV_PATH):
+        return None
+    return artifact
+
+
+@lru_cache(maxsize=None)
+def get_ableist_verbs() -> Dict[str, AbleistLanguage]:
+    """Return the default wordlist, parsing it on first use only."""
+    artifact = get_default_wordlist_artifact()
+    if artifact is not None:
+        return artifact.ableist_verbs
+    return load_ableist_verbs(_default_wordlist_path)
+
+
+@lru_cache(maxsize=None)
+def get_ableist_verbs_fingerprint() -> str:
+    """Return the fingerprint of the default wordlist, computed on first use only."""
+    artifact = get_default_wordlist_artifact()
+    if artifact is not None:
+        return artifact.fingerprint
+    return get_wordlist_fingerprint(get_ableist_verbs())
+
+
+def get_ableist_verbs_patterns() -> Optional[Dict[str, list]]:
+    """Return the precompiled matcher patterns of the default wordlist, or None if the
+    default wordlist is a csv.
+    """
+    artifact = get_default_wordlist_artifact()
+    return None if artifact is None else artifact.patterns
 
 
-ABLEIST_VERBS = {}
-with open(WORDLIST_CSV_PATH, "r") as wordlist_csv:
-    reader = DictReader(wordlist_csv)
-    for row in reader:
-        row_data = AbleistLanguage(**row)
-        ABLEIST_VERBS[row_data.verb] = row_data
+def __getattr__(name):
+    # ABLEIST_VERBS and its fingerprint are loaded lazily so importing the package
+    # does not parse the csv
+    if name == "ABLEIST_VERBS":
+        return get_ableist_verbs()
+    if name == "ABLEIST_VERBS_FINGERPRINT":
+        return get_ableist_verbs_fingerprint()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    print(ABLEIST_VERBS)
+    print(get_ableist_verbs())
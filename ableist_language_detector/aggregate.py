@@ -0,0 +1,278 @@
+"""Command line tool to count ableist language by lexicon verb and by groups of job
+descriptions, e.g. by employer, month or occupation code, without keeping
+individual matches in memory.
+"""
+
+import json
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import click
+import pandas as pd
+
+from ableist_language_detector import detector
+from ableist_language_detector.pool import chunked
+from ableist_language_detector.stream import map_chunks
+
+GroupedRecord = Tuple[Tuple, str]
+MONTH_COLUMN = "month"
+
+
+@dataclass
+class LemmaCounts:
+    """Mergeable counts of matches per group and lexicon verb.
+
+    `matches` counts every match and `documents` counts the documents with at least
+    one match of a verb, both keyed by (*group values, verb); `group_documents` counts
+    all documents of each group, keyed by the group values.
+    """
+
+    group_fields: Tuple[str, ...] = ()
+    matches: Counter = field(default_factory=Counter)
+    documents: Counter = field(default_factory=Counter)
+    group_documents: Counter = field(default_factory=Counter)
+
+    def add_document(
+        self, group: Tuple, matches: Iterable[detector.AbleistLanguageMatch]
+    ) -> None:
+        """Count the matches of one document."""
+        verb_counts = Counter(match.data.verb for match in matches)
+        self.group_documents[group] += 1
+        for verb, count in verb_counts.items():
+            self.matches[group + (verb,)] += count
+            self.documents[group + (verb,)] += 1
+
+    def merge(self, other: "LemmaCounts") -> "LemmaCounts":
+        """Add the counts of another partial result to these counts, in place."""
+        if other.group_fields != self.group_fields:
+            raise ValueError(
+                f"Cannot merge counts grouped by {other.group_fields} into counts "
+                f"grouped by {self.group_fields}."
+            )
+        self.matches.update(other.matches)
+        self.documents.update(other.documents)
+        self.group_documents.update(other.group_documents)
+        return self
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return one row per group and verb with the number of matches, the number of
+        documents with a match and the number of documents in the group. Groups
+        without any match get a single row with no verb and zero counts, so every
+        group's document count is kept.
+        """
+        columns = list(self.group_fields) + [
+            "verb",
+            "matches",
+            "documents",
+            "group_documents",
+        ]
+        matched_groups = {key[:-1] for key in self.matches}
+        keys = list(self.matches) + [
+            group + (None,)
+            for group in self.group_documents
+            if group not in matched_groups
+        ]
+        rows = [
+            key
+            + (
+                self.matches[key],
+                self.documents[key],
+                self.group_documents[key[:-1]],
+            )
+            for key in sorted(keys, key=_sort_key)
+        ]
+        return pd.DataFrame(rows, columns=columns)
+
+
+def _sort_key(key: Tuple) -> Tuple[str, ...]:
+    # Group values can mix types and None, which do not compare with each other
+    return tuple("" if value is None else str(value) for value in key)
+
+
+def _group_value(value):
+    # Lists and objects are not hashable; they are grouped by their JSON text
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+def read_grouped_records(
+    lines: Iterable[str],
+    group_fields: Sequence[str] = (),
+    text_field: str = "text",
+    month_field: Optional[str] = None,
+) -> Iterator[GroupedRecord]:
+    """Read (group values, text) records from JSON lines, lazily.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        JSON lines, one job description per line
+    group_fields : Sequence[str], optional
+        Fields whose values define the groups, by default () (a single group). List
+        and object values are grouped by their JSON text.
+    text_field : str, optional
+        Name of the text field, by default "text"
+    month_field : Optional[str], optional
+        Field with an ISO date (e.g. "2021-06-30") whose month is added as the last
+        group value, by default None
+
+    Yields
+    ------
+    Iterator[GroupedRecord]
+        (group values, text) for each document
+    """
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if text_field not in record:
+            raise ValueError(f"Line {line_number} has no {text_field!r} field.")
+        group = tuple(
+            _group_value(record.get(group_field)) for group_field in group_fields
+        )
+        if month_field is not None:
+            date = record.get(month_field)
+            group += (str(date)[:7] if date else None,)
+        yield group, str(record[text_field])
+
+
+def count_records(
+    records: List[GroupedRecord],
+    group_fields: Tuple[str, ...] = (),
+    prefilter: bool = False,
+) -> LemmaCounts:
+    """Count the matches in a chunk of records; matches are discarded as soon as they
+    are counted.
+
+    Parameters
+    ----------
+    records : List[GroupedRecord]
+        (group values, text) records
+    group_fields : Tuple[str, ...], optional
+        Names of the group values, by default ()
+    prefilter : bool, optional
+        Skip parsing documents without candidate words, by default False
+
+    Returns
+    -------
+    LemmaCounts
+        Partial counts of the chunk
+    """
+    counts = LemmaCounts(group_fields)
+    results = detector.find_ableist_language_batch(
+        (text for _, text in records),
+        batch_size=max(len(records), 1),
+        prefilter=prefilter,
+    )
+    for (group, _), matches in zip(records, results):
+        counts.add_document(group, matches)
+    return counts
+
+
+def aggregate_records(
+    records: Iterable[GroupedRecord],
+    group_fields: Tuple[str, ...] = (),
+    batch_size: int = 64,
+    workers: int = 0,
+    prefilter: bool = False,
+) -> LemmaCounts:
+    """Count matches in a stream of records. Each chunk of `batch_size` records is
+    reduced to partial counts in a worker and the partial counts are merged as they
+    arrive, so only counts, never matches, are sent between processes or kept.
+
+    Parameters
+    ----------
+    records : Iterable[GroupedRecord]
+        (group values, text) records, e.g. from `read_grouped_records`
+    group_fields : Tuple[str, ...], optional
+        Names of the group values, by default ()
+    batch_size : int, optional
+        Number of documents per chunk, by default 64
+    workers : int, optional
+        Number of worker processes; 0 processes chunks in this process, by default 0
+    prefilter : bool, optional
+        Skip parsing documents without candidate words, by default False
+
+    Returns
+    -------
+    LemmaCounts
+        Counts of the whole stream
+    """
+    counts = LemmaCounts(tuple(group_fields))
+    for chunk_counts in map_chunks(
+        partial(count_records, group_fields=tuple(group_fields), prefilter=prefilter),
+        chunked(records, batch_size),
+        workers=workers,
+        ordered=False,
+    ):
+        counts.merge(chunk_counts)
+    return counts
+
+
+def write_counts(counts: LemmaCounts, output_path: str) -> None:
+    """Write counts to a CSV file, or to a Parquet file if the path ends with
+    ".parquet" (requires pyarrow or fastparquet).
+    """
+    counts_df = counts.to_dataframe()
+    if output_path.endswith(".parquet"):
+        counts_df.to_parquet(output_path, index=False)
+    else:
+        counts_df.to_csv(output_path, index=False)
+
+
+@click.command()
+@click.option(
+    "--output_path",
+    "-o",
+    type=str,
+    required=True,
+    help="Path to the output CSV file, or Parquet file if it ends with .parquet.",
+)
+@click.option(
+    "--group_by",
+    "-g",
+    type=str,
+    multiple=True,
+    help="Field to group counts by, e.g. employer; may be repeated.",
+)
+@click.option(
+    "--month_field",
+    type=str,
+    default=None,
+    help="Field with an ISO date to group counts by month.",
+)
+@click.option("--text_field", type=str, default="text", show_default=True)
+@click.option("--batch_size", "-b", type=int, default=64, show_default=True)
+@click.option("--workers", "-w", type=int, default=0, show_default=True)
+@click.option(
+    "--prefilter",
+    is_flag=True,
+    help="Skip parsing documents without any form of a lexicon verb.",
+)
+def main(
+    output_path, group_by, month_field, text_field, batch_size, workers, prefilter
+):
+    """Read job descriptions as JSON lines from stdin and write counts of ableist
+    language per group and lexicon verb.
+    """
+    group_fields = tuple(group_by)
+    if month_field is not None:
+        group_fields += (MONTH_COLUMN,)
+    records = read_grouped_records(sys.stdin, group_by, text_field, month_field)
+    counts = aggregate_records(
+        records,
+        group_fields=group_fields,
+        batch_size=batch_size,
+        workers=workers,
+        prefilter=prefilter,
+    )
+    write_counts(counts, output_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Command line tool to validate the wordlist csv and build a precompiled wordlist
+artifact from it.
+
+The artifact holds the parsed entries, their fingerprint and the matcher patterns,
+serialized with msgpack, so processes that load it skip parsing the csv, converting
+its fields and building the patterns. The artifact of the packaged csv is loaded by
+default while it is up to date; load other artifacts with
+`ableist_word_list.set_default_wordlist(artifact_path)`.
+"""
+
+import os
+import sys
+from csv import DictReader
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+import click
+import spacy
+import srsly
+
+from ableist_language_detector import detector, spacy_models
+from ableist_language_detector.ableist_word_list import (
+    WORDLIST_ARTIFACT_PATH,
+    WORDLIST_ARTIFACT_VERSION,
+    WORDLIST_CSV_PATH,
+    AbleistLanguage,
+    get_file_hash,
+    get_wordlist_fingerprint,
+    load_wordlist_artifact,
+)
+
+DEFAULT_ARTIFACT_PATH = WORDLIST_ARTIFACT_PATH
+
+
+def check_lemma_forms(
+    ableist_verbs: Dict[str, AbleistLanguage], nlp: spacy.language.Language
+) -> List[str]:
+    """Return a problem for each verb or object that is not in lemma form, judged by
+    the pipeline's lemmatizer in a short sentence. Matching is done on lemmas, so an
+    inflected entry would never match.
+
+    Parameters
+    ----------
+    ableist_verbs : Dict[str, AbleistLanguage]
+        Collection of ableist verbs to check
+    nlp : spacy.language.Language
+        Pipeline with a tagger and lemmatizer
+
+    Returns
+    -------
+    List[str]
+        Descriptions of the entries that are not in lemma form
+    """
+    problems = []
+    for verb, verb_data in ableist_verbs.items():
+        # The first word of a phrase is the verb; "You must" makes it tagged as one
+        verb_token = nlp(f"You must {verb} it.")[2]
+        if verb_token.lemma_.lower() != verb_token.lower_:
+            problems.append(
+                f"verb '{verb}' is not in lemma form (lemma: {verb_token.lemma_})"
+            )
+        for obj in verb_data.objects or []:
+            object_token = nlp(f"Use the {obj}.")[2]
+            if object_token.lemma_.lower() != object_token.lower_:
+                problems.append(
+                    f"object '{obj}' of verb '{verb}' is not in lemma form "
+                    f"(lemma: {object_token.lemma_})"
+                )
+    return problems
+
+
+def validate_wordlist(
+    wordlist_csv_path: str = WORDLIST_CSV_PATH,
+    nlp: Optional[spacy.language.Language] = None,
+) -> Dict[str, AbleistLanguage]:
+    """Parse a wordlist csv and check every entry, reporting all problems at once.
+
+    Besides the conversions of `AbleistLanguage`, entries must be unique, lowercase
+    and without surrounding whitespace, object dependent verbs must list objects,
+    and verbs and objects must be in lemma form if a pipeline is given.
+
+    Parameters
+    ----------
+    wordlist_csv_path : str, optional
+        Path to the wordlist csv, by default the csv packaged with this module
+    nlp : Optional[spacy.language.Language], optional
+        Pipeline used to check that entries are in lemma form, by default None (no
+        lemma check)
+
+    Returns
+    -------
+    Dict[str, AbleistLanguage]
+        Collection of ableist verbs, as returned by `load_ableist_verbs`
+
+    Raises
+    ------
+    ValueError
+        If any entry is invalid, listing every problem with its csv line number
+    """
+    ableist_verbs = {}
+    problems = []
+    with open(wordlist_csv_path, "r") as wordlist_csv:
+        reader = DictReader(wordlist_csv)
+        for row in reader:
+            line = f"line {reader.line_num}"
+            try:
+                row_data = AbleistLanguage(**row)
+            except (TypeError, ValueError) as error:
+                problems.append(f"{line}: {error}")
+                continue
+            verb = row_data.verb
+            if verb != verb.strip().lower() or verb == "":
+                problems.append(f"{line}: verb '{verb}' must be lowercase and trimmed")
+            if verb in ableist_verbs:
+                problems.append(f"{line}: duplicate verb '{verb}'")
+            if row_data.object_dependent and not row_data.objects:
+                problems.append(
+                    f"{line}: verb '{verb}' is object dependent but lists no objects"
+                )
+            ableist_verbs[verb] = row_data
+
+    if nlp is not None:
+        problems.extend(check_lemma_forms(ableist_verbs, nlp))
+    if problems:
+        raise ValueError(
+            f"Invalid wordlist {wordlist_csv_path}:\n" + "\n".join(problems)
+        )
+    return ableist_verbs
+
+
+def build_wordlist_artifact(
+    wordlist_csv_path: str = WORDLIST_CSV_PATH,
+    artifact_path: str = DEFAULT_ARTIFACT_PATH,
+    check_lemmas: bool = True,
+) -> str:
+    """Validate a wordlist csv and write it, with its matcher patterns, to a
+    precompiled artifact.
+
+    Parameters
+    ----------
+    wordlist_csv_path : str, optional
+        Path to the wordlist csv, by default the csv packaged with this module
+    artifact_path : str, optional
+        Path to write the artifact to, by default next to the packaged csv
+    check_lemmas : bool, optional
+        Whether to check that entries are in lemma form with the default pipeline, by
+        default True
+
+    Returns
+    -------
+    str
+        Fingerprint of the wordlist, as returned by `get_wordlist_fingerprint`
+    """
+    nlp = spacy_models.get_nlp()
+    ableist_verbs = validate_wordlist(wordlist_csv_path, nlp if check_lemmas else None)
+    fingerprint = get_wordlist_fingerprint(ableist_verbs)
+    compiled = detector.compile_wordlist(ableist_verbs, nlp.vocab, fingerprint)
+    data = {
+        "version": WORDLIST_ARTIFACT_VERSION,
+        "fingerprint": fingerprint,
+        "source_hash": get_file_hash(wordlist_csv_path),
+        "entries": [asdict(verb_data) for verb_data in ableist_verbs.values()],
+        "patterns": compiled.patterns,
+    }
+    tmp_path = f"{artifact_path}.tmp"
+    srsly.write_msgpack(tmp_path, data)
+    os.replace(tmp_path, artifact_path)
+    return fingerprint
+
+
+def is_artifact_current(
+    artifact_path: str = DEFAULT_ARTIFACT_PATH,
+    wordlist_csv_path: str = WORDLIST_CSV_PATH,
+) -> bool:
+    """Return whether an artifact exists, has the current artifact version and was
+    built from the current contents of the wordlist csv.
+    """
+    if not os.path.exists(artifact_path):
+        return False
+    try:
+        artifact = load_wordlist_artifact(artifact_path)
+    except ValueError:
+        return False
+    return artifact.source_hash == get_file_hash(wordlist_csv_path)
+
+
+@click.command()
+@click.option(
+    "--wordlist_csv",
+    "-i",
+    type=str,
+    default=WORDLIST_CSV_PATH,
+    show_default=True,
+    help="Wordlist csv to validate and compile.",
+)
+@click.option(
+    "--output_path",
+    "-o",
+    type=str,
+    default=DEFAULT_ARTIFACT_PATH,
+    show_default=True,
+    help="Path to write the artifact to.",
+)
+@click.option(
+    "--skip_lemma_check",
+    is_flag=True,
+    help="Do not check that verbs and objects are in lemma form.",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Only check that the artifact is up to date; exit with status 1 if not.",
+)
+def main(wordlist_csv, output_path, skip_lemma_check, check):
+    """Validate the wordlist csv and build the precompiled wordlist artifact."""
+    if check:
+        if not is_artifact_current(output_path, wordlist_csv):
+            print(f"{output_path} is missing or out of date with {wordlist_csv}")
+            sys.exit(1)
+        print(f"{output_path} is up to date")
+        return
+    fingerprint = build_wordlist_artifact(
+        wordlist_csv, output_path, check_lemmas=not skip_lemma_check
+    )
+    print(f"Wrote {output_path} (fingerprint {fingerprint})")
+
+
+if __name__ == "__main__":
+    main()
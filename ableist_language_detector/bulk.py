@@ -0,0 +1,333 @@
+"""Command line tool to run the detector over a large JSON lines file in resumable
+shards.
+
+The input is split into shards of consecutive documents. Each shard is processed by
+one worker of a process pool and its results are written to a partial file that is
+renamed into place once the shard is complete. A manifest in the output directory
+records the completed shards, so a rerun after a crash skips them and continues
+partial shards after their last written document.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Callable, List, Optional, Tuple
+
+import click
+
+from ableist_language_detector import detector
+from ableist_language_detector.pool import chunked
+from ableist_language_detector.stream import Record, map_chunks, read_records
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class ShardResult:
+    """Statistics of a processed shard. `documents` counts every document of the
+    shard, while `processed`, `tokens` and `seconds` only cover the documents
+    processed by the last run of the shard, which skips documents written by an
+    earlier, interrupted run.
+    """
+
+    index: int
+    documents: int
+    processed: int
+    tokens: int
+    seconds: float
+
+
+@dataclass
+class BulkProgress:
+    """Cumulative statistics of the documents processed by a bulk run."""
+
+    shards: int = 0
+    documents: int = 0
+    tokens: int = 0
+    seconds: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        """Documents processed per second of wall time."""
+        return self.documents / self.seconds if self.seconds else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Tokens processed per second of wall time."""
+        return self.tokens / self.seconds if self.seconds else 0.0
+
+
+def shard_path(output_dir: str, index: int) -> str:
+    """Return the path of the results file of a shard."""
+    return os.path.join(output_dir, f"shard-{index:05d}.jsonl")
+
+
+def _write_json_atomic(path: str, data: dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as tmp_file:
+        json.dump(data, tmp_file, indent=2)
+        tmp_file.flush()
+        os.fsync(tmp_file.fileno())
+    os.replace(tmp_path, path)
+
+
+def _count_written_documents(partial_path: str) -> int:
+    """Count the complete result lines of a partial shard file, dropping a trailing
+    line that was cut off by a crash.
+    """
+    if not os.path.exists(partial_path):
+        return 0
+    with open(partial_path, "rb+") as partial_file:
+        content = partial_file.read()
+        complete_length = content.rfind(b"\n") + 1
+        if complete_length < len(content):
+            partial_file.truncate(complete_length)
+    return content.count(b"\n")
+
+
+def process_shard(
+    output_dir: str,
+    index: int,
+    records: List[Record],
+    id_field: str = "id",
+    batch_size: int = 64,
+) -> ShardResult:
+    """Find ableist language in the documents of a shard and write one JSON result per
+    line to the shard's results file. Documents without a surface form of a wordlist
+    verb are only tokenized, to count their tokens.
+
+    Results are appended to a partial file after every batch; documents already in
+    the partial file are skipped, and the partial file replaces the results file once
+    every document is written.
+
+    Parameters
+    ----------
+    output_dir : str
+        Output directory of the bulk run
+    index : int
+        Index of the shard
+    records : List[Record]
+        (id, text) records of the shard
+    id_field : str, optional
+        Name of the id field in the output, by default "id"
+    batch_size : int, optional
+        Number of documents processed together by spacy, by default 64
+
+    Returns
+    -------
+    ShardResult
+        Statistics of the shard
+    """
+    start_time = time.perf_counter()
+    path = shard_path(output_dir, index)
+    partial_path = f"{path}.partial"
+    n_written = _count_written_documents(partial_path)
+    tokens = 0
+    with open(partial_path, "a") as partial_file:
+        for batch in chunked(records[n_written:], batch_size):
+            segment_results = detector.analyze_segments(
+                (text for _, text in batch), batch_size=batch_size
+            )
+            for (record_id, _), segment_result in zip(batch, segment_results):
+                tokens += segment_result.n_tokens
+                matches = [match.to_dict() for match in segment_result.matches]
+                partial_file.write(
+                    json.dumps({id_field: record_id, "matches": matches}) + "\n"
+                )
+            partial_file.flush()
+            os.fsync(partial_file.fileno())
+    os.replace(partial_path, path)
+    return ShardResult(
+        index,
+        len(records),
+        len(records) - n_written,
+        tokens,
+        time.perf_counter() - start_time,
+    )
+
+
+def _process_indexed_shard(
+    indexed_shard: Tuple[int, List[Record]], **kwargs
+) -> ShardResult:
+    index, records = indexed_shard
+    return process_shard(index=index, records=records, **kwargs)
+
+
+class BulkJob:
+    """Resumable run of the detector over a JSON lines file.
+
+    Parameters
+    ----------
+    input_path : str
+        Path to a JSON lines file with one job description per line
+    output_dir : str
+        Directory for the shard results and the manifest
+    shard_size : int, optional
+        Number of documents per shard, by default 10000
+    id_field : str, optional
+        Name of the id field of the input and output, by default "id"
+    text_field : str, optional
+        Name of the text field of the input, by default "text"
+    """
+
+    def __init__(
+        self,
+        input_path: str,
+        output_dir: str,
+        shard_size: int = 10000,
+        id_field: str = "id",
+        text_field: str = "text",
+    ):
+        self.input_path = input_path
+        self.output_dir = output_dir
+        self.shard_size = shard_size
+        self.id_field = id_field
+        self.text_field = text_field
+        self.manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+        self.manifest = self._load_manifest()
+
+    def _job_parameters(self) -> dict:
+        input_stat = os.stat(self.input_path)
+        return {
+            "input_path": os.path.abspath(self.input_path),
+            "input_size": input_stat.st_size,
+            "input_mtime": input_stat.st_mtime,
+            "shard_size": self.shard_size,
+            "id_field": self.id_field,
+            "text_field": self.text_field,
+        }
+
+    def _load_manifest(self) -> dict:
+        parameters = self._job_parameters()
+        if not os.path.exists(self.manifest_path):
+            return {"job": parameters, "completed_shards": {}}
+        with open(self.manifest_path, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest["job"] != parameters:
+            raise ValueError(
+                f"{self.output_dir} holds results of a different job or of a changed "
+                "input file; use a new output directory."
+            )
+        return manifest
+
+    def is_completed(self, index: int) -> bool:
+        """Return whether the results of a shard are complete."""
+        return str(index) in self.manifest["completed_shards"]
+
+    def _mark_completed(self, shard_result: ShardResult) -> None:
+        self.manifest["completed_shards"][str(shard_result.index)] = asdict(
+            shard_result
+        )
+        _write_json_atomic(self.manifest_path, self.manifest)
+
+    def run(
+        self,
+        workers: int = 1,
+        batch_size: int = 64,
+        progress_callback: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> BulkProgress:
+        """Process every shard that is not completed yet.
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of worker processes of a `pool.DetectorPool`, which share the
+            pipeline loaded in this process; 0 processes shards in this process, by
+            default 1
+        batch_size : int, optional
+            Number of documents processed together by spacy, by default 64
+        progress_callback : Optional[Callable[[BulkProgress], None]], optional
+            Called with the cumulative progress after every shard, by default None
+
+        Returns
+        -------
+        BulkProgress
+            Statistics of the documents processed by this run
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        _write_json_atomic(self.manifest_path, self.manifest)
+        progress = BulkProgress()
+        start_time = time.perf_counter()
+
+        def update_progress(shard_result: ShardResult) -> None:
+            self._mark_completed(shard_result)
+            progress.shards += 1
+            progress.documents += shard_result.processed
+            progress.tokens += shard_result.tokens
+            progress.seconds = time.perf_counter() - start_time
+            if progress_callback is not None:
+                progress_callback(progress)
+
+        with open(self.input_path, "r") as input_file:
+            records = read_records(input_file, "jsonl", self.id_field, self.text_field)
+            shards = (
+                (index, shard)
+                for index, shard in enumerate(chunked(records, self.shard_size))
+                if not self.is_completed(index)
+            )
+            run_shard = partial(
+                _process_indexed_shard,
+                output_dir=self.output_dir,
+                id_field=self.id_field,
+                batch_size=batch_size,
+            )
+            # Shards are independent, so each is recorded as soon as it is done
+            for shard_result in map_chunks(
+                run_shard, shards, workers=workers, ordered=False
+            ):
+                update_progress(shard_result)
+        return progress
+
+
+def log_progress(progress: BulkProgress) -> None:
+    """Log the cumulative progress and throughput of a bulk run."""
+    logger.info(
+        "%d shards, %d documents in %.1fs: %.1f documents/s, %.0f tokens/s",
+        progress.shards,
+        progress.documents,
+        progress.seconds,
+        progress.documents_per_second,
+        progress.tokens_per_second,
+    )
+
+
+@click.command()
+@click.option(
+    "--input_path",
+    "-i",
+    type=str,
+    required=True,
+    help="Path to a JSON lines file with one job description per line.",
+)
+@click.option(
+    "--output_dir",
+    "-o",
+    type=str,
+    required=True,
+    help="Directory for the shard results and the manifest.",
+)
+@click.option("--shard_size", type=int, default=10000, show_default=True)
+@click.option("--id_field", type=str, default="id", show_default=True)
+@click.option("--text_field", type=str, default="text", show_default=True)
+@click.option("--workers", "-w", type=int, default=1, show_default=True)
+@click.option("--batch_size", "-b", type=int, default=64, show_default=True)
+def main(input_path, output_dir, shard_size, id_field, text_field, workers, batch_size):
+    """Find ableist language in every job description of a JSON lines file. Rerun
+    with the same arguments to resume an interrupted run.
+    """
+    logging.basicConfig(level=logging.INFO)
+    job = BulkJob(input_path, output_dir, shard_size, id_field, text_field)
+    progress = job.run(
+        workers=workers, batch_size=batch_size, progress_callback=log_progress
+    )
+    logger.info("Done.")
+    log_progress(progress)
+
+
+if __name__ == "__main__":
+    main()
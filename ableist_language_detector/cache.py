@@ -0,0 +1,186 @@
+"""Module to cache detector results for text that has already been analyzed."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import replace
+from typing import Callable, List, Optional
+
+from ableist_language_detector import detector
+from ableist_language_detector.ableist_word_list import (
+    get_ableist_verbs,
+    get_ableist_verbs_fingerprint,
+)
+from ableist_language_detector.lru import CacheStats, LRUCache
+from ableist_language_detector.spacy_models import get_model_fingerprint, get_nlp
+
+
+class SQLiteResultStore:
+    """Persistent key-value store for serialized detector results."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stats = CacheStats()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, matches TEXT)"
+        )
+        self._connection.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[List[dict]]:
+        """Return the stored matches, or None on a miss."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT matches FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, matches: List[dict]) -> None:
+        """Store matches serialized with `AbleistLanguageMatch.to_dict`."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, matches) VALUES (?, ?)",
+                (key, json.dumps(matches)),
+            )
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def _copy_matches(
+    matches: List[detector.AbleistLanguageMatch],
+) -> List[detector.AbleistLanguageMatch]:
+    return [replace(match) for match in matches]
+
+
+class ResultCache:
+    """Cache of detector results keyed by a hash of the document text, the wordlist
+    fingerprint, the spaCy pipeline fingerprint and the detection mode, so entries are
+    never reused after the wordlist or the pipeline changes.
+
+    Results are looked up in an in-memory LRU first and then, if a path is given, in
+    a SQLite database that persists across processes and restarts. The text is hashed
+    exactly as given; match offsets depend on every character, so two texts that
+    differ only in whitespace are cached separately.
+    """
+
+    def __init__(self, max_entries: int = 10000, path: Optional[str] = None):
+        self.memory = LRUCache(max_entries)
+        self.disk = SQLiteResultStore(path) if path is not None else None
+
+    @property
+    def version(self) -> str:
+        """Combined wordlist and pipeline fingerprint included in every key."""
+        return f"{get_ableist_verbs_fingerprint()}|{get_model_fingerprint(get_nlp())}"
+
+    def key(self, text: str, mode: str = "full") -> str:
+        """Return the cache key of a document."""
+        digest = hashlib.sha256()
+        digest.update(f"{self.version}|{mode}\0".encode("utf-8"))
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_or_compute(
+        self,
+        text: str,
+        compute: Callable[[str], List[detector.AbleistLanguageMatch]],
+        mode: str = "full",
+    ) -> List[detector.AbleistLanguageMatch]:
+        """Return the cached result for a document, computing and caching it on a
+        miss. The matches returned are copies, so callers can modify them without
+        changing the cached result.
+
+        Parameters
+        ----------
+        text : str
+            Job description text
+        compute : Callable[[str], List[detector.AbleistLanguageMatch]]
+            Function that computes the result on a miss
+        mode : str, optional
+            Detection mode the result is computed with, by default "full"
+
+        Returns
+        -------
+        List[detector.AbleistLanguageMatch]
+            Matches for the document
+        """
+        key = self.key(text, mode)
+        result = self.memory.get(key)
+        if result is not None:
+            return _copy_matches(result)
+
+        if self.disk is not None:
+            stored = self.disk.get(key)
+            if stored is not None:
+                ableist_verbs = get_ableist_verbs()
+                result = [
+                    detector.AbleistLanguageMatch.from_dict(match, ableist_verbs)
+                    for match in stored
+                ]
+                self.memory.put(key, result)
+                return _copy_matches(result)
+
+        result = compute(text)
+        self.memory.put(key, result)
+        if self.disk is not None:
+            self.disk.put(key, [match.to_dict() for match in result])
+        return _copy_matches(result)
+
+    @property
+    def stats(self) -> dict:
+        """Hit and miss statistics of each tier."""
+        stats = {"memory": self.memory.stats}
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats
+        return stats
+
+
+_default_cache: Optional[ResultCache] = None
+
+
+def get_default_cache() -> ResultCache:
+    """Return the process-wide in-memory result cache used by
+    `find_ableist_language_cached` when no cache is passed.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
+
+
+def find_ableist_language_cached(
+    job_description_text: str,
+    cache: Optional[ResultCache] = None,
+    mode: str = "full",
+) -> List[detector.AbleistLanguageMatch]:
+    """Cached version of `detector.find_ableist_language`.
+
+    Parameters
+    ----------
+    job_description_text : str
+        Job description text
+    cache : Optional[ResultCache], optional
+        Cache to use, by default None (the process-wide in-memory cache)
+    mode : str, optional
+        Detection mode, see `detector.find_ableist_language`, by default "full"
+
+    Returns
+    -------
+    List[detector.AbleistLanguageMatch]
+        List of matched ableist language
+    """
+    if cache is None:
+        cache = get_default_cache()
+    return cache.get_or_compute(
+        job_description_text,
+        lambda text: detector.find_ableist_language(text, mode=mode),
+        mode=mode,
+    )
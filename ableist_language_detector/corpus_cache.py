@@ -0,0 +1,138 @@
+"""Module to keep parsed corpora on disk, so term extraction can be rerun without
+parsing the same descriptions again.
+
+Each corpus is stored as a spaCy `DocBin` next to a small manifest with the
+fingerprint of the pipeline that parsed it and a hash of each document's text. A
+corpus with the same texts is loaded as is; a changed corpus reuses the docs whose
+text is unchanged and only parses the new or edited ones.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import spacy
+from spacy.tokens import DocBin
+
+from ableist_language_detector.spacy_models import get_model_fingerprint, get_nlp
+
+
+@dataclass
+class CorpusCacheStats:
+    """Number of documents loaded from the cache and parsed by the last lookup."""
+
+    loaded: int = 0
+    parsed: int = 0
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ParsedCorpusCache:
+    """On-disk cache of parsed corpora, one `DocBin` per corpus name.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory to keep the cached corpora in; created if it does not exist
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.stats = CorpusCacheStats()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, name: str) -> Tuple[str, str]:
+        base_path = os.path.join(self.cache_dir, name)
+        return f"{base_path}.spacy", f"{base_path}.json"
+
+    def _load(
+        self, name: str, nlp: spacy.language.Language
+    ) -> Optional[Tuple[dict, List[spacy.tokens.Doc]]]:
+        docbin_path, manifest_path = self._paths(name)
+        if not (os.path.exists(docbin_path) and os.path.exists(manifest_path)):
+            return None
+        with open(manifest_path, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest["model"] != get_model_fingerprint(nlp):
+            return None
+        docs = list(DocBin().from_disk(docbin_path).get_docs(nlp.vocab))
+        if len(docs) != len(manifest["text_hashes"]):
+            return None
+        return manifest, docs
+
+    def _save(
+        self,
+        name: str,
+        nlp: spacy.language.Language,
+        text_hashes: List[str],
+        docs: List[spacy.tokens.Doc],
+    ) -> None:
+        docbin_path, manifest_path = self._paths(name)
+        # Write the docs before the manifest that vouches for them
+        DocBin(docs=docs).to_disk(f"{docbin_path}.tmp")
+        os.replace(f"{docbin_path}.tmp", docbin_path)
+        with open(f"{manifest_path}.tmp", "w") as manifest_file:
+            json.dump(
+                {
+                    "model": get_model_fingerprint(nlp),
+                    "text_hashes": text_hashes,
+                },
+                manifest_file,
+            )
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    def get_docs(
+        self,
+        name: str,
+        corpus: Sequence[str],
+        batch_size: int = 64,
+        n_process: int = 1,
+    ) -> List[spacy.tokens.Doc]:
+        """Return the parsed docs of a corpus, parsing only the documents that are
+        not cached yet, and update the cache.
+
+        Parameters
+        ----------
+        name : str
+            Name of the corpus, e.g. "abilities"; each name is cached separately
+        corpus : Sequence[str]
+            Document texts
+        batch_size : int, optional
+            Number of documents parsed together by spacy, by default 64
+        n_process : int, optional
+            Number of processes spacy uses to parse the documents, by default 1
+
+        Returns
+        -------
+        List[spacy.tokens.Doc]
+            Parsed docs, in corpus order
+        """
+        nlp = get_nlp()
+        cached = self._load(name, nlp)
+        text_hashes = [_text_hash(text) for text in corpus]
+        if cached is not None and cached[0]["text_hashes"] == text_hashes:
+            self.stats = CorpusCacheStats(loaded=len(cached[1]))
+            return cached[1]
+
+        cached_docs = {}
+        if cached is not None:
+            cached_docs = dict(zip(cached[0]["text_hashes"], cached[1]))
+        unseen = [
+            i for i, text_hash in enumerate(text_hashes) if text_hash not in cached_docs
+        ]
+        docs = [cached_docs.get(text_hash) for text_hash in text_hashes]
+        parsed_docs = nlp.pipe(
+            (corpus[i] for i in unseen), batch_size=batch_size, n_process=n_process
+        )
+        for i, doc in zip(unseen, parsed_docs):
+            docs[i] = doc
+
+        self.stats = CorpusCacheStats(
+            loaded=len(corpus) - len(unseen), parsed=len(unseen)
+        )
+        self._save(name, nlp, text_hashes, docs)
+        return docs
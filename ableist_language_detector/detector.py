@@ -1,14 +1,42 @@
 """Main module for identifying ableist language in job descriptions."""
 
-from dataclasses import dataclass
-from typing import List, Union, Dict, Tuple
+import hashlib
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import click
 import spacy
 
-from ableist_language_detector.ableist_word_list import ABLEIST_VERBS, AbleistLanguage
+from ableist_language_detector.ableist_word_list import (
+    AbleistLanguage,
+    get_ableist_verbs,
+    get_ableist_verbs_fingerprint,
+    get_ableist_verbs_patterns,
+    get_wordlist_fingerprint,
+)
+from ableist_language_detector.lru import CacheStats, LRUCache
+from ableist_language_detector.prefilter import (
+    LexicalPrefilter,
+    PrefilterStats,
+    inflect_verb,
+)
+from ableist_language_detector.segmentation import (
+    apply_pipeline,
+    iter_windows,
+    select_spans,
+    span_to_doc,
+    split_sentences,
+)
+from ableist_language_detector.spacy_models import get_model_fingerprint, get_nlp
 
-nlp = spacy.load("en_core_web_sm")
+
+def __getattr__(name):
+    # Backwards compatible access to the pipeline, which is now loaded on first use
+    if name == "nlp":
+        return get_nlp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -20,10 +48,451 @@ class AbleistLanguageMatch:
     start: int
     end: int
     data: AbleistLanguage
+    start_char: Optional[int] = None
+    end_char: Optional[int] = None
 
     def __repr__(self):
         return self.text
 
+    def to_dict(self) -> dict:
+        """Return the match and its wordlist data as a JSON serializable dict."""
+        return {
+            "lemma": self.lemma,
+            "text": self.text,
+            "start": self.start,
+            "end": self.end,
+            "start_char": self.start_char,
+            "end_char": self.end_char,
+            "verb": self.data.verb,
+            "alternative_verbs": list(self.data.alternative_verbs),
+            "example": self.data.example,
+        }
+
+    @classmethod
+    def from_dict(
+        cls, match_data: dict, ableist_verbs: Dict[str, AbleistLanguage]
+    ) -> "AbleistLanguageMatch":
+        """Rebuild a match serialized with `to_dict`.
+
+        Parameters
+        ----------
+        match_data : dict
+            Output of `to_dict`
+        ableist_verbs : Dict[str, AbleistLanguage]
+            Wordlist the match was found with, used to restore its data
+
+        Returns
+        -------
+        AbleistLanguageMatch
+            Match with the same positions and wordlist data
+        """
+        return cls(
+            text=match_data["text"],
+            lemma=match_data["lemma"],
+            start=match_data["start"],
+            end=match_data["end"],
+            start_char=match_data["start_char"],
+            end_char=match_data["end_char"],
+            data=ableist_verbs[match_data["verb"]],
+        )
+
+
+def _shift_match(
+    match: AbleistLanguageMatch, token_offset: int, char_offset: int
+) -> AbleistLanguageMatch:
+    """Return a copy of a match found in a segment, moved to document positions."""
+    return replace(
+        match,
+        start=match.start + token_offset,
+        end=match.end + token_offset,
+        start_char=match.start_char + char_offset,
+        end_char=match.end_char + char_offset,
+    )
+
+
+# Dependency labels of verbs that are not matched, e.g. "can" in "can lift"
+EXCLUDED_VERB_DEPS = ("aux", "auxpass", "neg")
+
+
+def build_verb_patterns(
+    ableist_verbs: Dict[str, AbleistLanguage], use_dependencies: bool = True
+) -> List[List[dict]]:
+    """Return the token patterns used to match any of the given ableist verbs.
+
+    Parameters
+    ----------
+    ableist_verbs : Dict[str, AbleistLanguage]
+        Collection of ableist verbs to search for, where the key is the string
+        representation of the verb and the value is the dataclass object containing
+        the verb's data
+    use_dependencies : bool, optional
+        If true, exclude auxiliary and negation dependencies, which requires a parsed
+        doc. If false, rely on the part of speech only, so the patterns work on docs
+        that were only tagged; by default True
+
+    Returns
+    -------
+    List[List[dict]]
+        Patterns in spacy Matcher format
+    """
+    token_pattern = {
+        "LEMMA": {"IN": list(ableist_verbs.keys())},
+        "POS": "VERB",
+    }
+    if use_dependencies:
+        token_pattern["DEP"] = {"NOT_IN": list(EXCLUDED_VERB_DEPS)}
+    return [[token_pattern]]
+
+
+def build_dependency_patterns(
+    ableist_verbs: Dict[str, AbleistLanguage],
+) -> List[List[dict]]:
+    """Return the dependency patterns used to match any of the given ableist verbs and
+    their grammatical objects.
+
+    Parameters
+    ----------
+    ableist_verbs : Dict[str, AbleistLanguage]
+        Collection of object dependent ableist verbs to search for, where the key is
+        the string representation of the verb and the value is the dataclass object
+        containing the verb's data
+
+    Returns
+    -------
+    List[List[dict]]
+        Patterns in spacy DependencyMatcher format
+    """
+    dep_obj_pattern = []
+    for verb, verb_data in ableist_verbs.items():
+        # dependencymatcher docs: https://spacy.io/api/dependencymatcher
+        pattern = [
+            # pattern always starts with a "right_id" anchor, which is the verb
+            {"RIGHT_ID": f"anchor_{verb}", "RIGHT_ATTRS": {"LEMMA": verb}},
+            # match direct objects of the verb
+            {
+                "LEFT_ID": f"anchor_{verb}",
+                "REL_OP": ">",  # looks for the head relationship
+                "RIGHT_ID": f"{verb}_object",
+                "RIGHT_ATTRS": {"DEP": "dobj", "LEMMA": {"IN": verb_data.objects}},
+            },
+        ]
+        dep_obj_pattern.append(pattern)
+    return dep_obj_pattern
+
+
+def is_phrase(verb: str) -> bool:
+    """Return whether a wordlist entry is a multi-word phrase, e.g. "stand for long
+    periods", rather than a single verb.
+    """
+    return len(verb.split()) > 1
+
+
+def build_phrase_patterns(
+    ableist_verbs: Dict[str, AbleistLanguage],
+) -> Dict[str, List[List[str]]]:
+    """Return the word sequences used to match multi-word wordlist entries: the
+    phrase with each surface form of its first word, e.g. "stands for long periods".
+
+    Parameters
+    ----------
+    ableist_verbs : Dict[str, AbleistLanguage]
+        Collection of ableist verbs; single word entries are ignored
+
+    Returns
+    -------
+    Dict[str, List[List[str]]]
+        Lowercase word sequences for each multi-word entry, in spacy PhraseMatcher
+        format once converted to docs
+    """
+    return {
+        verb: [
+            [surface_form] + verb.lower().split()[1:]
+            for surface_form in sorted(inflect_verb(verb))
+        ]
+        for verb in ableist_verbs
+        if is_phrase(verb)
+    }
+
+
+# Compiled matchers keyed by wordlist fingerprint, so each wordlist is only compiled
+# once per process no matter how many documents are processed. A matcher built with
+# another vocab, e.g. of a pipeline loaded earlier, is replaced rather than reused, so
+# it never matches against the wrong StringStore or keeps the old vocab alive.
+_VERB_MATCHER_CACHE: Dict[Tuple[str, bool], spacy.matcher.Matcher] = {}
+_DEPENDENCY_MATCHER_CACHE: Dict[str, spacy.matcher.DependencyMatcher] = {}
+
+
+def get_verb_matcher(
+    ableist_verbs: Dict[str, AbleistLanguage],
+    vocab: spacy.vocab.Vocab,
+    fingerprint: Optional[str] = None,
+    use_dependencies: bool = True,
+    patterns: Optional[List[List[dict]]] = None,
+) -> spacy.matcher.Matcher:
+    """Return the compiled verb matcher for a collection of ableist verbs, building it
+    on first use.
+
+    Parameters
+    ----------
+    ableist_verbs : Dict[str, AbleistLanguage]
+        Collection of ableist verbs to search for
+    vocab : spacy.vocab.Vocab
+        Vocab used to build the matcher if it is not cached yet
+    fingerprint : Optional[str], optional
+        Precomputed fingerprint of ableist_verbs, by default None (computed here)
+    use_dependencies : bool, optional
+        See `build_verb_patterns`, by default True
+    patterns : Optional[List[List[dict]]], optional
+        Precomputed patterns, e.g. restored from a saved model, by default None
+        (built with `build_verb_patterns`)
+
+    Returns
+    -------
+    spacy.matcher.Matcher
+        Compiled matcher
+    """
+    if fingerprint is None:
+        fingerprint = get_wordlist_fingerprint(ableist_verbs)
+    key = (fingerprint, use_dependencies)
+    matcher = _VERB_MATCHER_CACHE.get(key)
+    if matcher is None or matcher.vocab is not vocab:
+        if patterns is None:
+            patterns = build_verb_patterns(
+                ableist_verbs, use_dependencies=use_dependencies
+            )
+        matcher = spacy.matcher.Matcher(vocab)
+        matcher.add("verb_rule", patterns)
+        _VERB_MATCHER_CACHE[key] = matcher
+    return matcher
+
+
+def get_dependency_matcher(
+    ableist_verbs: Dict[str, AbleistLanguage],
+    vocab: spacy.vocab.Vocab,
+    fingerprint: Optional[str] = None,
+    patterns: Optional[List[List[dict]]] = None,
+) -> spacy.matcher.DependencyMatcher:
+    """Return the compiled dependency matcher for a collection of object dependent
+    ableist verbs, building it on first use.
+
+    Parameters
+    ----------
+    ableist_verbs : Dict[str, AbleistLanguage]
+        Collection of object dependent ableist verbs to search for
+    vocab : spacy.vocab.Vocab
+        Vocab used to build the matcher if it is not cached yet
+    fingerprint : Optional[str], optional
+        Precomputed fingerprint of ableist_verbs, by default None (computed here)
+    patterns : Optional[List[List[dict]]], optional
+        Precomputed patterns, e.g. restored from a saved model, by default None
+        (built with `build_dependency_patterns`)
+
+    Returns
+    -------
+    spacy.matcher.DependencyMatcher
+        Compiled dependency matcher
+    """
+    if fingerprint is None:
+        fingerprint = get_wordlist_fingerprint(ableist_verbs)
+    matcher = _DEPENDENCY_MATCHER_CACHE.get(fingerprint)
+    if matcher is None or matcher.vocab is not vocab:
+        if patterns is None:
+            patterns = build_dependency_patterns(ableist_verbs)
+        matcher = spacy.matcher.DependencyMatcher(vocab)
+        matcher.add("dep_verb_rule", patterns)
+        _DEPENDENCY_MATCHER_CACHE[fingerprint] = matcher
+    return matcher
+
+
+class CompiledWordlist:
+    """Wordlist split by object dependency, along with its compiled matchers. Build it
+    with `compile_wordlist` so it is only created once per wordlist.
+    """
+
+    def __init__(
+        self,
+        ableist_verbs: Dict[str, AbleistLanguage],
+        vocab: spacy.vocab.Vocab,
+        fingerprint: str,
+        patterns: Optional[Dict[str, List[List[dict]]]] = None,
+    ):
+        self.ableist_verbs = ableist_verbs
+        self.vocab = vocab
+        self.fingerprint = fingerprint
+        self.non_object_dependent = {
+            verb: verb_data
+            for verb, verb_data in ableist_verbs.items()
+            if not verb_data.object_dependent
+        }
+        self.object_dependent = {
+            verb: verb_data
+            for verb, verb_data in ableist_verbs.items()
+            if verb_data.object_dependent
+        }
+        self.single_verbs = {
+            verb: verb_data
+            for verb, verb_data in self.non_object_dependent.items()
+            if not is_phrase(verb)
+        }
+        self.phrases = {
+            verb: verb_data
+            for verb, verb_data in self.non_object_dependent.items()
+            if is_phrase(verb)
+        }
+        if patterns is None:
+            patterns = {
+                "verb": build_verb_patterns(self.single_verbs),
+                # Approximates the verb patterns on docs that were tagged but not
+                # parsed
+                "tagged_verb": build_verb_patterns(
+                    self.single_verbs, use_dependencies=False
+                ),
+                "dependency": build_dependency_patterns(self.object_dependent),
+            }
+        if "phrase" not in patterns:
+            # Patterns saved before phrase entries were supported
+            patterns = dict(patterns, phrase=build_phrase_patterns(self.phrases))
+        self.patterns = patterns
+
+        self.verb_matcher = get_verb_matcher(
+            self.single_verbs, vocab, patterns=patterns["verb"]
+        )
+        self.tagged_verb_matcher = get_verb_matcher(
+            self.single_verbs,
+            vocab,
+            use_dependencies=False,
+            patterns=patterns["tagged_verb"],
+        )
+        self.dependency_matcher = None
+        if len(self.object_dependent) > 0:
+            self.dependency_matcher = get_dependency_matcher(
+                self.object_dependent, vocab, patterns=patterns["dependency"]
+            )
+        self.phrase_matcher = None
+        self.phrase_index = {}
+        if len(patterns["phrase"]) > 0:
+            self.phrase_matcher = spacy.matcher.PhraseMatcher(vocab, attr="LOWER")
+            for verb, word_sequences in patterns["phrase"].items():
+                self.phrase_matcher.add(
+                    verb,
+                    [spacy.tokens.Doc(vocab, words=words) for words in word_sequences],
+                )
+                self.phrase_index[vocab.strings.add(verb)] = ableist_verbs[verb]
+
+        # Entries keyed by lemma hash for the "index" match engine; string hashes are
+        # the same in every vocab
+        self.lemma_index = {
+            vocab.strings.add(verb): verb_data
+            for verb, verb_data in self.single_verbs.items()
+        }
+        self.object_index = {
+            vocab.strings.add(verb): (
+                verb_data,
+                frozenset(vocab.strings.add(obj) for obj in verb_data.objects or ()),
+            )
+            for verb, verb_data in self.object_dependent.items()
+        }
+        self.prefilter = LexicalPrefilter(ableist_verbs)
+
+
+_COMPILED_WORDLIST_CACHE: Dict[str, CompiledWordlist] = {}
+
+
+def compile_wordlist(
+    ableist_verbs: Dict[str, AbleistLanguage],
+    vocab: spacy.vocab.Vocab,
+    fingerprint: Optional[str] = None,
+    patterns: Optional[Dict[str, List[List[dict]]]] = None,
+) -> CompiledWordlist:
+    """Return the compiled wordlist for a collection of ableist verbs, building it on
+    first use or when it was compiled with another vocab.
+
+    Parameters
+    ----------
+    ableist_verbs : Dict[str, AbleistLanguage]
+        Collection of ableist verbs to search for
+    vocab : spacy.vocab.Vocab
+        Vocab used to build the matchers if they are not cached yet
+    fingerprint : Optional[str], optional
+        Precomputed fingerprint of ableist_verbs, by default None (computed here)
+    patterns : Optional[Dict[str, List[List[dict]]]], optional
+        Precomputed `CompiledWordlist.patterns`, e.g. restored from a saved model, by
+        default None (built from ableist_verbs)
+
+    Returns
+    -------
+    CompiledWordlist
+        Wordlist with compiled matchers
+    """
+    if fingerprint is None:
+        fingerprint = get_wordlist_fingerprint(ableist_verbs)
+    compiled = _COMPILED_WORDLIST_CACHE.get(fingerprint)
+    if compiled is None:
+        compiled = CompiledWordlist(ableist_verbs, vocab, fingerprint, patterns)
+        _COMPILED_WORDLIST_CACHE[fingerprint] = compiled
+    elif compiled.vocab is not vocab:
+        previous = compiled
+        compiled = CompiledWordlist(
+            ableist_verbs, vocab, fingerprint, patterns or previous.patterns
+        )
+        compiled.prefilter.stats = previous.prefilter.stats
+        _COMPILED_WORDLIST_CACHE[fingerprint] = compiled
+    return compiled
+
+
+def _compile_default_wordlist(vocab: spacy.vocab.Vocab) -> CompiledWordlist:
+    return compile_wordlist(
+        get_ableist_verbs(),
+        vocab,
+        fingerprint=get_ableist_verbs_fingerprint(),
+        patterns=get_ableist_verbs_patterns(),
+    )
+
+
+def recompile_wordlists(vocab: spacy.vocab.Vocab) -> None:
+    """Rebuild every compiled wordlist and matcher with a new vocab, e.g. after the
+    pipeline was reloaded, so no matcher keeps the old vocab alive. Patterns and
+    prefilter statistics are carried over.
+
+    Parameters
+    ----------
+    vocab : spacy.vocab.Vocab
+        Vocab of the new pipeline
+    """
+    previous = list(_COMPILED_WORDLIST_CACHE.values())
+    _COMPILED_WORDLIST_CACHE.clear()
+    _VERB_MATCHER_CACHE.clear()
+    _DEPENDENCY_MATCHER_CACHE.clear()
+    for compiled in previous:
+        recompiled = compile_wordlist(
+            compiled.ableist_verbs, vocab, compiled.fingerprint, compiled.patterns
+        )
+        recompiled.prefilter.stats = compiled.prefilter.stats
+
+
+def _apply_verb_matcher(
+    matcher: spacy.matcher.Matcher, spacy_doc: spacy.tokens.Doc
+) -> List[spacy.tokens.Span]:
+    return [spacy_doc[start:end] for _, start, end in matcher(spacy_doc)]
+
+
+def _apply_dependency_matcher(
+    matcher: spacy.matcher.DependencyMatcher,
+    spacy_doc: spacy.tokens.Doc,
+    return_search_verbs: bool = False,
+) -> Union[List[spacy.tokens.Span], List[Tuple[spacy.tokens.Span, spacy.tokens.Span]]]:
+    # return the entire span from verb to object, which includes any interim modifiers
+    matches = matcher(spacy_doc)
+    if return_search_verbs:
+        return [
+            (spacy_doc[token_ids[0]], spacy_doc[min(token_ids) : max(token_ids) + 1])
+            for _, token_ids in matches
+        ]
+    else:
+        return [
+            spacy_doc[min(token_ids) : max(token_ids) + 1] for _, token_ids in matches
+        ]
+
 
 def match_ableist_verbs(
     spacy_doc: spacy.tokens.Doc,
@@ -47,21 +516,8 @@ def match_ableist_verbs(
     List[spacy.tokens.Span]
         Matched spans
     """
-    matcher = spacy.matcher.Matcher(nlp.vocab)
-    matcher.add(
-        "verb_rule",
-        [
-            [
-                {
-                    "LEMMA": {"IN": list(ableist_verbs.keys())},
-                    "POS": "VERB",
-                    "DEP": {"NOT_IN": ["aux", "auxpass", "neg"]},
-                },
-            ]
-        ],
-    )
-    verb_matches = [spacy_doc[start:end] for _, start, end in matcher(spacy_doc)]
-    return verb_matches
+    matcher = get_verb_matcher(ableist_verbs, spacy_doc.vocab)
+    return _apply_verb_matcher(matcher, spacy_doc)
 
 
 def match_dependent_ableist_verbs(
@@ -91,38 +547,156 @@ def match_dependent_ableist_verbs(
     Union[List[spacy.tokens.Span], List[Tuple[spacy.tokens.Span, spacy.tokens.Span]]]
         Matched spans or tuple containing the search term and matched spans
     """
-    matcher = spacy.matcher.DependencyMatcher(nlp.vocab)
-    dep_obj_pattern = []
-    for verb, verb_data in ableist_verbs.items():
-        # dependencymatcher docs: https://spacy.io/api/dependencymatcher
-        pattern = [
-            # pattern always starts with a "right_id" anchor, which is the verb
-            {"RIGHT_ID": f"anchor_{verb}", "RIGHT_ATTRS": {"LEMMA": verb}},
-            # match direct objects of the verb
-            {
-                "LEFT_ID": f"anchor_{verb}",
-                "REL_OP": ">",  # looks for the head relationship
-                "RIGHT_ID": f"{verb}_object",
-                "RIGHT_ATTRS": {"DEP": "dobj", "LEMMA": {"IN": verb_data.objects}},
-            },
-        ]
-        dep_obj_pattern.append(pattern)
-    matcher.add("dep_verb_rule", dep_obj_pattern)
-    # return the entire span from verb to object, which includes any interim modifiers
-    matches = matcher(spacy_doc)
-    if return_search_verbs:
-        return [
-            (spacy_doc[token_ids[0]], spacy_doc[min(token_ids) : max(token_ids) + 1])
-            for _, token_ids in matches
-        ]
+    matcher = get_dependency_matcher(ableist_verbs, spacy_doc.vocab)
+    return _apply_dependency_matcher(matcher, spacy_doc, return_search_verbs)
+
+
+MATCH_ENGINES = ("matcher", "index")
+_match_engine = "matcher"
+
+
+def set_match_engine(engine: str = "matcher") -> None:
+    """Set how `match_compiled_wordlist` finds single verbs and verb + object phrases.
+
+    Parameters
+    ----------
+    engine : str, optional
+        "matcher" to run spacy's Matcher and DependencyMatcher, or "index" to look up
+        each token's lemma in hash indexes of the wordlist, whose cost per token does
+        not grow with the number of object dependent entries; by default "matcher"
+    """
+    global _match_engine
+    if engine not in MATCH_ENGINES:
+        raise ValueError(f"Engine ({engine}) must be one of {MATCH_ENGINES}.")
+    _match_engine = engine
+
+
+def _span_match(
+    span: spacy.tokens.Span, verb_data: AbleistLanguage
+) -> AbleistLanguageMatch:
+    return AbleistLanguageMatch(
+        lemma=span.lemma_,
+        text=span.text,
+        start=span.start,
+        end=span.end,
+        start_char=span.start_char,
+        end_char=span.end_char,
+        data=verb_data,
+    )
+
+
+def _match_indexed(
+    spacy_doc: spacy.tokens.Doc, compiled: CompiledWordlist
+) -> List[AbleistLanguageMatch]:
+    """Find the matches of the verb and dependency matchers with one pass over the
+    tokens and hash lookups.
+    """
+    verb_matches = []
+    dependency_matches = []
+    for token in spacy_doc:
+        verb_data = compiled.lemma_index.get(token.lemma)
+        if (
+            verb_data is not None
+            and token.pos_ == "VERB"
+            and token.dep_ not in EXCLUDED_VERB_DEPS
+        ):
+            verb_matches.append(
+                _span_match(spacy_doc[token.i : token.i + 1], verb_data)
+            )
+
+        object_entry = compiled.object_index.get(token.lemma)
+        if object_entry is not None:
+            verb_data, objects = object_entry
+            for child in token.children:
+                if child.dep_ == "dobj" and child.lemma in objects:
+                    span = spacy_doc[min(token.i, child.i) : max(token.i, child.i) + 1]
+                    dependency_matches.append(_span_match(span, verb_data))
+    return verb_matches + dependency_matches
+
+
+def _match_phrases(
+    spacy_doc: spacy.tokens.Doc, compiled: CompiledWordlist
+) -> List[AbleistLanguageMatch]:
+    if compiled.phrase_matcher is None:
+        return []
+    return [
+        _span_match(spacy_doc[start:end], compiled.phrase_index[match_id])
+        for match_id, start, end in compiled.phrase_matcher(spacy_doc)
+    ]
+
+
+def match_compiled_wordlist(
+    spacy_doc: spacy.tokens.Doc,
+    compiled: CompiledWordlist,
+    engine: Optional[str] = None,
+) -> List[AbleistLanguageMatch]:
+    """Run the compiled matchers of a wordlist over a parsed document.
+
+    Parameters
+    ----------
+    spacy_doc : spacy.tokens.Doc
+        spacy doc, processed by the full pipeline
+    compiled : CompiledWordlist
+        Wordlist with compiled matchers
+    engine : Optional[str], optional
+        Match engine, see `set_match_engine`, by default None (the engine set with
+        `set_match_engine`)
+
+    Returns
+    -------
+    List[AbleistLanguageMatch]
+        List of matched ableist language in the form of AbleistLanguageMatch dataclass
+        instances
+    """
+    if engine is None:
+        engine = _match_engine
+    if engine not in MATCH_ENGINES:
+        raise ValueError(f"Engine ({engine}) must be one of {MATCH_ENGINES}.")
+
+    if engine == "index":
+        matched_results = _match_indexed(spacy_doc, compiled)
     else:
-        return [
-            spacy_doc[min(token_ids) : max(token_ids) + 1] for _, token_ids in matches
+        # Match verbs in ableist verb list
+        matched_results = [
+            _span_match(match, compiled.ableist_verbs[match.lemma_])
+            for match in _apply_verb_matcher(compiled.verb_matcher, spacy_doc)
         ]
 
+        # Match verbs that depend on objects, if present in the word list
+        # A little repetitive, but need to use the original search term to access
+        # the data in AbleistLanguage since these are phrases and not just exact
+        # matches
+        if compiled.dependency_matcher is not None:
+            matched_results.extend(
+                _span_match(match, compiled.ableist_verbs[search_verb.lemma_])
+                for search_verb, match in _apply_dependency_matcher(
+                    compiled.dependency_matcher, spacy_doc, return_search_verbs=True
+                )
+            )
+
+    # Match multi-word entries
+    matched_results.extend(_match_phrases(spacy_doc, compiled))
+    return matched_results
+
+
+# Short text that exercises both the verb and the verb + object matchers
+WARMUP_TEXT = "Must be able to move your hands repeatedly and lift heavy boxes."
+
+FIND_MODES = ("full", "sentences", "two_tier", "windowed", "segment_cache")
+# Pipeline components that are skipped by the first tier of "two_tier" mode
+PARSER_COMPONENTS = ("parser",)
+# Window core length and context on each side in "windowed" mode
+WINDOW_CHARS = 100000
+WINDOW_OVERLAP_CHARS = 2000
+# Number of sentence results kept by "segment_cache" mode
+SEGMENT_CACHE_ENTRIES = 100000
+_segment_cache: LRUCache[List[AbleistLanguageMatch]] = LRUCache(SEGMENT_CACHE_ENTRIES)
+
 
 def find_ableist_language(
     job_description_text: str,
+    prefilter: bool = False,
+    mode: str = "full",
 ) -> List[AbleistLanguageMatch]:
     """For a given job description document, return a list of the matched ableist
     language phrases.
@@ -131,6 +705,27 @@ def find_ableist_language(
     ----------
     job_description_text : str
         Job description text
+    prefilter : bool, optional
+        If true, first scan the text for any surface form of a wordlist verb and skip
+        parsing when there is none, by default False
+    mode : str, optional
+        How the document is parsed, by default "full":
+
+        * "full": parse the whole document
+        * "sentences": split the document into sentences with a rule-based
+          sentencizer and only parse the sentences that contain a surface form of a
+          wordlist verb; offsets are reported relative to the whole document
+        * "two_tier": tag and lemmatize the document without the dependency parser
+          and only run the parser if an object dependent verb lemma is found.
+          Documents that are not parsed are matched on part of speech alone, so
+          a verb that the parser would label as auxiliary can be reported.
+        * "windowed": parse the document in overlapping windows, see
+          `find_ableist_language_windowed`. "full" mode switches to this mode for
+          documents longer than the pipeline's `max_length`.
+        * "segment_cache": like "sentences", but the matches of each parsed sentence
+          are cached in a bounded LRU keyed by the sentence text, so sentences
+          shared by many documents, e.g. EEO statements or benefit blurbs, are only
+          parsed once; see `get_segment_cache_stats`
 
     Returns
     -------
@@ -138,52 +733,385 @@ def find_ableist_language(
         List of matched ableist language in the form of AbleistLanguageMatch dataclass
         instances
     """
+    if mode not in FIND_MODES:
+        raise ValueError(f"Mode ({mode}) must be one of {FIND_MODES}.")
+
+    nlp = get_nlp()
+    compiled = _compile_default_wordlist(nlp.vocab)
+    if prefilter and not compiled.prefilter.has_candidates(job_description_text):
+        return []
+
+    if mode == "sentences":
+        return _find_in_candidate_sentences(job_description_text, nlp, compiled)
+    if mode == "two_tier":
+        return _find_two_tier(job_description_text, nlp, compiled)
+    if mode == "segment_cache":
+        return _find_with_segment_cache(job_description_text, nlp, compiled)
+    if mode == "windowed" or len(job_description_text) > nlp.max_length:
+        return find_ableist_language_windowed(job_description_text)
+
     # Read in jd and convert to spacy doc
     job_description_doc = nlp(job_description_text)
+    return match_compiled_wordlist(job_description_doc, compiled)
+
+
+def _find_in_candidate_sentences(
+    job_description_text: str,
+    nlp: spacy.language.Language,
+    compiled: CompiledWordlist,
+) -> List[AbleistLanguageMatch]:
+    """Parse only the sentences containing a candidate verb form. Sentences are cut
+    from a tokenization of the whole document, so token offsets line up with a full
+    parse.
+    """
+    tokenized_doc = nlp.make_doc(job_description_text)
+    candidate_positions = (
+        candidate.start()
+        for candidate in compiled.prefilter.iter_candidates(job_description_text)
+    )
+    sentences = select_spans(split_sentences(tokenized_doc), candidate_positions)
 
     matched_results = []
+    sentence_docs = apply_pipeline(nlp, (span_to_doc(sent) for sent in sentences))
+    for sent, sentence_doc in zip(sentences, sentence_docs):
+        matched_results.extend(
+            _shift_match(match, sent.start, sent.start_char)
+            for match in match_compiled_wordlist(sentence_doc, compiled)
+        )
+    return matched_results
 
-    # Match verbs in ableist verb list
-    ableist_verbs_non_obj_dep = {
-        verb: verb_data
-        for verb, verb_data in ABLEIST_VERBS.items()
-        if not verb_data.object_dependent
-    }
-    for match in match_ableist_verbs(job_description_doc, ableist_verbs_non_obj_dep):
-        matched_results.append(
-            AbleistLanguageMatch(
-                lemma=match.lemma_,
-                text=match.text,
-                start=match.start,
-                end=match.end,
-                data=ABLEIST_VERBS[match.lemma_],
-            )
+
+def _find_with_segment_cache(
+    job_description_text: str,
+    nlp: spacy.language.Language,
+    compiled: CompiledWordlist,
+) -> List[AbleistLanguageMatch]:
+    """Look up the matches of each candidate sentence in the segment cache and only
+    parse the sentences that are not cached yet.
+    """
+    tokenized_doc = nlp.make_doc(job_description_text)
+    candidate_positions = (
+        candidate.start()
+        for candidate in compiled.prefilter.iter_candidates(job_description_text)
+    )
+    sentences = select_spans(split_sentences(tokenized_doc), candidate_positions)
+
+    # Results also depend on the wordlist and the pipeline
+    version = f"{compiled.fingerprint}|{get_model_fingerprint(nlp)}\0".encode("utf-8")
+    segment_cache = _segment_cache
+    keys = [
+        hashlib.blake2b(
+            version + sent.text_with_ws.encode("utf-8"), digest_size=16
+        ).digest()
+        for sent in sentences
+    ]
+    sentence_matches = [segment_cache.get(key) for key in keys]
+    unseen = [i for i, matches in enumerate(sentence_matches) if matches is None]
+    sentence_docs = apply_pipeline(nlp, (span_to_doc(sentences[i]) for i in unseen))
+    for i, sentence_doc in zip(unseen, sentence_docs):
+        sentence_matches[i] = match_compiled_wordlist(sentence_doc, compiled)
+        segment_cache.put(keys[i], sentence_matches[i])
+
+    matched_results = []
+    for sent, matches in zip(sentences, sentence_matches):
+        matched_results.extend(
+            _shift_match(match, sent.start, sent.start_char) for match in matches
         )
+    return matched_results
 
-    # Match verbs that depend on objects, if present in the word list
-    # A little repetitive, but need to use the original search term to access the data
-    # in AbleistLanguage since these are phrases and not just exact matches
-    ableist_verbs_obj_dep = {
-        verb: verb_data
-        for verb, verb_data in ABLEIST_VERBS.items()
-        if verb_data.object_dependent
-    }
-    if len(ableist_verbs_obj_dep) > 0:
-        for search_verb, match in match_dependent_ableist_verbs(
-            job_description_doc, ableist_verbs_obj_dep, return_search_verbs=True
-        ):
+
+def set_segment_cache_size(max_entries: int = SEGMENT_CACHE_ENTRIES) -> None:
+    """Replace the segment cache of "segment_cache" mode with an empty one holding up
+    to `max_entries` sentence results.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of cached sentences, by default SEGMENT_CACHE_ENTRIES
+    """
+    global _segment_cache
+    _segment_cache = LRUCache(max_entries)
+
+
+def get_segment_cache_stats() -> CacheStats:
+    """Return the hit and miss counts of the segment cache of "segment_cache" mode,
+    one lookup per candidate sentence.
+    """
+    return _segment_cache.stats
+
+
+def _find_two_tier(
+    job_description_text: str,
+    nlp: spacy.language.Language,
+    compiled: CompiledWordlist,
+) -> List[AbleistLanguageMatch]:
+    """Tag the document without parsing it, and only parse it if the dependency
+    matcher could match.
+    """
+    parser_names = [name for name in PARSER_COMPONENTS if nlp.has_pipe(name)]
+    tagged_doc = nlp(job_description_text, disable=parser_names)
+
+    if compiled.dependency_matcher is None or not any(
+        token.lemma_ in compiled.object_dependent for token in tagged_doc
+    ):
+        matched_results = [
+            _span_match(match, compiled.ableist_verbs[match.lemma_])
+            for match in _apply_verb_matcher(compiled.tagged_verb_matcher, tagged_doc)
+        ]
+        matched_results.extend(_match_phrases(tagged_doc, compiled))
+        return matched_results
+
+    # The parser reuses the token vectors already computed for the tagger
+    for name in parser_names:
+        tagged_doc = nlp.get_pipe(name)(tagged_doc)
+    return match_compiled_wordlist(tagged_doc, compiled)
+
+
+def find_ableist_language_windowed(
+    job_description_text: str,
+    window_chars: Optional[int] = None,
+    overlap_chars: int = WINDOW_OVERLAP_CHARS,
+    n_process: int = 1,
+) -> List[AbleistLanguageMatch]:
+    """Find ableist language in a document of any length by parsing it in windows of
+    at most `window_chars` plus twice `overlap_chars` characters, so the memory used
+    by the parser does not depend on the length of the document. Windows are cut at
+    paragraph breaks where possible, else at the end of a sentence (see
+    `segmentation.iter_windows`). Each match is kept only from the window whose core
+    contains its start, so matches in the overlap are not reported twice, and
+    positions are relative to the whole document; token positions are those of the
+    whole document's tokenization.
+
+    Parameters
+    ----------
+    job_description_text : str
+        Job description text
+    window_chars : Optional[int], optional
+        Maximum length of the core of a window, by default None (100000 characters,
+        or less if needed to keep whole windows within the pipeline's `max_length`)
+    overlap_chars : int, optional
+        Maximum context parsed on each side of a core, by default 2000
+    n_process : int, optional
+        Number of processes spacy uses to parse the windows, by default 1
+
+    Returns
+    -------
+    List[AbleistLanguageMatch]
+        List of matched ableist language in the form of AbleistLanguageMatch dataclass
+        instances
+    """
+    nlp = get_nlp()
+    compiled = _compile_default_wordlist(nlp.vocab)
+    if window_chars is None:
+        overlap_chars = min(overlap_chars, nlp.max_length // 4)
+        window_chars = min(WINDOW_CHARS, nlp.max_length - 2 * overlap_chars)
+    windows = list(iter_windows(job_description_text, window_chars, overlap_chars))
+    window_docs = nlp.pipe(
+        (job_description_text[window.start : window.end] for window in windows),
+        batch_size=1,
+        n_process=n_process,
+    )
+    # A core can tokenize differently from the same text in the whole document, e.g.
+    # when it starts inside a whitespace run, so token positions are looked up from
+    # character positions in one tokenizer pass over the whole text; the tokenizer
+    # does not check `max_length`
+    token_starts = [token.idx for token in nlp.tokenizer(job_description_text)]
+
+    matched_results = []
+    seen = set()
+    for window, window_doc in zip(windows, window_docs):
+        core_start = window.core_start - window.start
+        core_end = window.core_end - window.start
+        for match in match_compiled_wordlist(window_doc, compiled):
+            if not core_start <= match.start_char < core_end:
+                continue
+            start_char = match.start_char + window.start
+            end_char = match.end_char + window.start
+            if (start_char, end_char, match.data.verb) in seen:
+                continue
+            seen.add((start_char, end_char, match.data.verb))
             matched_results.append(
-                AbleistLanguageMatch(
-                    lemma=match.lemma_,
-                    text=match.text,
-                    start=match.start,
-                    end=match.end,
-                    data=ABLEIST_VERBS[search_verb.lemma_],
+                replace(
+                    match,
+                    start=bisect_right(token_starts, start_char) - 1,
+                    end=bisect_left(token_starts, end_char),
+                    start_char=start_char,
+                    end_char=end_char,
                 )
             )
     return matched_results
 
 
+def _pipe_candidates(
+    nlp: spacy.language.Language,
+    texts: Iterable[str],
+    lexical_prefilter: Optional[LexicalPrefilter],
+    batch_size: int,
+    n_process: int,
+) -> Iterator[Optional[spacy.tokens.Doc]]:
+    """Yield a parsed doc for each text, in input order, or None for texts that the
+    prefilter skipped. Skipped texts are never sent to `nlp.pipe`.
+    """
+    if lexical_prefilter is None:
+        yield from nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return
+
+    # nlp.pipe reads ahead of the docs it yields, so keep the prefilter decisions in
+    # a queue and replay them as the parsed docs come back
+    decisions = deque()
+
+    def candidate_texts():
+        for text in texts:
+            has_candidates = lexical_prefilter.has_candidates(text)
+            decisions.append(has_candidates)
+            if has_candidates:
+                yield text
+
+    for doc in nlp.pipe(candidate_texts(), batch_size=batch_size, n_process=n_process):
+        while not decisions.popleft():
+            yield None
+        yield doc
+    while decisions:
+        decisions.popleft()
+        yield None
+
+
+def find_ableist_language_batch(
+    job_description_texts: Iterable[str],
+    batch_size: int = 64,
+    n_process: int = 1,
+    prefilter: bool = False,
+) -> Iterator[List[AbleistLanguageMatch]]:
+    """For a stream of job description documents, yield a list of the matched ableist
+    language phrases for each document, in input order. Documents are processed with
+    `nlp.pipe`, which is much faster than calling `find_ableist_language` per document.
+
+    Parameters
+    ----------
+    job_description_texts : Iterable[str]
+        Job description texts; may be a generator
+    batch_size : int, optional
+        Number of documents buffered and processed together by spacy, by default 64
+    n_process : int, optional
+        Number of processes spacy uses to parse the documents, by default 1. Matching
+        always happens in the calling process.
+    prefilter : bool, optional
+        If true, documents without any surface form of a wordlist verb are not parsed
+        and get an empty result, by default False
+
+    Yields
+    ------
+    Iterator[List[AbleistLanguageMatch]]
+        List of matched ableist language for each input document
+    """
+    nlp = get_nlp()
+    compiled = _compile_default_wordlist(nlp.vocab)
+    lexical_prefilter = compiled.prefilter if prefilter else None
+    for job_description_doc in _pipe_candidates(
+        nlp, job_description_texts, lexical_prefilter, batch_size, n_process
+    ):
+        if job_description_doc is None:
+            yield []
+        else:
+            yield match_compiled_wordlist(job_description_doc, compiled)
+
+
+@dataclass
+class SegmentResult:
+    """Matches found in one segment of a document, with token and character
+    positions relative to the start of the segment.
+    """
+
+    n_chars: int
+    n_tokens: int
+    matches: List[AbleistLanguageMatch]
+
+
+def analyze_segments(
+    segment_texts: Iterable[str], batch_size: int = 64
+) -> Iterator[SegmentResult]:
+    """Find ableist language in each segment of a document independently, e.g. in
+    each paragraph. Segments without a surface form of a wordlist verb are only
+    tokenized, to count their tokens, and segments longer than the pipeline's
+    `max_length` are parsed in windows (see `find_ableist_language_windowed`).
+
+    Parameters
+    ----------
+    segment_texts : Iterable[str]
+        Segment texts, e.g. from `segmentation.split_paragraphs`
+    batch_size : int, optional
+        Number of segments parsed together by spacy, by default 64
+
+    Yields
+    ------
+    Iterator[SegmentResult]
+        Result for each segment, in input order
+    """
+    nlp = get_nlp()
+    compiled = _compile_default_wordlist(nlp.vocab)
+    segment_texts = list(segment_texts)
+    has_candidates = [
+        next(compiled.prefilter.iter_candidates(text), None) is not None
+        for text in segment_texts
+    ]
+    segment_docs = nlp.pipe(
+        (
+            text
+            for text, parse in zip(segment_texts, has_candidates)
+            if parse and len(text) <= nlp.max_length
+        ),
+        batch_size=batch_size,
+    )
+    for text, parse in zip(segment_texts, has_candidates):
+        if parse and len(text) <= nlp.max_length:
+            segment_doc = next(segment_docs)
+            matches = match_compiled_wordlist(segment_doc, compiled)
+        else:
+            # The tokenizer alone does not check `max_length`
+            segment_doc = nlp.tokenizer(text)
+            matches = find_ableist_language_windowed(text) if parse else []
+        yield SegmentResult(len(text), len(segment_doc), matches)
+
+
+def stitch_segments(
+    segment_results: Iterable[SegmentResult],
+) -> List[AbleistLanguageMatch]:
+    """Combine the results of consecutive segments into document level matches.
+
+    Parameters
+    ----------
+    segment_results : Iterable[SegmentResult]
+        Results of the segments that make up the document, in document order
+
+    Returns
+    -------
+    List[AbleistLanguageMatch]
+        Matches with token and character positions relative to the document
+    """
+    matched_results = []
+    token_offset = char_offset = 0
+    for segment_result in segment_results:
+        matched_results.extend(
+            _shift_match(match, token_offset, char_offset)
+            for match in segment_result.matches
+        )
+        token_offset += segment_result.n_tokens
+        char_offset += segment_result.n_chars
+    return matched_results
+
+
+def get_prefilter_stats() -> PrefilterStats:
+    """Return how many documents the lexical prefilter has checked and skipped for the
+    packaged wordlist in this process.
+
+    Returns
+    -------
+    PrefilterStats
+        Prefilter statistics; `skip_rate` is the fraction of documents not parsed
+    """
+    return _compile_default_wordlist(get_nlp().vocab).prefilter.stats
+
+
 @click.command()
 @click.option(
     "--job_description_file",
@@ -0,0 +1,93 @@
+"""Module to keep detector results up to date while a document is being edited."""
+
+from typing import Dict, List
+
+from ableist_language_detector import detector
+from ableist_language_detector.segmentation import split_paragraphs
+
+
+class EditSession:
+    """Stateful detector for a document that changes a little at a time, e.g. a draft
+    in an editor. Results are kept per paragraph; after an edit only the paragraphs
+    whose text changed are parsed again, so the time to update the results depends on
+    the size of the edit rather than the size of the document.
+
+    Like `near_duplicates.NearDuplicateDetector`, the document is analyzed paragraph
+    by paragraph, so results can differ slightly from a full parse of the whole
+    document.
+    """
+
+    def __init__(self, text: str = ""):
+        self.text = ""
+        self.paragraphs_reused = 0
+        self.paragraphs_analyzed = 0
+        self._results: Dict[str, detector.SegmentResult] = {}
+        self._matches: List[detector.AbleistLanguageMatch] = []
+        self.update(text)
+
+    @property
+    def matches(self) -> List[detector.AbleistLanguageMatch]:
+        """Matches in the current text, with positions relative to the document."""
+        return list(self._matches)
+
+    def update(self, text: str) -> List[detector.AbleistLanguageMatch]:
+        """Replace the document with a new version of its full text.
+
+        Parameters
+        ----------
+        text : str
+            Full text of the edited document
+
+        Returns
+        -------
+        List[detector.AbleistLanguageMatch]
+            Matches in the new text, with positions relative to the document
+        """
+        paragraphs = split_paragraphs(text)
+        new_paragraphs = list(
+            dict.fromkeys(
+                paragraph for paragraph in paragraphs if paragraph not in self._results
+            )
+        )
+        results = dict(zip(new_paragraphs, detector.analyze_segments(new_paragraphs)))
+        self.paragraphs_analyzed += len(new_paragraphs)
+        for paragraph in paragraphs:
+            if paragraph not in results:
+                results[paragraph] = self._results[paragraph]
+                self.paragraphs_reused += 1
+
+        self.text = text
+        # Only results of the current paragraphs are kept, so memory does not grow
+        # with the number of edits
+        self._results = results
+        self._matches = detector.stitch_segments(
+            results[paragraph] for paragraph in paragraphs
+        )
+        return self.matches
+
+    def apply_edit(
+        self, start: int, end: int, replacement: str
+    ) -> List[detector.AbleistLanguageMatch]:
+        """Replace the characters between `start` and `end` of the current text.
+
+        Parameters
+        ----------
+        start : int
+            Character position where the edit starts
+        end : int
+            Character position where the edit ends (exclusive); equal to `start` for
+            an insertion
+        replacement : str
+            Text that replaces the edited characters; empty for a deletion
+
+        Returns
+        -------
+        List[detector.AbleistLanguageMatch]
+            Matches in the edited text, with positions relative to the document
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(
+                f"Invalid edit range ({start}, {end}) for a text of length "
+                f"{len(self.text)}."
+            )
+        return self.update(self.text[:start] + replacement + self.text[end:])
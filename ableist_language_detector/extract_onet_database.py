@@ -0,0 +1,306 @@
+"""Command line tool to count the verbs, noun objects and nouns used across the files
+of a full O*NET database release, e.g. task statements and detailed work activities.
+
+Files are read in chunks of rows and parsed with a multi-process `nlp.pipe`, and only
+running term counts per file and section are kept, so memory does not grow with the
+number of rows. The counts and the term lists are written once every file is read.
+"""
+
+import csv
+import glob
+import logging
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import click
+import pandas as pd
+import spacy
+
+from ableist_language_detector import utils
+from ableist_language_detector.spacy_models import get_nlp
+
+logger = logging.getLogger(__name__)
+
+# Columns holding the text to parse, in order of preference; O*NET files have one
+TEXT_COLUMNS = ("Description", "Task", "DWA Title", "IWA Title", "Example")
+# Columns used to split the counts of a file into sections, in order of preference.
+# Element IDs are grouped by their first two levels, e.g. "1.A" (abilities).
+SECTION_COLUMNS = ("Element ID", "Task Type")
+# Section of rows in files without a section column
+DEFAULT_SECTION = "all"
+TERM_KINDS = ("verbs", "objects", "nouns")
+
+# (file name, section)
+SectionKey = Tuple[str, str]
+
+
+@dataclass
+class TermCounts:
+    """Running counts of the verb, noun object and noun lemmas of a set of documents."""
+
+    documents: int = 0
+    verbs: Counter = field(default_factory=Counter)
+    objects: Counter = field(default_factory=Counter)
+    nouns: Counter = field(default_factory=Counter)
+
+    def add_doc(self, doc: spacy.tokens.Doc) -> None:
+        """Count the terms of a parsed document."""
+        self.documents += 1
+        for token in doc:
+            if utils.is_verb(token):
+                self.verbs[token.lemma_] += 1
+            if utils.is_object(token):
+                self.objects[token.lemma_] += 1
+            if utils.is_noun(token):
+                self.nouns[token.lemma_] += 1
+
+    def update(self, other: "TermCounts") -> None:
+        """Add the counts of another `TermCounts`."""
+        self.documents += other.documents
+        self.verbs.update(other.verbs)
+        self.objects.update(other.objects)
+        self.nouns.update(other.nouns)
+
+
+def expand_data_paths(data_paths: Iterable[str]) -> List[str]:
+    """Expand directories to the .txt files they contain and glob patterns to the
+    files they match.
+
+    Parameters
+    ----------
+    data_paths : Iterable[str]
+        Paths of O*NET files or directories, or glob patterns
+
+    Returns
+    -------
+    List[str]
+        Paths of the files, in the given order and sorted within each pattern or
+        directory
+    """
+    paths = []
+    for data_path in data_paths:
+        if os.path.isdir(data_path):
+            paths.extend(sorted(glob.glob(os.path.join(data_path, "*.txt"))))
+        elif os.path.exists(data_path):
+            paths.append(data_path)
+        else:
+            paths.extend(sorted(glob.glob(data_path, recursive=True)))
+    return paths
+
+
+def _get_section(value: str, section_column: str) -> str:
+    if section_column == "Element ID":
+        return ".".join(value.split(".")[:2])
+    return value
+
+
+def iter_onet_texts(
+    data_paths: Sequence[str], chunk_size: int = 10000
+) -> Iterator[Tuple[str, SectionKey]]:
+    """Read the text of every row of O*NET files, a chunk of rows at a time.
+
+    Parameters
+    ----------
+    data_paths : Sequence[str]
+        Paths of tab separated O*NET files
+    chunk_size : int, optional
+        Number of rows read at once, by default 10000
+
+    Yields
+    ------
+    Iterator[Tuple[str, SectionKey]]
+        Text of each row with the file name and section it belongs to, in the format
+        expected by `nlp.pipe(..., as_tuples=True)`
+
+    Raises
+    ------
+    ValueError
+        If a file has none of the `TEXT_COLUMNS`
+    """
+    for data_path in data_paths:
+        columns = list(pd.read_csv(data_path, delimiter="\t", nrows=0).columns)
+        text_column = next((c for c in TEXT_COLUMNS if c in columns), None)
+        if text_column is None:
+            raise ValueError(
+                f"File {data_path} has none of the text columns {TEXT_COLUMNS}."
+            )
+        section_column = next((c for c in SECTION_COLUMNS if c in columns), None)
+        usecols = (
+            [text_column] if section_column is None else [text_column, section_column]
+        )
+
+        file_name = os.path.basename(data_path)
+        rows = 0
+        chunks = pd.read_csv(
+            data_path,
+            delimiter="\t",
+            usecols=usecols,
+            dtype=str,
+            keep_default_na=False,
+            quoting=csv.QUOTE_NONE,
+            chunksize=chunk_size,
+        )
+        for chunk in chunks:
+            sections = [DEFAULT_SECTION] * len(chunk)
+            if section_column is not None:
+                sections = [
+                    _get_section(value, section_column)
+                    for value in chunk[section_column]
+                ]
+            for text, section in zip(chunk[text_column], sections):
+                if text:
+                    yield text, (file_name, section)
+            rows += len(chunk)
+            logger.info("%s: read %d rows", file_name, rows)
+
+
+def count_onet_terms(
+    data_paths: Sequence[str],
+    chunk_size: int = 10000,
+    batch_size: int = 64,
+    n_process: int = 1,
+) -> Dict[SectionKey, TermCounts]:
+    """Parse every row of O*NET files and count the terms of each file and section.
+
+    Parameters
+    ----------
+    data_paths : Sequence[str]
+        Paths of tab separated O*NET files
+    chunk_size : int, optional
+        Number of rows read at once, by default 10000
+    batch_size : int, optional
+        Number of rows parsed together by spacy, by default 64
+    n_process : int, optional
+        Number of processes spacy uses to parse the rows, by default 1
+
+    Returns
+    -------
+    Dict[SectionKey, TermCounts]
+        Term counts keyed by file name and section
+    """
+    nlp = get_nlp()
+    counts: Dict[SectionKey, TermCounts] = defaultdict(TermCounts)
+    docs = nlp.pipe(
+        iter_onet_texts(data_paths, chunk_size),
+        as_tuples=True,
+        batch_size=batch_size,
+        n_process=n_process,
+    )
+    for doc, key in docs:
+        counts[key].add_doc(doc)
+    return dict(counts)
+
+
+def write_term_counts(
+    counts: Dict[SectionKey, TermCounts],
+    output_dir: str,
+    min_count: int = 1,
+) -> None:
+    """Write the term counts of each file and section to term_counts.csv, and the
+    terms of each kind across all files, most frequent first, to verbs.txt,
+    objects.txt and nouns.txt.
+
+    Parameters
+    ----------
+    counts : Dict[SectionKey, TermCounts]
+        Term counts keyed by file name and section, from `count_onet_terms`
+    output_dir : str
+        Directory to write to; created if it does not exist
+    min_count : int, optional
+        Minimum total count of a term in the term lists, by default 1
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    totals = TermCounts()
+    with open(output_path / "term_counts.csv", "w", newline="") as counts_file:
+        writer = csv.writer(counts_file)
+        writer.writerow(["file", "section", "documents", "kind", "term", "count"])
+        for (file_name, section), section_counts in sorted(counts.items()):
+            totals.update(section_counts)
+            for kind in TERM_KINDS:
+                for term, count in getattr(section_counts, kind).most_common():
+                    writer.writerow(
+                        [
+                            file_name,
+                            section,
+                            section_counts.documents,
+                            kind,
+                            term,
+                            count,
+                        ]
+                    )
+
+    for kind in TERM_KINDS:
+        with open(output_path / f"{kind}.txt", "w") as terms_file:
+            terms_file.writelines(
+                f"{term}\n"
+                for term, count in getattr(totals, kind).most_common()
+                if count >= min_count
+            )
+
+
+@click.command()
+@click.option(
+    "--data_path",
+    "-d",
+    type=str,
+    multiple=True,
+    required=True,
+    help=(
+        "O*NET database file, directory of .txt files or glob pattern; can be given "
+        "multiple times. Download from: https://www.onetcenter.org/database.html"
+    ),
+)
+@click.option(
+    "--output_dir",
+    "-o",
+    type=str,
+    required=True,
+    help="Path to local directory to save the term counts and lists.",
+)
+@click.option(
+    "--chunk_size",
+    type=int,
+    default=10000,
+    show_default=True,
+    help="Number of rows read from a file at once.",
+)
+@click.option(
+    "--batch_size",
+    "-b",
+    type=int,
+    default=64,
+    show_default=True,
+    help="Number of rows parsed together by spaCy.",
+)
+@click.option(
+    "--n_process",
+    "-n",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of processes spaCy uses to parse the rows.",
+)
+@click.option(
+    "--min_count",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Minimum total count of a term in the term lists.",
+)
+def main(data_path, output_dir, chunk_size, batch_size, n_process, min_count):
+    """Count verbs, objects and nouns across the files of an O*NET release."""
+    logging.basicConfig(level=logging.INFO)
+    data_paths = expand_data_paths(data_path)
+    if not data_paths:
+        raise click.BadParameter("No files found.", param_hint="--data_path")
+    counts = count_onet_terms(data_paths, chunk_size, batch_size, n_process)
+    write_term_counts(counts, output_dir, min_count)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,20 @@
 """Module with functions to extract ability vs. skills terms from ONET data."""
 
+import logging
 from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
 
 import click
 import pandas as pd
 import spacy
 
-from ableist_language_detector import utils
+from ableist_language_detector import term_stats, utils
+from ableist_language_detector.corpus_cache import ParsedCorpusCache
+from ableist_language_detector.spacy_models import get_nlp
 
-nlp = spacy.load("en_core_web_sm")
+logger = logging.getLogger(__name__)
 
 
 def get_abilities(df: pd.DataFrame) -> pd.DataFrame:
@@ -60,19 +64,87 @@ def get_skills(df: pd.DataFrame) -> pd.DataFrame:
     return skills_df
 
 
-def get_representative_terms(
-    abilities_corpus: Iterable[str], skills_corpus: Iterable[str]
-) -> Tuple[list, list]:
-    """Return representative terms in order of importance from the abilities and skills
-    corpora.
+@dataclass
+class CorpusTerms:
+    """Lemmas of the verbs, noun objects and nouns of a corpus, with one entry per
+    occurrence so they can be counted. `document_verbs` holds the verbs of each
+    document separately, for document level statistics.
+    """
 
+    verbs: List[str] = field(default_factory=list)
+    document_verbs: List[List[str]] = field(default_factory=list)
+    objects: List[str] = field(default_factory=list)
+    nouns: List[str] = field(default_factory=list)
+
+
+def extract_corpus_terms(
+    corpus: Iterable[str], batch_size: int = 64, n_process: int = 1
+) -> CorpusTerms:
+    """Parse each document of a corpus once and collect its verbs, noun objects and
+    nouns in the same pass over the tokens.
 
     Parameters
     ----------
-    abilities_corpus : Iterable[str]
-        Iterable containing the ability descriptions
-    skills_corpus : Iterable[str]
-        Iterable containing the skills descriptions
+    corpus : Iterable[str]
+        Iterable containing individual documents (in this case, skill/ability
+        descriptions)
+    batch_size : int, optional
+        Number of documents parsed together by spacy, by default 64
+    n_process : int, optional
+        Number of processes spacy uses to parse the documents, by default 1
+
+    Returns
+    -------
+    CorpusTerms
+        Lemmas of the verbs, noun objects and nouns, in corpus order
+    """
+    nlp = get_nlp()
+    return collect_corpus_terms(
+        nlp.pipe(corpus, batch_size=batch_size, n_process=n_process)
+    )
+
+
+def collect_corpus_terms(docs: Iterable[spacy.tokens.Doc]) -> CorpusTerms:
+    """Collect the verbs, noun objects and nouns of parsed documents in one pass over
+    their tokens.
+
+    Parameters
+    ----------
+    docs : Iterable[spacy.tokens.Doc]
+        Parsed documents, e.g. loaded from a `ParsedCorpusCache`
+
+    Returns
+    -------
+    CorpusTerms
+        Lemmas of the verbs, noun objects and nouns, in document order
+    """
+    terms = CorpusTerms()
+    for doc in docs:
+        doc_verbs = []
+        for token in doc:
+            if utils.is_verb(token):
+                doc_verbs.append(token.lemma_)
+            if utils.is_object(token):
+                terms.objects.append(token.lemma_)
+            if utils.is_noun(token):
+                terms.nouns.append(token.lemma_)
+        terms.verbs.extend(doc_verbs)
+        terms.document_verbs.append(doc_verbs)
+    return terms
+
+
+def rank_representative_terms(
+    abilities_verbs: List[str], skills_verbs: List[str]
+) -> Tuple[list, list]:
+    """Return the verbs that occur only in abilities or only in skills, each sorted
+    by how often it occurs.
+
+    Parameters
+    ----------
+    abilities_verbs : List[str]
+        Verb lemmas of the ability descriptions, one per occurrence
+    skills_verbs : List[str]
+        Verb lemmas of the skills descriptions, one per occurrence
 
     Returns
     -------
@@ -80,27 +152,13 @@ def get_representative_terms(
         The first element is a list of abilities terms and the second element is a list
         of skills terms
     """
-    # Intialize empty lists to store all the verbs extracted from the docs
-    abilities_verbs = []
-    skills_verbs = []
-
-    # For each description, get the verbs and append them to the master list
-    # TODO: Could refine by only retrieving verbs that occur at the start of the
-    # description, i.e. only capture the main verb used in the skill/ability
-    for doc in nlp.pipe(abilities_corpus):
-        abilities_verbs.extend([token.lemma_ for token in utils.get_verbs(doc)])
-    for doc in nlp.pipe(skills_corpus):
-        skills_verbs.extend([token.lemma_ for token in utils.get_verbs(doc)])
-
     # Get counts for each verb; will be useful for ranking later
     abilities_verbs_counter = Counter(abilities_verbs)
     skills_verbs_counter = Counter(skills_verbs)
 
-    # Compute the set difference and sort by term frequency
-    # TODO: Could implement something more sophisticated/closer to TF-IDF that looks at
-    # how often a term occurs in abilities vs. skills--impact would be to expand the
-    # term list to include terms that occurred in both, but occurred much more
-    # frequently in one than another
+    # Compute the set difference and sort by term frequency; see
+    # `term_stats.score_terms` for a ranking that also keeps terms that occur in both
+    # corpora but much more frequently in one than the other
     unique_abilities_verbs = sorted(
         list(set(abilities_verbs).difference(skills_verbs)),
         key=lambda x: -abilities_verbs_counter[x],
@@ -112,6 +170,34 @@ def get_representative_terms(
     return unique_abilities_verbs, unique_skills_verbs
 
 
+def get_representative_terms(
+    abilities_corpus: Iterable[str], skills_corpus: Iterable[str]
+) -> Tuple[list, list]:
+    """Return representative terms in order of importance from the abilities and skills
+    corpora.
+
+
+    Parameters
+    ----------
+    abilities_corpus : Iterable[str]
+        Iterable containing the ability descriptions
+    skills_corpus : Iterable[str]
+        Iterable containing the skills descriptions
+
+    Returns
+    -------
+    Tuple[list, list]
+        The first element is a list of abilities terms and the second element is a list
+        of skills terms
+    """
+    # TODO: Could refine by only retrieving verbs that occur at the start of the
+    # description, i.e. only capture the main verb used in the skill/ability
+    return rank_representative_terms(
+        extract_corpus_terms(abilities_corpus).verbs,
+        extract_corpus_terms(skills_corpus).verbs,
+    )
+
+
 def get_objects_corpus(corpus: Iterable[str]) -> list:
     """Return a list of all noun objects in a given corpus.
 
@@ -126,10 +212,7 @@ def get_objects_corpus(corpus: Iterable[str]) -> list:
     list
         List of unique noun objects
     """
-    noun_objects = []
-    for doc in nlp.pipe(corpus):
-        noun_objects.extend([token.lemma_ for token in utils.get_objects(doc)])
-    return list(set(noun_objects))
+    return list(set(extract_corpus_terms(corpus).objects))
 
 
 def get_nouns_corpus(corpus: Iterable[str]) -> list:
@@ -146,10 +229,7 @@ def get_nouns_corpus(corpus: Iterable[str]) -> list:
     list
         List of unique nouns
     """
-    nouns = []
-    for doc in nlp.pipe(corpus):
-        nouns.extend([token.lemma_ for token in utils.get_nouns(doc)])
-    return list(set(nouns))
+    return list(set(extract_corpus_terms(corpus).nouns))
 
 
 @click.command()
@@ -170,8 +250,54 @@ def get_nouns_corpus(corpus: Iterable[str]) -> list:
     required=True,
     help="Path to local directory to save skills and abilities terms lists.",
 )
-def main(data_path, output_dir):
+@click.option(
+    "--batch_size",
+    "-b",
+    type=int,
+    default=64,
+    show_default=True,
+    help="Number of descriptions parsed together by spaCy.",
+)
+@click.option(
+    "--n_process",
+    "-n",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of processes spaCy uses to parse the descriptions.",
+)
+@click.option(
+    "--cache_dir",
+    "-c",
+    type=str,
+    default=None,
+    help=(
+        "Directory to keep the parsed descriptions in, so later runs only parse "
+        "new or changed descriptions."
+    ),
+)
+@click.option(
+    "--ranking",
+    "-r",
+    type=click.Choice(["set_difference", "log_odds"]),
+    default="set_difference",
+    show_default=True,
+    help=(
+        "How verbs are ranked: verbs found in only one corpus, by frequency, or "
+        "verbs whose weighted log-odds z-score leans towards one corpus by at "
+        "least --min_z, which also writes every verb's scores to verb_scores.csv."
+    ),
+)
+@click.option(
+    "--min_z",
+    type=float,
+    default=term_stats.DEFAULT_MIN_Z,
+    show_default=True,
+    help="Minimum log-odds z-score of a representative verb.",
+)
+def main(data_path, output_dir, batch_size, n_process, cache_dir, ranking, min_z):
     """Extract representative terms for abilities and skills."""
+    logging.basicConfig(level=logging.INFO)
     output_path = Path(output_dir)
     output_path.mkdir(
         parents=True, exist_ok=True
@@ -181,16 +307,53 @@ def main(data_path, output_dir):
     abilities_df = get_abilities(df)
     skills_df = get_skills(df)
 
-    unique_abilities_verbs, unique_skills_verbs = get_representative_terms(
-        abilities_df.Description, skills_df.Description
-    )
+    # Each corpus is parsed once; verbs, objects and nouns are collected together
+    if cache_dir is None:
+        abilities_terms = extract_corpus_terms(
+            abilities_df.Description, batch_size=batch_size, n_process=n_process
+        )
+        skills_terms = extract_corpus_terms(
+            skills_df.Description, batch_size=batch_size, n_process=n_process
+        )
+    else:
+        corpus_cache = ParsedCorpusCache(cache_dir)
+        corpus_terms = {}
+        for name, corpus_df in [("abilities", abilities_df), ("skills", skills_df)]:
+            docs = corpus_cache.get_docs(
+                name,
+                list(corpus_df.Description),
+                batch_size=batch_size,
+                n_process=n_process,
+            )
+            logger.info(
+                "%s: loaded %d parsed descriptions from the cache, parsed %d",
+                name,
+                corpus_cache.stats.loaded,
+                corpus_cache.stats.parsed,
+            )
+            corpus_terms[name] = collect_corpus_terms(docs)
+        abilities_terms = corpus_terms["abilities"]
+        skills_terms = corpus_terms["skills"]
+    if ranking == "log_odds":
+        verb_scores = term_stats.score_terms(
+            abilities_terms.document_verbs, skills_terms.document_verbs
+        )
+        verb_scores.to_csv(output_path / "verb_scores.csv", index=False)
+        (
+            unique_abilities_verbs,
+            unique_skills_verbs,
+        ) = term_stats.select_representative_terms(verb_scores, min_z)
+    else:
+        unique_abilities_verbs, unique_skills_verbs = rank_representative_terms(
+            abilities_terms.verbs, skills_terms.verbs
+        )
 
     # goal is to retrieve nouns that reference physical (e.g. body parts) or
     # sensory/cognitive abilities that may be ableist. These would all be verb ojects
     # in usage (e.g. move your hand), but looking only for objects was returning
     # limited results, so we'll also look for nouns and then manually curate them later.
-    noun_objects = get_objects_corpus(abilities_df.Description)
-    nouns = get_nouns_corpus(abilities_df.Description)
+    noun_objects = list(set(abilities_terms.objects))
+    nouns = list(set(abilities_terms.nouns))
 
     with open(output_path / "abilities_verbs.txt", "w") as abilities_out:
         abilities_out.writelines([f"{v}\n" for v in unique_abilities_verbs])
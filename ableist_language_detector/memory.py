@@ -0,0 +1,168 @@
+"""Module to bound the memory of long running detector processes.
+
+spaCy adds every new token string it sees to the pipeline's `Vocab` and
+`StringStore`, which never shrink, so a process that serves traffic for days grows
+without bound. `VocabManager` reloads the pipeline, with a fresh vocab, after a
+number of documents or when resident memory passes a threshold, and rebuilds the
+compiled matchers with the new vocab.
+"""
+
+import gc
+import os
+import resource
+import sys
+import threading
+from typing import Optional
+
+from ableist_language_detector import detector, spacy_models
+
+
+def get_rss_bytes() -> int:
+    """Return the resident set size of this process in bytes. Where /proc is not
+    available, the peak resident set size is returned instead.
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm_file:
+            resident_pages = int(statm_file.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _process_metrics() -> dict:
+    vocab = spacy_models.get_nlp().vocab
+    return {
+        "pid": os.getpid(),
+        "vocab_strings": len(vocab.strings),
+        "vocab_lexemes": len(vocab),
+        "rss_bytes": get_rss_bytes(),
+    }
+
+
+class VocabManager:
+    """Reload the shared pipeline once `max_documents` documents were processed with
+    it, or once resident memory exceeds `max_rss_mb` megabytes, whichever comes
+    first. Call `record` after processing documents.
+
+    Parameters
+    ----------
+    max_documents : Optional[int], optional
+        Number of documents after which the pipeline is reloaded, by default 100000.
+        None disables the limit.
+    max_rss_mb : Optional[float], optional
+        Resident memory in megabytes above which the pipeline is reloaded, by default
+        None (no limit). Memory is checked every `check_interval` documents, and a
+        reload is skipped until at least `check_interval` documents were processed
+        since the last one, so a process that stays above the threshold after a
+        reload does not reload continuously.
+    check_interval : int, optional
+        Number of documents between memory checks, by default 1000
+    """
+
+    def __init__(
+        self,
+        max_documents: Optional[int] = 100000,
+        max_rss_mb: Optional[float] = None,
+        check_interval: int = 1000,
+    ):
+        self.max_documents = max_documents
+        self.max_rss_mb = max_rss_mb
+        self.check_interval = check_interval
+        self.documents_since_reset = 0
+        self.resets = 0
+        self._documents_since_check = 0
+        self._lock = threading.Lock()
+
+    def record(self, n_documents: int = 1) -> bool:
+        """Count processed documents and reload the pipeline if a limit is reached.
+
+        Parameters
+        ----------
+        n_documents : int, optional
+            Number of documents processed since the last call, by default 1
+
+        Returns
+        -------
+        bool
+            Whether the pipeline was reloaded
+        """
+        with self._lock:
+            self.documents_since_reset += n_documents
+            self._documents_since_check += n_documents
+            if self._should_reset():
+                self._reset()
+                return True
+            return False
+
+    def _should_reset(self) -> bool:
+        if (
+            self.max_documents is not None
+            and self.documents_since_reset >= self.max_documents
+        ):
+            return True
+        if self.max_rss_mb is not None and (
+            self._documents_since_check >= self.check_interval
+        ):
+            self._documents_since_check = 0
+            return get_rss_bytes() > self.max_rss_mb * 1024 * 1024
+        return False
+
+    def reset(self) -> None:
+        """Reload the pipeline now."""
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        spacy_models.clear_models()
+        nlp = spacy_models.get_nlp()
+        detector.recompile_wordlists(nlp.vocab)
+        # Documents still being processed with the old pipeline keep it alive; it
+        # is freed once they are done
+        gc.collect()
+        self.documents_since_reset = 0
+        self._documents_since_check = 0
+        self.resets += 1
+
+    def metrics(self) -> dict:
+        """Current vocab size, resident memory and reload counts."""
+        return dict(
+            _process_metrics(),
+            documents_since_reset=self.documents_since_reset,
+            resets=self.resets,
+        )
+
+
+_default_manager: Optional[VocabManager] = None
+
+
+def configure(
+    max_documents: Optional[int] = 100000,
+    max_rss_mb: Optional[float] = None,
+    check_interval: int = 1000,
+) -> VocabManager:
+    """Enable memory management for this process with the given limits; see
+    `VocabManager`.
+    """
+    global _default_manager
+    _default_manager = VocabManager(max_documents, max_rss_mb, check_interval)
+    return _default_manager
+
+
+def record_documents(n_documents: int = 1) -> bool:
+    """Count processed documents with the manager set up by `configure`, if any, and
+    return whether the pipeline was reloaded.
+    """
+    if _default_manager is None:
+        return False
+    return _default_manager.record(n_documents)
+
+
+def get_metrics() -> dict:
+    """Return the metrics of the manager set up by `configure`, or the vocab size
+    and resident memory if memory management is not enabled.
+    """
+    if _default_manager is None:
+        return _process_metrics()
+    return _default_manager.metrics()
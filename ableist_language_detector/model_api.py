@@ -1,42 +1,190 @@
 """For training a custom mlflow model for detector api access."""
 
+import json
+import logging
+import os
+import pprint
+import tempfile
+from typing import Dict, Optional
+
 import click
 import mlflow
 import mlflow.pyfunc
 import pandas as pd
-import pprint
-from ableist_language_detector.detector import find_ableist_language
 
+from ableist_language_detector import ableist_word_list, detector, spacy_models
+from ableist_language_detector.detector import find_ableist_language_batch
+from ableist_language_detector.pool import DetectorPool
+
+logger = logging.getLogger(__name__)
 
-class MLflowLanguageModel(mlflow.pyfunc.PythonModel):
 
-    def __init__(self, func):
-        self.func = func
-
-    def predict(self, context, model_input):
-        properties = ["lemma", "text", "start", "end",
-                      "alternative_verbs", "example"]
-        result = self.func(model_input['data'][0])
-        terms = {}
-        print(f"Found {len(result)} instances of ableist language.\n")
-        if len(result) > 0:
-            for i, ableist_term in enumerate(result):
-                print(
-                    f"Match #{i+1}\n"
-                    f"PHRASE: {ableist_term} | LEMMA: {ableist_term.lemma} | "
-                    f"POSITION: {ableist_term.start}:{ableist_term.end} | "
-                    f"ALTERNATIVES: {ableist_term.data.alternative_verbs} | "
-                    f"EXAMPLE: {ableist_term.data.example}\n"
+class MLflowLanguageModel(mlflow.pyfunc.PythonModel):
+    """Custom mlflow model that finds ableist language in every row of the input."""
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        n_process: int = 1,
+        log_matches: bool = False,
+        workers: int = 0,
+    ):
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.log_matches = log_matches
+        # Number of processes of a DetectorPool started when the model is loaded
+        self.workers = workers
+        self._pool = None
+
+    def load_context(self, context):
+        """Restore the spaCy pipeline, wordlist and matcher patterns saved with the
+        model, then run a warmup prediction so the first request does not pay for
+        initialization.
+
+        Parameters
+        ----------
+        context : mlflow.pyfunc.PythonModelContext
+            mlflow model context with the artifacts created by `build_artifacts`
+        """
+        artifacts = context.artifacts
+        # Components were already excluded when the pipeline was saved
+        spacy_models.set_default_model(artifacts["spacy_model"], exclude=())
+        ableist_word_list.set_default_wordlist(artifacts["wordlist"])
+
+        with open(artifacts["matcher_patterns"], "r") as patterns_file:
+            saved_patterns = json.load(patterns_file)
+        fingerprint = ableist_word_list.get_ableist_verbs_fingerprint()
+        if saved_patterns["fingerprint"] != fingerprint:
+            raise ValueError(
+                f"Matcher patterns were built for wordlist "
+                f"{saved_patterns['fingerprint']}, but the saved wordlist is "
+                f"{fingerprint}."
+            )
+        detector.compile_wordlist(
+            ableist_word_list.get_ableist_verbs(),
+            spacy_models.get_nlp().vocab,
+            fingerprint=fingerprint,
+            patterns=saved_patterns["patterns"],
+        )
+
+        self.predict(context, pd.DataFrame({"data": [detector.WARMUP_TEXT]}))
+        if self.workers > 0:
+            # Started last, so the workers are forked with everything loaded
+            self._pool = DetectorPool(self.workers, chunk_size=self.batch_size).start()
+
+    def predict(self, context, model_input: pd.DataFrame) -> list:
+        """Find ableist language in each job description in the `data` column.
+
+        Parameters
+        ----------
+        context : mlflow.pyfunc.PythonModelContext
+            mlflow model context
+        model_input : pd.DataFrame
+            Dataframe with one job description text per row in the `data` column
+
+        Returns
+        -------
+        list
+            One list of matches per input row, in input order. Each match is a dict
+            with the keys of `AbleistLanguageMatch.to_dict`.
+        """
+        results = []
+        if self._pool is not None:
+            batch_results = self._pool.find_ableist_language_batch(
+                model_input["data"].astype(str)
+            )
+        else:
+            batch_results = find_ableist_language_batch(
+                model_input["data"].astype(str),
+                batch_size=self.batch_size,
+                n_process=self.n_process,
+            )
+        for row, result in enumerate(batch_results):
+            if self.log_matches:
+                logger.info(
+                    "Row %d: found %d instances of ableist language.", row, len(result)
                 )
-            for ableist_term in result:
-                terms[str(ableist_term.start)] = dict()
-                if len(properties) > 0:
-                    for p in properties:
-                        try:
-                            terms[str(ableist_term.start)][p] = str(getattr(ableist_term, p))
-                        except AttributeError:
-                            terms[str(ableist_term.start)][p] = str(getattr(ableist_term.data, p))
-        return terms
+                for i, ableist_term in enumerate(result):
+                    logger.info(
+                        "Row %d match #%d PHRASE: %s | LEMMA: %s | POSITION: %d:%d | "
+                        "ALTERNATIVES: %s | EXAMPLE: %s",
+                        row,
+                        i + 1,
+                        ableist_term,
+                        ableist_term.lemma,
+                        ableist_term.start,
+                        ableist_term.end,
+                        ableist_term.data.alternative_verbs,
+                        ableist_term.data.example,
+                    )
+            results.append([ableist_term.to_dict() for ableist_term in result])
+        return results
+
+
+def build_artifacts(
+    artifacts_dir: str,
+    model_name: Optional[str] = None,
+    wordlist_csv_path: str = ableist_word_list.WORDLIST_CSV_PATH,
+) -> Dict[str, str]:
+    """Write the spaCy pipeline, wordlist and matcher patterns used by the detector
+    to a directory, to be packaged with the mlflow model.
+
+    Parameters
+    ----------
+    artifacts_dir : str
+        Directory to write the artifacts to
+    model_name : Optional[str], optional
+        spaCy pipeline to package, by default None (the default pipeline)
+    wordlist_csv_path : str, optional
+        Wordlist csv to package, by default the csv packaged with the detector
+
+    Returns
+    -------
+    Dict[str, str]
+        Artifact paths keyed by artifact name, as expected by `save_model`
+    """
+    nlp = spacy_models.get_nlp(model_name)
+    spacy_model_path = os.path.join(artifacts_dir, "spacy_model")
+    nlp.to_disk(spacy_model_path)
+
+    ableist_verbs = ableist_word_list.load_ableist_verbs(wordlist_csv_path)
+    fingerprint = ableist_word_list.get_wordlist_fingerprint(ableist_verbs)
+    compiled = detector.compile_wordlist(ableist_verbs, nlp.vocab, fingerprint)
+    patterns_path = os.path.join(artifacts_dir, "matcher_patterns.json")
+    with open(patterns_path, "w") as patterns_file:
+        json.dump(
+            {"fingerprint": fingerprint, "patterns": compiled.patterns}, patterns_file
+        )
+
+    return {
+        "spacy_model": spacy_model_path,
+        "wordlist": wordlist_csv_path,
+        "matcher_patterns": patterns_path,
+    }
+
+
+def save_detector_model(
+    model_path: str, model_name: Optional[str] = None, workers: int = 0
+) -> None:
+    """Save the detector as an mlflow model with its pipeline, wordlist and matcher
+    patterns as artifacts.
+
+    Parameters
+    ----------
+    model_path : str
+        Directory to save the model to; must not exist yet
+    model_name : Optional[str], optional
+        spaCy pipeline to package, by default None (the default pipeline)
+    workers : int, optional
+        Number of worker processes the loaded model processes rows in, by default 0
+        (process rows in the serving process)
+    """
+    with tempfile.TemporaryDirectory() as artifacts_dir:
+        mlflow.pyfunc.save_model(
+            path=model_path,
+            python_model=MLflowLanguageModel(workers=workers),
+            artifacts=build_artifacts(artifacts_dir, model_name),
+        )
 
 
 @click.command()
@@ -55,18 +203,30 @@ class MLflowLanguageModel(mlflow.pyfunc.PythonModel):
     required=False,
     help="Path to file containing the job description text.",
 )
-def main(train_only, job_description_file):
+@click.option(
+    "--model_name",
+    "-m",
+    type=str,
+    required=False,
+    help="spaCy pipeline name or path to package with the model.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Number of worker processes the saved model processes rows in.",
+)
+def main(train_only, job_description_file, model_name, workers):
     model_path = "detector_model"
 
     # Construct and save the model if one does not exist
-    try:
-        analyzer = MLflowLanguageModel(find_ableist_language)
-        mlflow.pyfunc.save_model(path=model_path, python_model=analyzer)
-        print("Generating new model in path {}".format(model_path))
-
-    except:
+    if os.path.exists(model_path):
         print("Existing model in path {}".format(model_path))
-        pass
+    else:
+        save_detector_model(model_path, model_name, workers)
+        print("Generating new model in path {}".format(model_path))
 
     if train_only is False:
         # Load the model in `python_function` format
@@ -75,7 +235,7 @@ def main(train_only, job_description_file):
         with open(job_description_file, "r") as jd_file:
             job_description_text = jd_file.read()
 
-        data = pd.DataFrame({'data': [job_description_text]})
+        data = pd.DataFrame({"data": [job_description_text]})
 
         local_output = local_model.predict(data)
         pprint.pprint(local_output)
@@ -0,0 +1,225 @@
+"""Module to reuse detector results across near-duplicate job descriptions, e.g. the
+same posting reposted with a different location, salary line or company name.
+"""
+
+import hashlib
+import re
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set
+
+import numpy as np
+
+from ableist_language_detector import detector
+from ableist_language_detector.segmentation import split_paragraphs
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_SHINGLE_WORD_PATTERN = re.compile(r"\w+")
+
+
+class MinHasher:
+    """MinHash signatures over word shingles. The fraction of equal signature values
+    of two documents estimates the Jaccard similarity of their shingle sets.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        generator = np.random.RandomState(seed)
+        # Universal hash functions (a * x + b) mod p; with 32 bit x and 31 bit a, b
+        # the products fit in 64 bits
+        self._a = generator.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> Set[str]:
+        """Return the set of lowercase word n-grams of a text."""
+        words = _SHINGLE_WORD_PATTERN.findall(text.lower())
+        if len(words) < self.shingle_size:
+            return {" ".join(words)}
+        return {
+            " ".join(words[i : i + self.shingle_size])
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+
+    def signature(self, text: str) -> np.ndarray:
+        """Return the MinHash signature of a text."""
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in self.shingles(text)),
+            dtype=np.uint64,
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return permuted.min(axis=0)
+
+
+class MinHashLSH:
+    """Locality sensitive hashing index over MinHash signatures. Signatures are split
+    into bands; documents that share any identical band become candidates.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32):
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands.")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, Set[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def insert(self, key: Hashable, signature: np.ndarray) -> None:
+        """Add a document signature to the index."""
+        self._signatures[key] = signature
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a document from the index."""
+        signature = self._signatures.pop(key)
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            keys = bucket[band_key]
+            keys.discard(key)
+            if not keys:
+                del bucket[band_key]
+
+    def query(self, signature: np.ndarray, threshold: float) -> Optional[Hashable]:
+        """Return the indexed document most similar to the signature, if its
+        estimated Jaccard similarity is at least the threshold.
+        """
+        candidates = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(band_key, ()))
+        best_key, best_similarity = None, threshold
+        for key in candidates:
+            similarity = float(np.mean(self._signatures[key] == signature))
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
+
+
+@dataclass
+class NearDuplicateStats:
+    """Counts of documents and paragraphs handled by a NearDuplicateDetector."""
+
+    documents: int = 0
+    near_duplicates: int = 0
+    paragraphs_reused: int = 0
+    paragraphs_analyzed: int = 0
+
+    @property
+    def paragraph_reuse_rate(self) -> float:
+        """Fraction of paragraphs whose results were reused."""
+        paragraphs = self.paragraphs_reused + self.paragraphs_analyzed
+        if paragraphs == 0:
+            return 0.0
+        return self.paragraphs_reused / paragraphs
+
+
+class NearDuplicateDetector:
+    """Detector that remembers the paragraphs of recently analyzed documents. When a
+    new document is a near duplicate of one of them, only the paragraphs that changed
+    are analyzed; results of unchanged paragraphs are reused with their offsets moved
+    to their new position.
+
+    Every document is analyzed paragraph by paragraph, whether or not it is a near
+    duplicate, so its result does not depend on which documents came before it.
+    Results can differ slightly from `detector.find_ableist_language`, which parses
+    the whole document at once.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 32,
+        max_documents: int = 100000,
+    ):
+        self.threshold = threshold
+        self.max_documents = max_documents
+        self.stats = NearDuplicateStats()
+        self._hasher = MinHasher(num_perm=num_perm)
+        self._lsh = MinHashLSH(num_perm=num_perm, bands=bands)
+        # Paragraph results of indexed documents keyed by paragraph hash, oldest first
+        self._documents: "OrderedDict[int, Dict[bytes, detector.SegmentResult]]" = (
+            OrderedDict()
+        )
+        self._next_key = 0
+
+    @staticmethod
+    def _paragraph_key(paragraph: str) -> bytes:
+        return hashlib.blake2b(paragraph.encode("utf-8"), digest_size=16).digest()
+
+    def find_ableist_language(
+        self, job_description_text: str
+    ) -> List[detector.AbleistLanguageMatch]:
+        """Find ableist language in a document, reusing the paragraph results of the
+        most similar previously analyzed document.
+
+        Parameters
+        ----------
+        job_description_text : str
+            Job description text
+
+        Returns
+        -------
+        List[detector.AbleistLanguageMatch]
+            Matches with positions relative to the document
+        """
+        paragraphs = split_paragraphs(job_description_text)
+        paragraph_keys = [self._paragraph_key(paragraph) for paragraph in paragraphs]
+        signature = self._hasher.signature(job_description_text)
+
+        known_paragraphs = {}
+        duplicate_key = self._lsh.query(signature, self.threshold)
+        if duplicate_key is not None:
+            self.stats.near_duplicates += 1
+            known_paragraphs = self._documents[duplicate_key]
+            self._documents.move_to_end(duplicate_key)
+
+        new_paragraphs = [
+            paragraph
+            for paragraph, key in zip(paragraphs, paragraph_keys)
+            if key not in known_paragraphs
+        ]
+        new_results = detector.analyze_segments(new_paragraphs)
+        segment_results = {}
+        for key in paragraph_keys:
+            if key not in segment_results:
+                if key in known_paragraphs:
+                    segment_results[key] = known_paragraphs[key]
+                    self.stats.paragraphs_reused += 1
+                else:
+                    segment_results[key] = next(new_results)
+                    self.stats.paragraphs_analyzed += 1
+            else:
+                self.stats.paragraphs_reused += 1
+        self.stats.documents += 1
+
+        self._index(signature, segment_results)
+        return detector.stitch_segments(segment_results[key] for key in paragraph_keys)
+
+    def find_ableist_language_batch(
+        self, job_description_texts: Iterable[str]
+    ) -> Iterator[List[detector.AbleistLanguageMatch]]:
+        """Yield the result of `find_ableist_language` for each document, in input
+        order; each document can reuse the results of any earlier one.
+        """
+        for job_description_text in job_description_texts:
+            yield self.find_ableist_language(job_description_text)
+
+    def _index(
+        self,
+        signature: np.ndarray,
+        segment_results: Dict[bytes, detector.SegmentResult],
+    ) -> None:
+        key = self._next_key
+        self._next_key += 1
+        self._lsh.insert(key, signature)
+        self._documents[key] = segment_results
+        while len(self._documents) > self.max_documents:
+            oldest_key, _ = self._documents.popitem(last=False)
+            self._lsh.remove(oldest_key)
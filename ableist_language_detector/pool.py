@@ -0,0 +1,276 @@
+"""Module with a process pool whose workers share the detector's pipeline and
+matchers with the parent process.
+
+The parent loads the spaCy pipeline and compiles the matchers before it forks the
+workers, so each worker starts ready to process documents and shares the memory
+pages of the pipeline copy-on-write instead of holding its own copy.
+"""
+
+import gc
+import multiprocessing
+import queue
+import threading
+from collections import deque
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+from ableist_language_detector import ableist_word_list, detector, spacy_models
+
+T = TypeVar("T")
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield lists of `size` consecutive items, the last one possibly shorter."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def warm_worker(
+    model_name: Optional[str] = None,
+    exclude: Optional[Sequence[str]] = None,
+    wordlist_path: Optional[str] = None,
+) -> None:
+    """Load the pipeline and compile the matchers before any document.
+
+    Parameters
+    ----------
+    model_name : Optional[str], optional
+        spaCy pipeline to use, see `spacy_models.set_default_model`, by default None
+        (keep the current default)
+    exclude : Optional[Sequence[str]], optional
+        Components excluded from `model_name`, by default None
+    wordlist_path : Optional[str], optional
+        Wordlist to use, see `ableist_word_list.set_default_wordlist`, by default
+        None (keep the current default)
+    """
+    if model_name is not None:
+        spacy_models.set_default_model(model_name, exclude or ())
+    if wordlist_path is not None:
+        ableist_word_list.set_default_wordlist(wordlist_path)
+    list(detector.find_ableist_language_batch([detector.WARMUP_TEXT]))
+
+
+# Number of started pools that rely on the heap frozen by `gc.freeze`; freezing is
+# process wide, so the heap is only unfrozen once the last of them is closed
+_frozen_pools = 0
+_freeze_lock = threading.Lock()
+
+
+def _freeze_heap() -> None:
+    global _frozen_pools
+    with _freeze_lock:
+        # Move everything allocated so far out of the garbage collector's view, so
+        # collections in the workers do not touch, and thereby copy, shared pages
+        gc.collect()
+        gc.freeze()
+        _frozen_pools += 1
+
+
+def _unfreeze_heap() -> None:
+    global _frozen_pools
+    with _freeze_lock:
+        _frozen_pools -= 1
+        if _frozen_pools == 0:
+            gc.unfreeze()
+
+
+def detect_texts(
+    texts: List[str], prefilter: bool = False
+) -> List[List[detector.AbleistLanguageMatch]]:
+    """Find ableist language in a chunk of job descriptions.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Job description texts
+    prefilter : bool, optional
+        Skip parsing documents without candidate words, by default False
+
+    Returns
+    -------
+    List[List[detector.AbleistLanguageMatch]]
+        List of matched ableist language for each text, in input order
+    """
+    return list(
+        detector.find_ableist_language_batch(
+            texts, batch_size=max(len(texts), 1), prefilter=prefilter
+        )
+    )
+
+
+class DetectorPool:
+    """Pool of worker processes that run the detector.
+
+    Parameters
+    ----------
+    processes : Optional[int], optional
+        Number of worker processes, by default None (one per CPU)
+    chunk_size : int, optional
+        Number of documents sent to a worker at a time by
+        `find_ableist_language_batch`; larger chunks spread the cost of sending
+        documents and results between processes over more documents, by default 64
+    max_tasks_per_child : Optional[int], optional
+        Number of chunks a worker processes before it is replaced by a fresh fork of
+        the parent, which caps memory growth of long running workers, by default 100.
+        None keeps workers for the lifetime of the pool.
+    prefilter : bool, optional
+        Skip parsing documents without candidate words, by default False
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        chunk_size: int = 64,
+        max_tasks_per_child: Optional[int] = 100,
+        prefilter: bool = False,
+    ):
+        self.processes = processes or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self.max_tasks_per_child = max_tasks_per_child
+        self.prefilter = prefilter
+        self._pool = None
+        self._frozen = False
+
+    def start(self) -> "DetectorPool":
+        """Preload the pipeline and matchers and start the workers."""
+        if self._pool is not None:
+            return self
+        warm_worker()
+        if "fork" in multiprocessing.get_all_start_methods():
+            _freeze_heap()
+            self._frozen = True
+            context = multiprocessing.get_context("fork")
+            initializer = None
+            initargs = ()
+        else:
+            # Spawned workers start from a fresh interpreter, so they are given the
+            # pipeline and wordlist configured in this process
+            context = multiprocessing.get_context("spawn")
+            initializer = warm_worker
+            model_name, exclude = spacy_models.get_default_model()
+            initargs = (
+                model_name,
+                exclude,
+                ableist_word_list.get_default_wordlist_path(),
+            )
+        self._pool = context.Pool(
+            self.processes,
+            initializer=initializer,
+            initargs=initargs,
+            maxtasksperchild=self.max_tasks_per_child,
+        )
+        return self
+
+    def _stopped(self) -> None:
+        self._pool = None
+        if self._frozen:
+            self._frozen = False
+            _unfreeze_heap()
+
+    def close(self) -> None:
+        """Wait for submitted work to finish and stop the workers."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._stopped()
+
+    def terminate(self) -> None:
+        """Stop the workers immediately."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._stopped()
+
+    def __enter__(self) -> "DetectorPool":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def imap(
+        self, function: Callable[..., T], items: Iterable, ordered: bool = True
+    ) -> Iterator[T]:
+        """Apply a function to each item in the workers. At most two items per worker
+        are in flight at any time, so memory use does not depend on the number of
+        items.
+
+        Parameters
+        ----------
+        function : Callable[..., T]
+            Picklable function, e.g. a module level function or a `partial` of one
+        items : Iterable
+            Items to apply the function to, e.g. chunks of documents; may be a
+            generator
+        ordered : bool, optional
+            If true, results are yielded in input order; otherwise each result is
+            yielded as soon as it is done, by default True
+
+        Yields
+        ------
+        Iterator[T]
+            Result of the function for each item
+        """
+        self.start()
+        max_pending = 2 * self.processes
+        if ordered:
+            pending = deque()
+            for item in items:
+                pending.append(self._pool.apply_async(function, (item,)))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+            return
+
+        done = queue.SimpleQueue()
+        n_pending = 0
+        for item in items:
+            self._pool.apply_async(
+                function,
+                (item,),
+                callback=lambda result: done.put((True, result)),
+                error_callback=lambda exc: done.put((False, exc)),
+            )
+            n_pending += 1
+            if n_pending >= max_pending:
+                yield _unwrap(done.get())
+                n_pending -= 1
+        for _ in range(n_pending):
+            yield _unwrap(done.get())
+
+    def find_ableist_language_batch(
+        self, job_description_texts: Iterable[str]
+    ) -> Iterator[List[detector.AbleistLanguageMatch]]:
+        """Parallel version of `detector.find_ableist_language_batch`: documents are
+        sent to the workers in chunks of `chunk_size`.
+
+        Parameters
+        ----------
+        job_description_texts : Iterable[str]
+            Job description texts; may be a generator
+
+        Yields
+        ------
+        Iterator[List[detector.AbleistLanguageMatch]]
+            List of matched ableist language for each input document, in input order
+        """
+        for chunk_results in self.imap(
+            partial(detect_texts, prefilter=self.prefilter),
+            chunked(job_description_texts, self.chunk_size),
+        ):
+            yield from chunk_results
+
+
+def _unwrap(outcome):
+    succeeded, value = outcome
+    if not succeeded:
+        raise value
+    return value
@@ -0,0 +1,211 @@
+"""Module to cheaply check whether a document could contain any wordlist verb before
+running the spaCy pipeline over it.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterator, Set
+
+from ableist_language_detector.ableist_word_list import AbleistLanguage
+
+# Irregular past tense and past participle forms; regular forms are generated by rule
+IRREGULAR_VERB_FORMS = {
+    "be": ["am", "is", "are", "was", "were", "been"],
+    "bear": ["bore", "borne", "born"],
+    "bend": ["bent"],
+    "bite": ["bit", "bitten"],
+    "blow": ["blew", "blown"],
+    "break": ["broke", "broken"],
+    "bring": ["brought"],
+    "build": ["built"],
+    "buy": ["bought"],
+    "catch": ["caught"],
+    "choose": ["chose", "chosen"],
+    "come": ["came"],
+    "cut": ["cut"],
+    "dig": ["dug"],
+    "do": ["did", "done", "does"],
+    "draw": ["drew", "drawn"],
+    "drink": ["drank", "drunk"],
+    "drive": ["drove", "driven"],
+    "eat": ["ate", "eaten"],
+    "fall": ["fell", "fallen"],
+    "feel": ["felt"],
+    "fight": ["fought"],
+    "find": ["found"],
+    "fly": ["flew", "flown"],
+    "get": ["got", "gotten"],
+    "give": ["gave", "given"],
+    "go": ["went", "gone", "goes"],
+    "grip": ["gripped"],
+    "grow": ["grew", "grown"],
+    "hang": ["hung"],
+    "have": ["has", "had"],
+    "hear": ["heard"],
+    "hide": ["hid", "hidden"],
+    "hit": ["hit"],
+    "hold": ["held"],
+    "keep": ["kept"],
+    "kneel": ["knelt"],
+    "know": ["knew", "known"],
+    "lay": ["laid"],
+    "lead": ["led"],
+    "lean": ["leant"],
+    "leap": ["leapt"],
+    "leave": ["left"],
+    "lie": ["lay", "lain"],
+    "make": ["made"],
+    "meet": ["met"],
+    "put": ["put"],
+    "read": ["read"],
+    "ride": ["rode", "ridden"],
+    "ring": ["rang", "rung"],
+    "rise": ["rose", "risen"],
+    "run": ["ran"],
+    "say": ["said"],
+    "see": ["saw", "seen"],
+    "seek": ["sought"],
+    "send": ["sent"],
+    "set": ["set"],
+    "shake": ["shook", "shaken"],
+    "shoot": ["shot"],
+    "shut": ["shut"],
+    "sing": ["sang", "sung"],
+    "sink": ["sank", "sunk"],
+    "sit": ["sat"],
+    "sleep": ["slept"],
+    "slide": ["slid"],
+    "smell": ["smelt"],
+    "speak": ["spoke", "spoken"],
+    "spend": ["spent"],
+    "spin": ["spun"],
+    "stand": ["stood"],
+    "steal": ["stole", "stolen"],
+    "stick": ["stuck"],
+    "sting": ["stung"],
+    "strike": ["struck", "stricken"],
+    "swim": ["swam", "swum"],
+    "swing": ["swung"],
+    "take": ["took", "taken"],
+    "teach": ["taught"],
+    "tear": ["tore", "torn"],
+    "tell": ["told"],
+    "think": ["thought"],
+    "throw": ["threw", "thrown"],
+    "understand": ["understood"],
+    "wake": ["woke", "woken"],
+    "wear": ["wore", "worn"],
+    "win": ["won"],
+    "write": ["wrote", "written"],
+}
+
+_VOWELS = set("aeiou")
+_SIBILANT_ENDINGS = ("s", "x", "z", "ch", "sh", "o")
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+
+def _ends_cvc(word: str) -> bool:
+    """Return True if the word ends consonant-vowel-consonant, e.g. "stop", in which
+    case the final consonant may be doubled before a suffix.
+    """
+    return (
+        len(word) >= 3
+        and word[-1] not in _VOWELS
+        and word[-1] not in "wxy"
+        and word[-2] in _VOWELS
+        and word[-3] not in _VOWELS
+    )
+
+
+def inflect_verb(lemma: str) -> Set[str]:
+    """Return the surface forms a verb lemma can take in text (base, third person
+    singular, past tense, past participle and present participle). Forms are generated
+    generously; extra forms only cost a wasted parse, missing forms lose matches.
+
+    Parameters
+    ----------
+    lemma : str
+        Verb in lemma form; for multi-word entries only the first word is inflected
+
+    Returns
+    -------
+    Set[str]
+        Lowercase surface forms, including the lemma itself
+    """
+    verb = lemma.lower().split()[0]
+    forms = {verb}
+    forms.update(IRREGULAR_VERB_FORMS.get(verb, []))
+
+    # Third person singular
+    if verb.endswith(_SIBILANT_ENDINGS):
+        forms.add(verb + "es")
+    elif len(verb) > 1 and verb.endswith("y") and verb[-2] not in _VOWELS:
+        forms.add(verb[:-1] + "ies")
+    forms.add(verb + "s")
+
+    # Past tense and past participle
+    if verb.endswith("e"):
+        forms.add(verb + "d")
+    elif len(verb) > 1 and verb.endswith("y") and verb[-2] not in _VOWELS:
+        forms.add(verb[:-1] + "ied")
+    else:
+        forms.add(verb + "ed")
+    if _ends_cvc(verb):
+        forms.add(verb + verb[-1] + "ed")
+
+    # Present participle
+    if verb.endswith("ie"):
+        forms.add(verb[:-2] + "ying")
+    elif verb.endswith("e") and not verb.endswith(("ee", "ye", "oe")):
+        forms.add(verb[:-1] + "ing")
+    forms.add(verb + "ing")
+    if _ends_cvc(verb):
+        forms.add(verb + verb[-1] + "ing")
+
+    return forms
+
+
+@dataclass
+class PrefilterStats:
+    """Counts of documents checked and skipped by a LexicalPrefilter."""
+
+    documents_checked: int = 0
+    documents_skipped: int = 0
+
+    @property
+    def skip_rate(self) -> float:
+        """Fraction of checked documents that were skipped."""
+        if self.documents_checked == 0:
+            return 0.0
+        return self.documents_skipped / self.documents_checked
+
+
+class LexicalPrefilter:
+    """Single-pass word scan for any surface form of the verbs in a wordlist.
+    Documents without a candidate word cannot produce a match, so they do not need to
+    be parsed.
+    """
+
+    def __init__(self, ableist_verbs: Dict[str, AbleistLanguage]):
+        self.surface_forms = frozenset(
+            form for verb in ableist_verbs for form in inflect_verb(verb)
+        )
+        self.stats = PrefilterStats()
+
+    def iter_candidates(self, text: str) -> Iterator[re.Match]:
+        """Yield the word matches in the text that are surface forms of a wordlist
+        verb. Does not update the filter statistics.
+        """
+        for word in _WORD_PATTERN.finditer(text):
+            if word.group().lower() in self.surface_forms:
+                yield word
+
+    def has_candidates(self, text: str) -> bool:
+        """Return True if the text contains a surface form of any wordlist verb, and
+        record the result in the filter statistics.
+        """
+        found = next(self.iter_candidates(text), None) is not None
+        self.stats.documents_checked += 1
+        if not found:
+            self.stats.documents_skipped += 1
+        return found
@@ -0,0 +1,255 @@
+"""Module to split documents into segments that can be parsed independently and to
+map segment results back to document positions.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Sequence
+
+import spacy
+from spacy.pipeline import Sentencizer
+
+# A paragraph ends after a run of whitespace that contains a blank line
+_PARAGRAPH_BREAK = re.compile(r"\n[^\S\n]*\n\s*")
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Split text into paragraphs at blank lines. Each paragraph keeps the whitespace
+    that follows it, so the paragraphs concatenate back to the original text and each
+    one tokenizes to the same tokens it has within the whole text.
+
+    Parameters
+    ----------
+    text : str
+        Document text
+
+    Returns
+    -------
+    List[str]
+        Paragraph texts, in document order
+    """
+    paragraphs = []
+    start = 0
+    for paragraph_break in _PARAGRAPH_BREAK.finditer(text):
+        if paragraph_break.end() < len(text):
+            paragraphs.append(text[start : paragraph_break.end()])
+            start = paragraph_break.end()
+    if start < len(text) or not paragraphs:
+        paragraphs.append(text[start:])
+    return paragraphs
+
+
+# Candidate window boundaries, from most to least preferred; a boundary is the end of
+# a whitespace run, so text on either side of it tokenizes as it does in the whole.
+# The last resort, for text without whitespace, is the end of a punctuation run.
+_WINDOW_BOUNDARIES = (
+    _PARAGRAPH_BREAK,
+    re.compile(r"(?<=[.!?;:])\s+"),
+    re.compile(r"\s+"),
+    re.compile(r"[^\w\s]+"),
+)
+
+
+@dataclass
+class TextWindow:
+    """Character range of a document processed as one piece. Matches are only kept
+    from the core, `[core_start, core_end)`; the rest of the window is context shared
+    with the neighbouring windows.
+    """
+
+    start: int
+    end: int
+    core_start: int
+    core_end: int
+
+
+def _find_boundary(text: str, lo: int, hi: int, last: bool = True) -> int:
+    """Return the last (or first) boundary in `text[lo:hi]` of the most preferred
+    kind, or `hi` (or `lo`) if there is none.
+    """
+    for boundary_pattern in _WINDOW_BOUNDARIES:
+        boundaries = [
+            boundary.end()
+            for boundary in boundary_pattern.finditer(text, lo, hi)
+            if lo < boundary.end() < hi
+        ]
+        if boundaries:
+            return boundaries[-1] if last else boundaries[0]
+    return hi if last else lo
+
+
+def _find_core_end(text: str, core_start: int, window_chars: int) -> int:
+    """Return the end of a core of at most `window_chars` starting at `core_start`:
+    the last boundary of the most preferred kind in the second half of the range,
+    else the last boundary anywhere in the range, so the core is only cut inside a
+    token when one token fills the whole range.
+    """
+    hi = core_start + window_chars
+    core_end = _find_boundary(text, core_start + window_chars // 2, hi)
+    if core_end == hi:
+        core_end = _find_boundary(text, core_start, hi)
+    return core_end
+
+
+def iter_windows(
+    text: str, window_chars: int = 100000, overlap_chars: int = 2000
+) -> Iterator[TextWindow]:
+    """Split text into windows whose cores cover the text without overlapping. Cores
+    are at most `window_chars` long and end at a paragraph break where possible,
+    else at the end of a sentence, else at whitespace or punctuation; a core is only
+    cut inside a token longer than `window_chars`. Each window extends its core
+    by up to `overlap_chars` on both sides, starting and ending at boundaries of the
+    same kinds, so matches near the edge of a core are found with context.
+
+    Parameters
+    ----------
+    text : str
+        Document text
+    window_chars : int, optional
+        Maximum length of a core, by default 100000
+    overlap_chars : int, optional
+        Maximum context added to each side of a core, by default 2000
+
+    Yields
+    ------
+    Iterator[TextWindow]
+        Windows in document order
+    """
+    if window_chars < 2:
+        raise ValueError(f"window_chars ({window_chars}) must be at least 2.")
+    core_start = 0
+    while core_start < len(text) or core_start == 0:
+        if len(text) - core_start <= window_chars:
+            core_end = len(text)
+        else:
+            core_end = _find_core_end(text, core_start, window_chars)
+        start = core_start
+        if core_start > 0:
+            start = _find_boundary(
+                text, max(core_start - overlap_chars, 0), core_start, last=False
+            )
+        end = core_end
+        if core_end < len(text):
+            end = _find_boundary(
+                text, core_end, min(core_end + overlap_chars, len(text))
+            )
+        yield TextWindow(start, end, core_start, core_end)
+        if core_end == len(text):
+            return
+        core_start = core_end
+
+
+@lru_cache(maxsize=None)
+def get_sentencizer() -> Sentencizer:
+    """Return a shared rule-based sentencizer, which splits sentences on punctuation
+    without running the tagger or parser.
+    """
+    return Sentencizer()
+
+
+def split_sentences(spacy_doc: spacy.tokens.Doc) -> List[spacy.tokens.Span]:
+    """Split a tokenized document into sentences with the rule-based sentencizer.
+
+    Parameters
+    ----------
+    spacy_doc : spacy.tokens.Doc
+        spacy doc; only needs to be tokenized, e.g. with `nlp.make_doc`
+
+    Returns
+    -------
+    List[spacy.tokens.Span]
+        Sentence spans
+    """
+    return list(get_sentencizer()(spacy_doc).sents)
+
+
+def select_spans(
+    spans: Sequence[spacy.tokens.Span], char_positions: Iterable[int]
+) -> List[spacy.tokens.Span]:
+    """Return the spans that contain at least one of the given character positions.
+
+    Parameters
+    ----------
+    spans : Sequence[spacy.tokens.Span]
+        Non-overlapping spans in document order
+    char_positions : Iterable[int]
+        Character positions in ascending order
+
+    Returns
+    -------
+    List[spacy.tokens.Span]
+        Selected spans in document order
+    """
+    selected = []
+    span_iter = iter(spans)
+    span = next(span_iter, None)
+    for char_position in char_positions:
+        while span is not None and span.end_char <= char_position:
+            span = next(span_iter, None)
+        if span is None:
+            break
+        if span.start_char <= char_position and (
+            not selected or selected[-1] is not span
+        ):
+            selected.append(span)
+    return selected
+
+
+def span_to_doc(span: spacy.tokens.Span) -> spacy.tokens.Doc:
+    """Copy the tokens of a span into a new, unannotated doc. Unlike `Span.as_doc`,
+    no sentence boundaries or other annotations are carried over, so the pipeline
+    processes the new doc as if it had tokenized the text itself.
+
+    Parameters
+    ----------
+    span : spacy.tokens.Span
+        Span of a tokenized doc
+
+    Returns
+    -------
+    spacy.tokens.Doc
+        Doc with the same tokens and whitespace as the span
+    """
+    return spacy.tokens.Doc(
+        span.doc.vocab,
+        words=[token.text for token in span],
+        spaces=[bool(token.whitespace_) for token in span],
+    )
+
+
+def apply_pipeline(
+    nlp: spacy.language.Language,
+    docs: Iterable[spacy.tokens.Doc],
+    batch_size: int = 64,
+) -> Iterator[spacy.tokens.Doc]:
+    """Run the pipeline components over docs that are already tokenized, so their
+    tokens, and therefore their token offsets, are kept as is.
+
+    Parameters
+    ----------
+    nlp : spacy.language.Language
+        spaCy pipeline
+    docs : Iterable[spacy.tokens.Doc]
+        Tokenized docs
+    batch_size : int, optional
+        Number of docs processed together by each component, by default 64
+
+    Yields
+    ------
+    Iterator[spacy.tokens.Doc]
+        Processed docs, in input order
+    """
+    for _, proc in nlp.pipeline:
+        if hasattr(proc, "pipe"):
+            docs = proc.pipe(docs, batch_size=batch_size)
+        else:
+            docs = _call_component(proc, docs)
+    yield from docs
+
+
+def _call_component(proc, docs: Iterable[spacy.tokens.Doc]):
+    # Bind the component in its own generator; a generator expression in the loop
+    # above would look up `proc` lazily and only ever call the last component
+    for doc in docs:
+        yield proc(doc)
@@ -0,0 +1,387 @@
+"""Asyncio HTTP server that groups concurrent detector requests into micro-batches."""
+
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, List, Optional, Set, Tuple
+
+import click
+
+from ableist_language_detector import detector, memory
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 50 * 1024 * 1024
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class _RequestTooLarge(ValueError):
+    pass
+
+
+def detect_batch(texts: List[str]) -> List[List[dict]]:
+    """Find ableist language in a batch of job descriptions.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Job description texts
+
+    Returns
+    -------
+    List[List[dict]]
+        One list of matches per text, with the keys of `AbleistLanguageMatch.to_dict`
+    """
+    results = [
+        [match.to_dict() for match in result]
+        for result in detector.find_ableist_language_batch(
+            texts, batch_size=max(len(texts), 1)
+        )
+    ]
+    memory.record_documents(len(texts))
+    return results
+
+
+def warm_worker(
+    max_documents: Optional[int] = None, max_rss_mb: Optional[float] = None
+) -> None:
+    """Load the pipeline and compile the matchers in a worker before any request,
+    and enable reloading the pipeline if either memory limit is set (see
+    `memory.VocabManager`).
+    """
+    if max_documents is not None or max_rss_mb is not None:
+        memory.configure(max_documents=max_documents, max_rss_mb=max_rss_mb)
+    detect_batch([detector.WARMUP_TEXT])
+
+
+class MicroBatcher:
+    """Collect texts submitted by concurrent requests into batches of at most
+    `max_batch_size` texts, waiting at most `max_wait_ms` after the first text of a
+    batch arrives, and process each batch in an executor.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[str]], list],
+        executor: Optional[Executor] = None,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 10.0,
+        max_concurrent_batches: int = 1,
+    ):
+        self.process_batch = process_batch
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._max_concurrent_batches = max_concurrent_batches
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._task: Optional[asyncio.Task] = None
+        # Batches being processed; references are kept so the tasks are not garbage
+        # collected while running
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start collecting batches; must be called from the running event loop."""
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self._max_concurrent_batches)
+        self._task = asyncio.create_task(self._collect())
+
+    async def stop(self) -> None:
+        """Stop collecting batches and wait for the batches being processed."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches)
+
+    async def submit(self, texts: List[str]) -> list:
+        """Queue texts for processing and wait for their results.
+
+        Parameters
+        ----------
+        texts : List[str]
+            Texts from a single request
+
+        Returns
+        -------
+        list
+            One result per text, in input order
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._queue.put_nowait((text, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        # A pending get is kept across batches rather than cancelled on timeout, so
+        # an item that arrives just as the wait times out is never lost
+        getter = None
+        try:
+            while True:
+                if getter is None:
+                    getter = asyncio.ensure_future(self._queue.get())
+                batch = [await getter]
+                getter = None
+                deadline = loop.time() + self.max_wait
+                # While every executor slot is busy, keep the queue filling up so the
+                # next batch is larger instead of queueing many small batches
+                await self._slots.acquire()
+                while len(batch) < self.max_batch_size:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    getter = asyncio.ensure_future(self._queue.get())
+                    done, _ = await asyncio.wait({getter}, timeout=timeout)
+                    if not done:
+                        break
+                    batch.append(getter.result())
+                    getter = None
+                dispatch = asyncio.create_task(self._dispatch(batch))
+                self._dispatches.add(dispatch)
+                dispatch.add_done_callback(self._dispatches.discard)
+        finally:
+            if getter is not None:
+                getter.cancel()
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor, self.process_batch, [text for text, _ in batch]
+            )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+
+class DetectorServer:
+    """Minimal HTTP/1.1 server with the same `/invocations` payload as the mlflow
+    model server: `{"data": [<job description>, ...]}` in, one list of matches per
+    job description out.
+    """
+
+    def __init__(self, batcher: MicroBatcher):
+        self.batcher = batcher
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests on a connection until the client closes it."""
+        try:
+            keep_alive = True
+            while keep_alive:
+                request = await self._read_request(reader, writer)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, payload = await self._route(method, path, body)
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except _RequestTooLarge:
+            self._write_response(writer, 413, {"error": "Request too large."}, False)
+        except ValueError:
+            self._write_response(writer, 400, {"error": "Malformed request."}, False)
+        finally:
+            writer.close()
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        content_length = int(headers.get("content-length", 0))
+        if content_length > MAX_BODY_BYTES:
+            raise _RequestTooLarge()
+        if headers.get("expect", "").lower() == "100-continue":
+            # curl asks before sending bodies over 1kB and otherwise waits a second
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            await writer.drain()
+        body = await reader.readexactly(content_length) if content_length else b""
+        return method, path.split("?", 1)[0], headers, body
+
+    async def _route(self, method: str, path: str, body: bytes):
+        if path in ("/ping", "/health"):
+            return 200, {"status": "ok"}
+        if path == "/metrics":
+            # Reported by the worker that picks up the call
+            loop = asyncio.get_running_loop()
+            try:
+                return 200, await loop.run_in_executor(
+                    self.batcher.executor, memory.get_metrics
+                )
+            except Exception:
+                logger.exception("Failed to collect metrics.")
+                return 500, {"error": "Failed to collect metrics."}
+        if path != "/invocations":
+            return 404, {"error": f"Unknown path {path}."}
+        if method != "POST":
+            return 405, {"error": "Use POST."}
+        try:
+            # strict=False accepts the raw newlines that predictAPI.sh sends
+            texts = json.loads(body.decode("utf-8"), strict=False)["data"]
+            if isinstance(texts, str):
+                texts = [texts]
+            texts = [str(text) for text in texts]
+        except (ValueError, KeyError, TypeError):
+            return 400, {"error": 'Expected a JSON body like {"data": ["..."]}.'}
+        try:
+            return 200, await self.batcher.submit(texts)
+        except Exception:
+            logger.exception("Failed to process request.")
+            return 500, {"error": "Failed to process request."}
+
+    @staticmethod
+    def _write_response(
+        writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool
+    ) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        headers = [
+            f"HTTP/1.1 {status} {_REASONS[status]}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+
+
+async def serve(
+    host: str,
+    port: int,
+    workers: int,
+    max_batch_size: int,
+    max_wait_ms: float,
+    max_documents_per_vocab: Optional[int] = None,
+    max_rss_mb: Optional[float] = None,
+) -> None:
+    """Start the micro-batching server and serve until cancelled."""
+    memory_limits = (max_documents_per_vocab, max_rss_mb)
+    if workers > 0:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=warm_worker, initargs=memory_limits
+        )
+    else:
+        # Process batches in a thread of this process
+        warm_worker(*memory_limits)
+        executor = None
+    batcher = MicroBatcher(
+        detect_batch,
+        executor=executor,
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms,
+        max_concurrent_batches=max(workers, 1),
+    )
+    await batcher.start()
+    server = await asyncio.start_server(
+        DetectorServer(batcher).handle_connection, host, port
+    )
+    logger.info("Serving on %s:%d", host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+        if executor is not None:
+            executor.shutdown()
+
+
+@click.command()
+@click.option("--host", type=str, default="0.0.0.0", show_default=True)
+@click.option("--port", "-p", type=int, default=1234, show_default=True)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of worker processes; 0 processes batches in a thread instead.",
+)
+@click.option(
+    "--max_batch_size",
+    type=int,
+    default=64,
+    show_default=True,
+    help="Maximum number of job descriptions processed together.",
+)
+@click.option(
+    "--max_wait_ms",
+    type=float,
+    default=10.0,
+    show_default=True,
+    help="Maximum time to wait for more job descriptions before processing a batch.",
+)
+@click.option(
+    "--max_documents_per_vocab",
+    type=int,
+    default=None,
+    help="Reload the spaCy pipeline after this many documents to reset its vocab.",
+)
+@click.option(
+    "--max_rss_mb",
+    type=float,
+    default=None,
+    help="Reload the spaCy pipeline when a worker uses more memory than this.",
+)
+def main(
+    host,
+    port,
+    workers,
+    max_batch_size,
+    max_wait_ms,
+    max_documents_per_vocab,
+    max_rss_mb,
+):
+    """Serve the detector over HTTP with micro-batching."""
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(
+        serve(
+            host,
+            port,
+            workers,
+            max_batch_size,
+            max_wait_ms,
+            max_documents_per_vocab,
+            max_rss_mb,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
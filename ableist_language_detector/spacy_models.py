@@ -0,0 +1,103 @@
+"""Module to lazily load spaCy pipelines once per process and share them."""
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import spacy
+
+DEFAULT_MODEL_NAME = "en_core_web_sm"
+# The detector and term extraction only use the tagger, lemmatizer and parser
+DEFAULT_EXCLUDE = ("ner",)
+
+_default_model_name = DEFAULT_MODEL_NAME
+_default_exclude = DEFAULT_EXCLUDE
+_loaded_models: Dict[Tuple[str, Tuple[str, ...]], spacy.language.Language] = {}
+_lock = threading.Lock()
+
+
+def set_default_model(
+    model_name: str = DEFAULT_MODEL_NAME, exclude: Iterable[str] = DEFAULT_EXCLUDE
+) -> None:
+    """Set the spaCy pipeline returned by `get_nlp` when it is called without
+    arguments. Call this before the first document is processed.
+
+    Parameters
+    ----------
+    model_name : str, optional
+        Name of an installed spaCy pipeline package or path to a pipeline directory,
+        by default "en_core_web_sm"
+    exclude : Iterable[str], optional
+        Names of pipeline components that are not loaded, by default ("ner",)
+    """
+    global _default_model_name, _default_exclude
+    _default_model_name = model_name
+    _default_exclude = tuple(exclude)
+
+
+def get_default_model() -> Tuple[str, Tuple[str, ...]]:
+    """Return the model name and excluded components set by `set_default_model`."""
+    return _default_model_name, _default_exclude
+
+
+def get_nlp(
+    model_name: Optional[str] = None, exclude: Optional[Iterable[str]] = None
+) -> spacy.language.Language:
+    """Return the shared spaCy pipeline for a model name and set of excluded
+    components, loading it on first use. Every module in the package gets the same
+    pipeline instance, so each model is only loaded once per process.
+
+    Parameters
+    ----------
+    model_name : Optional[str], optional
+        Name of an installed spaCy pipeline package or path to a pipeline directory,
+        by default None (use the default set by `set_default_model`)
+    exclude : Optional[Iterable[str]], optional
+        Names of pipeline components that are not loaded, which saves load time and
+        memory, by default None (use the default set by `set_default_model`)
+
+    Returns
+    -------
+    spacy.language.Language
+        Loaded spaCy pipeline
+    """
+    if model_name is None:
+        model_name = _default_model_name
+    exclude = _default_exclude if exclude is None else tuple(exclude)
+    key = (model_name, tuple(sorted(exclude)))
+
+    nlp = _loaded_models.get(key)
+    if nlp is None:
+        with _lock:
+            # Another thread may have loaded the model while we waited for the lock
+            nlp = _loaded_models.get(key)
+            if nlp is None:
+                nlp = spacy.load(model_name, exclude=list(key[1]))
+                _loaded_models[key] = nlp
+    return nlp
+
+
+def get_model_fingerprint(nlp: spacy.language.Language) -> str:
+    """Return an identifier that changes whenever the pipeline's results could
+    change: the pipeline name and version, the spaCy version and the active
+    components.
+
+    Parameters
+    ----------
+    nlp : spacy.language.Language
+        Loaded spaCy pipeline
+
+    Returns
+    -------
+    str
+        Pipeline fingerprint
+    """
+    return (
+        f"{nlp.meta.get('lang')}_{nlp.meta.get('name')}-{nlp.meta.get('version')}"
+        f"|spacy-{spacy.__version__}|{','.join(nlp.pipe_names)}"
+    )
+
+
+def clear_models() -> None:
+    """Drop all loaded pipelines so they are reloaded on next use."""
+    with _lock:
+        _loaded_models.clear()
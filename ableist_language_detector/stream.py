@@ -0,0 +1,250 @@
+"""Command line tool to stream many job descriptions through the detector, reading
+JSON lines or file paths from stdin and writing one JSON result per line to stdout.
+"""
+
+import glob
+import json
+import sys
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import click
+
+from ableist_language_detector import detector
+from ableist_language_detector.pool import DetectorPool, chunked
+
+INPUT_FORMATS = ("jsonl", "paths")
+_GLOB_CHARACTERS = set("*?[")
+
+Record = Tuple[Any, str]
+T = TypeVar("T")
+
+
+def read_records(
+    lines: Iterable[str],
+    input_format: str = "jsonl",
+    id_field: str = "id",
+    text_field: str = "text",
+) -> Iterator[Record]:
+    """Read (id, text) records from lines of input, lazily.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        Input lines, e.g. `sys.stdin`
+    input_format : str, optional
+        "jsonl" if each line is a JSON object with an id and a text field, or "paths"
+        if each line is the path of a text file or a glob pattern matching text files,
+        by default "jsonl"
+    id_field : str, optional
+        Name of the id field of JSON objects, by default "id". Objects without it get
+        their line number as id.
+    text_field : str, optional
+        Name of the text field of JSON objects, by default "text"
+
+    Yields
+    ------
+    Iterator[Record]
+        (id, text) for each document; the id of a file is its path
+    """
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(
+            f"Unknown input format {input_format!r}; expected one of {INPUT_FORMATS}."
+        )
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        if input_format == "jsonl":
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"Line {line_number} is not valid JSON: {exc}")
+            if not isinstance(record, dict) or text_field not in record:
+                raise ValueError(
+                    f"Line {line_number} has no {text_field!r} field; set the field "
+                    "name with --text_field."
+                )
+            yield record.get(id_field, line_number), str(record[text_field])
+        else:
+            if _GLOB_CHARACTERS.intersection(line):
+                paths = sorted(glob.glob(line, recursive=True))
+            else:
+                paths = [line]
+            for path in paths:
+                with open(path, "r") as text_file:
+                    yield path, text_file.read()
+
+
+def detect_records(records: List[Record], prefilter: bool = False) -> List[Tuple]:
+    """Find ableist language in a chunk of records.
+
+    Parameters
+    ----------
+    records : List[Record]
+        (id, text) records
+    prefilter : bool, optional
+        Skip parsing documents without candidate words, by default False
+
+    Returns
+    -------
+    List[Tuple]
+        (id, matches) for each record, in input order, with matches serialized with
+        `AbleistLanguageMatch.to_dict`
+    """
+    results = detector.find_ableist_language_batch(
+        (text for _, text in records),
+        batch_size=max(len(records), 1),
+        prefilter=prefilter,
+    )
+    return [
+        (record_id, [match.to_dict() for match in result])
+        for (record_id, _), result in zip(records, results)
+    ]
+
+
+def map_chunks(
+    function: Callable[[list], T],
+    chunks: Iterable[list],
+    workers: int = 0,
+    ordered: bool = True,
+    max_tasks_per_child: Optional[int] = 100,
+) -> Iterator[T]:
+    """Apply a function to each chunk of a stream in a `pool.DetectorPool`. At most
+    two chunks per worker are in flight at any time, so memory use does not depend on
+    the length of the stream.
+
+    Parameters
+    ----------
+    function : Callable[[list], T]
+        Picklable function applied to each chunk
+    chunks : Iterable[list]
+        Chunks of the stream, e.g. from `chunked`
+    workers : int, optional
+        Number of worker processes; 0 processes chunks in this process, by default 0
+    ordered : bool, optional
+        If true, results are yielded in input order; otherwise each result is yielded
+        as soon as it is done, which keeps all workers busy when chunks take uneven
+        time, by default True
+    max_tasks_per_child : Optional[int], optional
+        Number of chunks a worker processes before it is replaced, by default 100
+
+    Yields
+    ------
+    Iterator[T]
+        Result of the function for each chunk
+    """
+    if workers <= 0:
+        for chunk in chunks:
+            yield function(chunk)
+        return
+
+    with DetectorPool(workers, max_tasks_per_child=max_tasks_per_child) as pool:
+        yield from pool.imap(function, chunks, ordered=ordered)
+
+
+def stream_results(
+    records: Iterable[Record],
+    batch_size: int = 64,
+    workers: int = 0,
+    ordered: bool = True,
+    prefilter: bool = False,
+    max_tasks_per_child: Optional[int] = 100,
+) -> Iterator[Tuple]:
+    """Find ableist language in a stream of records, which are read and processed in
+    chunks of `batch_size` with `map_chunks`.
+
+    Parameters
+    ----------
+    records : Iterable[Record]
+        (id, text) records, e.g. from `read_records`
+    batch_size : int, optional
+        Number of documents per chunk, by default 64
+    workers : int, optional
+        Number of worker processes; 0 processes chunks in this process, by default 0
+    ordered : bool, optional
+        If true, results are yielded in input order, by default True
+    prefilter : bool, optional
+        Skip parsing documents without candidate words, by default False
+    max_tasks_per_child : Optional[int], optional
+        Number of chunks a worker processes before it is replaced, by default 100
+
+    Yields
+    ------
+    Iterator[Tuple]
+        (id, matches) for each record
+    """
+    for chunk_results in map_chunks(
+        partial(detect_records, prefilter=prefilter),
+        chunked(records, batch_size),
+        workers=workers,
+        ordered=ordered,
+        max_tasks_per_child=max_tasks_per_child,
+    ):
+        yield from chunk_results
+
+
+@click.command()
+@click.option(
+    "--input_format",
+    "-f",
+    type=click.Choice(INPUT_FORMATS),
+    default="jsonl",
+    show_default=True,
+    help="jsonl: one JSON object per line; paths: one file path or glob per line.",
+)
+@click.option("--id_field", type=str, default="id", show_default=True)
+@click.option("--text_field", type=str, default="text", show_default=True)
+@click.option("--batch_size", "-b", type=int, default=64, show_default=True)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Number of worker processes; 0 processes documents in this process.",
+)
+@click.option(
+    "--unordered",
+    is_flag=True,
+    help="Write results as soon as they are ready instead of in input order.",
+)
+@click.option(
+    "--prefilter",
+    is_flag=True,
+    help="Skip parsing documents without any form of a lexicon verb.",
+)
+@click.option(
+    "--max_tasks_per_child",
+    type=int,
+    default=100,
+    show_default=True,
+    help="Number of batches a worker processes before it is replaced.",
+)
+def main(
+    input_format,
+    id_field,
+    text_field,
+    batch_size,
+    workers,
+    unordered,
+    prefilter,
+    max_tasks_per_child,
+):
+    """Read job descriptions from stdin and write one JSON result per line to
+    stdout, with the input id under the id field and the matches under "matches".
+    """
+    records = read_records(sys.stdin, input_format, id_field, text_field)
+    for record_id, matches in stream_results(
+        records,
+        batch_size=batch_size,
+        workers=workers,
+        ordered=not unordered,
+        prefilter=prefilter,
+        max_tasks_per_child=max_tasks_per_child,
+    ):
+        sys.stdout.write(json.dumps({id_field: record_id, "matches": matches}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
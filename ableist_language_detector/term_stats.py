@@ -0,0 +1,160 @@
+"""Module to rank terms by how strongly they are associated with the abilities rather
+than the skills corpus.
+
+Both corpora are turned into sparse document-term count matrices over a shared
+vocabulary, and every term is scored in one vectorized pass with:
+
+* the weighted log-odds ratio with an informative Dirichlet prior (Monroe, Colaresi
+  and Quinn, 2008), as a z-score; positive scores lean towards abilities, and terms
+  used in both corpora are kept when they are strongly skewed towards one of them
+* the difference of the term's class-level TF-IDF weight in each corpus, for
+  comparison
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import scipy.sparse
+
+# z-score above which a term is considered representative, about p < 0.05
+DEFAULT_MIN_Z = 1.96
+# Total pseudo-count of the Dirichlet prior, spread over terms by overall frequency
+DEFAULT_PRIOR_SIZE = 500.0
+
+
+def build_term_matrices(
+    *corpora: Sequence[Sequence[str]],
+) -> Tuple[List[scipy.sparse.csr_matrix], np.ndarray]:
+    """Build a sparse document-term count matrix for each corpus over their shared
+    vocabulary.
+
+    Parameters
+    ----------
+    *corpora : Sequence[Sequence[str]]
+        Corpora given as one list of terms (e.g. verb lemmas) per document
+
+    Returns
+    -------
+    Tuple[List[scipy.sparse.csr_matrix], np.ndarray]
+        Count matrix of each corpus, with one row per document and one column per
+        term, and the terms of the columns
+    """
+    flat_terms = [
+        term for corpus in corpora for document in corpus for term in document
+    ]
+    codes, vocabulary = pd.factorize(pd.Series(flat_terms, dtype=object))
+    matrices = []
+    offset = 0
+    for corpus in corpora:
+        lengths = np.fromiter((len(document) for document in corpus), dtype=np.int64)
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        indices = codes[offset : offset + indptr[-1]]
+        offset += indptr[-1]
+        matrix = scipy.sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int64), indices, indptr),
+            shape=(len(corpus), len(vocabulary)),
+        )
+        # Repeated terms within a document become one entry with their count
+        matrix.sum_duplicates()
+        matrices.append(matrix)
+    return matrices, np.asarray(vocabulary, dtype=object)
+
+
+def score_terms(
+    abilities_documents: Sequence[Sequence[str]],
+    skills_documents: Sequence[Sequence[str]],
+    prior_size: float = DEFAULT_PRIOR_SIZE,
+) -> pd.DataFrame:
+    """Score every term of the abilities and skills corpora by how strongly it is
+    associated with abilities rather than skills.
+
+    Parameters
+    ----------
+    abilities_documents : Sequence[Sequence[str]]
+        Terms of each ability description
+    skills_documents : Sequence[Sequence[str]]
+        Terms of each skill description
+    prior_size : float, optional
+        Total pseudo-count of the Dirichlet prior; larger values shrink the scores of
+        rare terms more, by default 500
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per term with its count and document frequency in each corpus, the
+        log-odds z-score ("log_odds_z") and the TF-IDF difference ("tfidf_diff"),
+        sorted by z-score from most abilities to most skills leaning
+    """
+    (abilities_matrix, skills_matrix), vocabulary = build_term_matrices(
+        abilities_documents, skills_documents
+    )
+    abilities_counts = np.asarray(abilities_matrix.sum(axis=0), dtype=float).ravel()
+    skills_counts = np.asarray(skills_matrix.sum(axis=0), dtype=float).ravel()
+    abilities_df = np.diff(abilities_matrix.tocsc().indptr)
+    skills_df = np.diff(skills_matrix.tocsc().indptr)
+
+    # Weighted log-odds ratio with an informative Dirichlet prior
+    total_counts = abilities_counts + skills_counts
+    prior = prior_size * total_counts / max(total_counts.sum(), 1.0)
+    abilities_total = abilities_counts.sum()
+    skills_total = skills_counts.sum()
+    abilities_rest = abilities_total + prior_size - abilities_counts - prior
+    skills_rest = skills_total + prior_size - skills_counts - prior
+    # The odds of a term are undefined when it is the only term of the vocabulary;
+    # its score is left at 0
+    defined = (abilities_rest > 0) & (skills_rest > 0)
+    delta = np.zeros(len(vocabulary))
+    delta[defined] = np.log(
+        (abilities_counts[defined] + prior[defined]) / abilities_rest[defined]
+    ) - np.log((skills_counts[defined] + prior[defined]) / skills_rest[defined])
+    variance = 1 / (abilities_counts + prior) + 1 / (skills_counts + prior)
+    log_odds_z = delta / np.sqrt(variance)
+
+    # Class-level TF-IDF: term frequency within each corpus, weighted by the smoothed
+    # inverse document frequency over both corpora
+    n_documents = abilities_matrix.shape[0] + skills_matrix.shape[0]
+    idf = np.log((1 + n_documents) / (1 + abilities_df + skills_df)) + 1
+    tfidf_diff = (
+        abilities_counts / max(abilities_total, 1.0)
+        - skills_counts / max(skills_total, 1.0)
+    ) * idf
+
+    scores = pd.DataFrame(
+        {
+            "term": vocabulary,
+            "abilities_count": abilities_counts.astype(int),
+            "skills_count": skills_counts.astype(int),
+            "abilities_documents": abilities_df,
+            "skills_documents": skills_df,
+            "log_odds_z": log_odds_z,
+            "tfidf_diff": tfidf_diff,
+        }
+    )
+    return scores.sort_values(
+        ["log_odds_z", "term"], ascending=[False, True], ignore_index=True
+    )
+
+
+def select_representative_terms(
+    scores: pd.DataFrame, min_z: float = DEFAULT_MIN_Z
+) -> Tuple[list, list]:
+    """Return the terms whose log-odds z-score leans towards abilities or skills by at
+    least `min_z`, each ordered from the most to the least skewed.
+
+    Parameters
+    ----------
+    scores : pd.DataFrame
+        Term scores returned by `score_terms`
+    min_z : float, optional
+        Minimum absolute z-score, by default 1.96
+
+    Returns
+    -------
+    Tuple[list, list]
+        The first element is a list of abilities terms and the second element is a list
+        of skills terms
+    """
+    abilities_terms = scores.loc[scores.log_odds_z >= min_z, "term"]
+    skills_terms = scores.loc[scores.log_odds_z <= -min_z, "term"]
+    return list(abilities_terms), list(skills_terms[::-1])
@@ -41,6 +41,22 @@ def is_object(token: spacy.tokens.Token) -> bool:
     return False
 
 
+def is_noun(token: spacy.tokens.Token) -> bool:
+    """Return True if the token is a noun, else return False.
+
+    Parameters
+    ----------
+    token : spacy.tokens.Token
+        spacy token
+
+    Returns
+    -------
+    bool
+        True if the token is a noun, else False
+    """
+    return token.pos_ == "NOUN"
+
+
 def get_verbs(spacy_doc: spacy.tokens.Doc) -> List[spacy.tokens.Token]:
     """Return a list of verb lemmas within a given document.
 
@@ -86,4 +102,4 @@ def get_nouns(spacy_doc: spacy.tokens.Doc) -> List[spacy.tokens.Token]:
     List[spacy.tokens.Token]
         A list of tokens
     """
-    return [token for token in spacy_doc if token.pos_ == "NOUN"]
+    return [token for token in spacy_doc if is_noun(token)]
@@ -0,0 +1,86 @@
+"""Compare the speed and accuracy of the detector modes against a full parse."""
+
+import json
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import click
+
+from ableist_language_detector import detector
+
+
+def match_keys(matches: List[detector.AbleistLanguageMatch]) -> Set[Tuple]:
+    """Return the comparable identity of each match."""
+    return {(m.start, m.end, m.data.verb) for m in matches}
+
+
+def load_documents(input_path: str) -> List[Dict]:
+    """Load documents from a directory of .txt files or a JSONL file with a "text"
+    field and an optional "expected" field listing the text of each expected match,
+    repeated for phrases that are expected more than once.
+    """
+    path = Path(input_path)
+    if path.is_dir():
+        return [
+            {"id": txt_path.name, "text": txt_path.read_text()}
+            for txt_path in sorted(path.glob("*.txt"))
+        ]
+    with open(path, "r") as jsonl_file:
+        return [json.loads(line) for line in jsonl_file if line.strip()]
+
+
+@click.command()
+@click.option(
+    "--input_path",
+    "-i",
+    type=str,
+    default="sample_job_descriptions",
+    show_default=True,
+    help=(
+        "Directory of .txt job descriptions, or a JSONL file with a 'text' field and "
+        "an optional 'expected' list of phrases."
+    ),
+)
+@click.option(
+    "--repeat", "-r", type=int, default=5, show_default=True, help="Timing repeats."
+)
+def main(input_path, repeat):
+    """Compare each detector mode with the full parse."""
+    documents = load_documents(input_path)
+    full_results = [detector.find_ableist_language(doc["text"]) for doc in documents]
+
+    for mode in detector.FIND_MODES:
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            results = [
+                detector.find_ableist_language(doc["text"], mode=mode)
+                for doc in documents
+            ]
+        elapsed = (time.perf_counter() - start_time) / repeat
+
+        agree = found = expected = 0
+        labeled_hits = labeled_total = 0
+        for doc, result, full_result in zip(documents, results, full_results):
+            agree += len(match_keys(result) & match_keys(full_result))
+            found += len(result)
+            expected += len(full_result)
+            if "expected" in doc:
+                found_phrases = Counter(match.text for match in result)
+                labeled_hits += sum((Counter(doc["expected"]) & found_phrases).values())
+                labeled_total += len(doc["expected"])
+
+        precision = agree / found if found else 1.0
+        recall = agree / expected if expected else 1.0
+        line = (
+            f"{mode:>10} | {elapsed * 1000:8.1f} ms/pass | "
+            f"precision vs full {precision:.3f} | recall vs full {recall:.3f}"
+        )
+        if labeled_total:
+            line += f" | recall vs labels {labeled_hits / labeled_total:.3f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measure per-document match latency of each match engine as the wordlist grows."""
+
+import random
+import time
+from pathlib import Path
+from typing import Dict
+
+import click
+
+from ableist_language_detector import detector, spacy_models
+from ableist_language_detector.ableist_word_list import (
+    AbleistLanguage,
+    get_ableist_verbs,
+)
+
+
+def synthetic_wordlist(size: int, seed: int = 0) -> Dict[str, AbleistLanguage]:
+    """Return the default wordlist padded to `size` entries with made up verbs, one in
+    four of them object dependent and one in ten a multi-word phrase.
+    """
+    rng = random.Random(seed)
+    ableist_verbs = dict(get_ableist_verbs())
+    i = 0
+    while len(ableist_verbs) < size:
+        verb = f"verb{i}"
+        if i % 10 == 0:
+            verb = f"{verb} for long periods"
+        ableist_verbs[verb] = AbleistLanguage(
+            verb=verb,
+            object_dependent=i % 4 == 0 and i % 10 != 0,
+            alternative_verbs=["alternative"],
+            example="",
+            objects=[f"object{rng.randrange(size)}" for _ in range(3)],
+        )
+        i += 1
+    return ableist_verbs
+
+
+@click.command()
+@click.option(
+    "--input_dir",
+    "-i",
+    type=str,
+    default="sample_job_descriptions",
+    show_default=True,
+    help="Directory of .txt job descriptions.",
+)
+@click.option(
+    "--sizes",
+    "-s",
+    type=int,
+    multiple=True,
+    default=(30, 1000, 10000),
+    show_default=True,
+    help="Wordlist sizes to time.",
+)
+@click.option(
+    "--repeat", "-r", type=int, default=5, show_default=True, help="Timing repeats."
+)
+def main(input_dir, sizes, repeat):
+    """Time matching only, on documents parsed once, for each engine and size."""
+    nlp = spacy_models.get_nlp()
+    docs = [
+        nlp(txt_path.read_text()) for txt_path in sorted(Path(input_dir).glob("*.txt"))
+    ]
+    for size in sizes:
+        ableist_verbs = synthetic_wordlist(size)
+        start_time = time.perf_counter()
+        compiled = detector.compile_wordlist(ableist_verbs, nlp.vocab)
+        compile_seconds = time.perf_counter() - start_time
+
+        for engine in detector.MATCH_ENGINES:
+            start_time = time.perf_counter()
+            for _ in range(repeat):
+                for doc in docs:
+                    detector.match_compiled_wordlist(doc, compiled, engine=engine)
+            elapsed = (time.perf_counter() - start_time) / (repeat * len(docs))
+            print(
+                f"{len(ableist_verbs):>6} entries | {engine:>7} | "
+                f"{elapsed * 1000:8.3f} ms/doc | compiled in {compile_seconds:.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+#!/bin/bash
+
+# Usage: ./serveAsyncAPI.sh [number of worker processes]
+python -m ableist_language_detector.server -p 1234 --host 0.0.0.0 --workers ${1:-1}
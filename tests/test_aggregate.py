@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+"""Tests for aggregate counts."""
+
+import json
+
+import pandas as pd
+
+from ableist_language_detector import aggregate
+
+POSTINGS = [
+    {"employer": "a", "posted": "2021-06-01", "text": "lift boxes and lift crates"},
+    {"employer": "a", "posted": "2021-06-15", "text": "answer calls"},
+    {"employer": "b", "posted": "2021-07-02", "text": "stand and lift boxes"},
+    {"employer": "c", "posted": "2021-07-09", "text": "answer emails"},
+]
+
+
+def test_aggregate_records(tmp_path):
+    """Test that chunked partial counts merge into per group counts."""
+    lines = [json.dumps(posting) for posting in POSTINGS]
+    records = aggregate.read_grouped_records(lines, ["employer"], month_field="posted")
+    counts = aggregate.aggregate_records(
+        records, group_fields=("employer", "month"), batch_size=1
+    )
+    output_path = str(tmp_path / "counts.csv")
+    aggregate.write_counts(counts, output_path)
+    counts_df = pd.read_csv(output_path)
+    # Groups without matches keep their document count in a row without a verb
+    unmatched = counts_df[counts_df.verb.isna()]
+    assert unmatched[["employer", "month"]].values.tolist() == [["c", "2021-07"]]
+    assert unmatched[["matches", "documents", "group_documents"]].values.tolist() == [
+        [0, 0, 1]
+    ]
+
+    counts_df = counts_df.dropna(subset=["verb"]).set_index(
+        ["employer", "month", "verb"]
+    )
+
+    assert counts_df.loc[("a", "2021-06", "lift")].tolist() == [2, 1, 2]
+    assert counts_df.loc[("b", "2021-07", "lift")].tolist() == [1, 1, 1]
+    assert counts_df.loc[("b", "2021-07", "stand")].tolist() == [1, 1, 1]
+    assert len(counts_df) == 3
+
+
+def test_read_grouped_records_with_nested_values():
+    """Test that list and object group values are grouped by their JSON text."""
+    lines = [
+        json.dumps({"tags": ["b", "a"], "site": {"y": 2, "x": 1}, "text": "one"}),
+        json.dumps({"tags": ["b", "a"], "site": {"x": 1, "y": 2}, "text": "two"}),
+    ]
+    records = list(aggregate.read_grouped_records(lines, ["tags", "site"]))
+    assert records == [
+        (('["b", "a"]', '{"x": 1, "y": 2}'), "one"),
+        (('["b", "a"]', '{"x": 1, "y": 2}'), "two"),
+    ]
+    counts = aggregate.LemmaCounts(("tags", "site"))
+    for group, _ in records:
+        counts.add_document(group, [])
+    assert counts.group_documents[records[0][0]] == 2
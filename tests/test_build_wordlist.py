@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""Tests for the precompiled wordlist artifact."""
+
+import pytest
+
+from ableist_language_detector import ableist_word_list, detector
+from ableist_language_detector.build_wordlist import (
+    build_wordlist_artifact,
+    is_artifact_current,
+    validate_wordlist,
+)
+
+
+def test_wordlist_artifact(tmp_path):
+    """Test that the artifact restores the csv wordlist, its fingerprint and the
+    detector results.
+    """
+    artifact_path = str(tmp_path / "ableist_word_list.msgpack")
+    assert not is_artifact_current(artifact_path)
+    fingerprint = build_wordlist_artifact(artifact_path=artifact_path)
+    assert is_artifact_current(artifact_path)
+
+    ableist_verbs = ableist_word_list.load_ableist_verbs()
+    artifact = ableist_word_list.load_wordlist_artifact(artifact_path)
+    assert artifact.ableist_verbs == ableist_verbs
+    assert fingerprint == ableist_word_list.get_wordlist_fingerprint(ableist_verbs)
+
+    text = "must be able to move your hands repeatedly and lift heavy boxes"
+    expected = detector.find_ableist_language(text)
+    ableist_word_list.set_default_wordlist(artifact_path)
+    try:
+        assert ableist_word_list.get_ableist_verbs_fingerprint() == fingerprint
+        assert detector.find_ableist_language(text) == expected
+    finally:
+        ableist_word_list.set_default_wordlist()
+
+
+def test_packaged_wordlist_artifact():
+    """Test that the packaged artifact is up to date and loaded by default."""
+    assert is_artifact_current()
+    artifact = ableist_word_list.get_default_wordlist_artifact()
+    assert artifact is not None
+    assert artifact.ableist_verbs == ableist_word_list.load_ableist_verbs()
+
+
+def test_validate_wordlist(tmp_path):
+    """Test that every invalid entry is reported."""
+    wordlist_csv_path = tmp_path / "ableist_word_list.csv"
+    wordlist_csv_path.write_text(
+        "verb,object_dependent,objects,alternative_verbs,example\n"
+        "climb,False,,ascend,Ascend a ladder\n"
+        "climb,False,,ascend,Ascend a ladder\n"
+        "lift,maybe,,move,Move boxes\n"
+        "move,True,,operate,Operate a machine\n"
+    )
+    with pytest.raises(ValueError) as error:
+        validate_wordlist(str(wordlist_csv_path))
+    message = str(error.value)
+    assert "line 3: duplicate verb 'climb'" in message
+    assert "line 4: Value for object_dependent (maybe)" in message
+    assert "line 5: verb 'move' is object dependent" in message
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""Tests for the resumable bulk runner."""
+
+import json
+
+import pytest
+
+from ableist_language_detector import bulk, detector, spacy_models
+
+TEXTS = [
+    "must be able to move your hands repeatedly",
+    "answer calls from customers",
+    "lift heavy boxes and stand for long periods",
+]
+
+
+def read_results(output_dir, index):
+    with open(bulk.shard_path(str(output_dir), index)) as shard_file:
+        return [json.loads(line) for line in shard_file]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_bulk_job_resumes(tmp_path, workers):
+    """Test that completed shards are skipped and partial shards are continued."""
+    input_path = tmp_path / "postings.jsonl"
+    input_path.write_text(
+        "".join(
+            json.dumps({"posting_id": i, "text": TEXTS[i % len(TEXTS)]}) + "\n"
+            for i in range(7)
+        )
+    )
+    output_dir = tmp_path / "results"
+
+    job = bulk.BulkJob(str(input_path), str(output_dir), 3, id_field="posting_id")
+    progress = job.run(workers=workers, batch_size=2)
+    assert (progress.shards, progress.documents) == (3, 7)
+    expected = [read_results(output_dir, index) for index in range(3)]
+    assert [result["posting_id"] for result in expected[2]] == [6]
+
+    # Simulate a crash while the last two shards were being written
+    manifest_path = output_dir / bulk.MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text())
+    del manifest["completed_shards"]["1"], manifest["completed_shards"]["2"]
+    manifest_path.write_text(json.dumps(manifest))
+    shard_path = bulk.shard_path(str(output_dir), 1)
+    with open(shard_path + ".partial", "w") as partial_file:
+        partial_file.write(json.dumps(expected[1][0]) + "\n" + '{"posting_id": 4, "ma')
+
+    job = bulk.BulkJob(str(input_path), str(output_dir), 3, id_field="posting_id")
+    progress = job.run(workers=workers, batch_size=2)
+    # The document already in the partial file is not processed again
+    assert (progress.shards, progress.documents) == (2, 3)
+    completed_shards = json.loads(manifest_path.read_text())["completed_shards"]
+    assert (
+        completed_shards["1"]["documents"],
+        completed_shards["1"]["processed"],
+    ) == (3, 2)
+    assert [read_results(output_dir, index) for index in range(3)] == expected
+
+    with pytest.raises(ValueError):
+        bulk.BulkJob(str(input_path), str(output_dir), 2, id_field="posting_id")
+
+
+def test_process_shard_long_document(tmp_path):
+    """Test that documents over the pipeline's length limit are parsed in windows
+    instead of failing the shard.
+    """
+    long_text = " ".join(TEXTS) + ". " + " ".join(TEXTS)
+    records = [(0, TEXTS[0]), (1, long_text)]
+    output_dir = tmp_path / "results"
+    output_dir.mkdir()
+    expected = [
+        [match.to_dict() for match in detector.find_ableist_language(text)]
+        for _, text in records
+    ]
+
+    pipeline = spacy_models.get_nlp()
+    max_length = pipeline.max_length
+    pipeline.max_length = len(long_text) // 2
+    try:
+        shard_result = bulk.process_shard(str(output_dir), 0, records)
+    finally:
+        pipeline.max_length = max_length
+    assert shard_result.processed == 2
+    results = [result["matches"] for result in read_results(output_dir, 0)]
+    assert [
+        sorted(matches, key=lambda match: match["start_char"]) for matches in results
+    ] == [
+        sorted(matches, key=lambda match: match["start_char"]) for matches in expected
+    ]
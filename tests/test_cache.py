@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+"""Tests for the result cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ableist_language_detector import detector
+from ableist_language_detector.cache import LRUCache, ResultCache, SQLiteResultStore
+
+
+def test_lru_cache_eviction_and_stats():
+    """Test that the least recently used entry is evicted and lookups are counted."""
+    lru_cache = LRUCache(max_entries=2)
+    lru_cache.put("a", 1)
+    lru_cache.put("b", 2)
+    assert lru_cache.get("a") == 1
+    lru_cache.put("c", 3)
+    assert lru_cache.get("b") is None
+    assert lru_cache.get("c") == 3
+    assert len(lru_cache) == 2
+    assert (lru_cache.stats.hits, lru_cache.stats.misses) == (2, 1)
+
+
+def test_result_cache_memory_and_disk(tmp_path):
+    """Test that results are reused from memory and from the persistent store."""
+    text = "must be able to move your hands repeatedly and lift heavy boxes"
+    calls = []
+
+    def compute(job_description_text):
+        calls.append(job_description_text)
+        return detector.find_ableist_language(job_description_text)
+
+    path = str(tmp_path / "results.sqlite")
+    result_cache = ResultCache(max_entries=10, path=path)
+    first = result_cache.get_or_compute(text, compute)
+    second = result_cache.get_or_compute(text, compute)
+    assert len(calls) == 1
+    assert second == first
+    assert result_cache.stats["memory"].hits == 1
+
+    # A new cache on the same file only has the persistent tier to rely on
+    reloaded_cache = ResultCache(max_entries=10, path=path)
+    assert reloaded_cache.get_or_compute(text, compute) == first
+    assert len(calls) == 1
+    assert reloaded_cache.stats["disk"].hits == 1
+    assert reloaded_cache.key(text) != reloaded_cache.key(text, mode="sentences")
+
+    # Modifying a returned match does not change the cached result
+    expected = [match.to_dict() for match in first]
+    second[0].start_char = -1
+    assert [
+        match.to_dict() for match in result_cache.get_or_compute(text, compute)
+    ] == expected
+
+
+def test_sqlite_result_store_concurrent_stats(tmp_path):
+    """Test that every lookup from concurrent threads is counted."""
+    store = SQLiteResultStore(str(tmp_path / "results.sqlite"))
+    store.put("hit", [])
+
+    def lookup(i):
+        return store.get("hit" if i % 2 == 0 else "miss")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lookup, range(400)))
+    assert (store.stats.hits, store.stats.misses) == (200, 200)
+    store.close()
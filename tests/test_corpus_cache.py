@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+"""Tests for the on-disk cache of parsed corpora."""
+
+from ableist_language_detector.corpus_cache import ParsedCorpusCache
+
+CORPUS = [
+    "The ability to quickly move your hands and lift heavy objects.",
+    "The ability to see details at a distance.",
+]
+
+
+def test_parsed_corpus_cache(tmp_path):
+    """Test that cached docs are reused and only added documents are parsed."""
+    cache_dir = str(tmp_path / "cache")
+    first = ParsedCorpusCache(cache_dir).get_docs("abilities", CORPUS)
+
+    corpus_cache = ParsedCorpusCache(cache_dir)
+    docs = corpus_cache.get_docs("abilities", CORPUS)
+    assert (corpus_cache.stats.loaded, corpus_cache.stats.parsed) == (2, 0)
+    assert [[(t.lemma_, t.pos_, t.dep_) for t in doc] for doc in docs] == [
+        [(t.lemma_, t.pos_, t.dep_) for t in doc] for doc in first
+    ]
+
+    corpus = [CORPUS[0], "The ability to climb ladders.", CORPUS[1]]
+    docs = corpus_cache.get_docs("abilities", corpus)
+    assert (corpus_cache.stats.loaded, corpus_cache.stats.parsed) == (2, 1)
+    assert [doc.text for doc in docs] == corpus
+
+    # Texts are compared even when the corpus has the same number of documents
+    corpus = [CORPUS[0], "The ability to see details up close.", CORPUS[1]]
+    docs = corpus_cache.get_docs("abilities", corpus)
+    assert (corpus_cache.stats.loaded, corpus_cache.stats.parsed) == (2, 1)
+    assert [doc.text for doc in docs] == corpus
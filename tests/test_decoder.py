@@ -2,10 +2,12 @@
 
 """Tests for detector functions."""
 
+import pytest
 import spacy
 
-from ableist_language_detector import detector
+from ableist_language_detector import detector, spacy_models
 from ableist_language_detector.ableist_word_list import AbleistLanguage
+from ableist_language_detector.segmentation import iter_windows
 
 nlp = spacy.load("en_core_web_sm")
 
@@ -46,3 +48,243 @@ def test_find_ableist_language():
     str_matched_results = [phrase.text for phrase in matched_results]
     expected_results = ["move your hands", "lifting", "move your wrists", "bend"]
     assert sorted(str_matched_results) == sorted(expected_results)
+
+
+def test_compiled_matchers_are_cached():
+    """Test that matchers are compiled once per wordlist and reused."""
+    ableist_verbs = {
+        "move": AbleistLanguage(
+            verb="move",
+            object_dependent=True,
+            alternative_verbs=["alt", "verbs"],
+            example="",
+            objects=["hand", "foot"],
+        )
+    }
+    matcher = detector.get_dependency_matcher(ableist_verbs, nlp.vocab)
+    assert detector.get_dependency_matcher(ableist_verbs, nlp.vocab) is matcher
+
+    ableist_verbs["move"].objects = ["hand"]
+    assert detector.get_dependency_matcher(ableist_verbs, nlp.vocab) is not matcher
+
+    # A wordlist compiled for another pipeline is rebuilt with the new vocab
+    compiled = detector.compile_wordlist(ableist_verbs, nlp.vocab)
+    assert detector.compile_wordlist(ableist_verbs, nlp.vocab) is compiled
+    other_vocab = spacy.blank("en").vocab
+    recompiled = detector.compile_wordlist(ableist_verbs, other_vocab)
+    assert recompiled.vocab is other_vocab
+    assert recompiled.verb_matcher.vocab is other_vocab
+    assert recompiled.dependency_matcher.vocab is other_vocab
+
+
+def test_find_ableist_language_batch():
+    """Test that batch results match single document results, in input order."""
+    docs = [
+        "must be able to move your hands repeatedly",
+        "excellent communication skills",
+        "comfortable with lifting heavy boxes and climbing ladders",
+    ]
+    batch_results = list(detector.find_ableist_language_batch(docs, batch_size=2))
+    assert len(batch_results) == len(docs)
+    for doc, result in zip(docs, batch_results):
+        expected = detector.find_ableist_language(doc)
+        assert [(m.text, m.start, m.end) for m in result] == [
+            (m.text, m.start, m.end) for m in expected
+        ]
+
+
+def test_shared_nlp():
+    """Test that the pipeline is loaded once and shared across calls."""
+    assert spacy_models.get_nlp() is spacy_models.get_nlp()
+    assert detector.nlp is spacy_models.get_nlp()
+    assert "ner" not in detector.nlp.pipe_names
+
+
+def test_find_ableist_language_prefilter():
+    """Test that the prefilter skips documents without changing results."""
+    docs = [
+        "excellent communication skills",
+        "must be able to move your hands repeatedly",
+        "strong attention to detail",
+        "comfortable with lifting heavy boxes",
+        "a collaborative team",
+    ]
+    skipped_before = detector.get_prefilter_stats().documents_skipped
+    results = list(detector.find_ableist_language_batch(docs, prefilter=True))
+    assert detector.get_prefilter_stats().documents_skipped - skipped_before == 3
+    assert [[m.text for m in result] for result in results] == [
+        [m.text for m in detector.find_ableist_language(doc)] for doc in docs
+    ]
+    assert detector.find_ableist_language(docs[0], prefilter=True) == []
+
+
+def test_find_ableist_language_sentences_mode():
+    """Test that parsing only candidate sentences keeps document offsets."""
+    doc = (
+        "We are a growing company with a friendly team. "
+        "Excellent communication skills are required. "
+        "You must be able to move your hands repeatedly. "
+        "Comfortable with lifting heavy boxes."
+    )
+    full_results = detector.find_ableist_language(doc)
+    sentence_results = detector.find_ableist_language(doc, mode="sentences")
+    assert sorted(
+        (m.text, m.start, m.end, m.start_char, m.end_char) for m in sentence_results
+    ) == sorted(
+        (m.text, m.start, m.end, m.start_char, m.end_char) for m in full_results
+    )
+    for m in sentence_results:
+        assert doc[m.start_char : m.end_char] == m.text
+
+
+def test_find_ableist_language_two_tier_mode():
+    """Test that two tier mode matches the full parse, with and without object
+    dependent verbs in the document.
+    """
+    docs = [
+        """
+        requirements
+        - must be able to move your hands repeatedly
+        - comfortable with lifting heavy boxes
+        - move your wrists in circles and bend your arms
+        """,
+        "You will be climbing ladders and lifting heavy boxes every day.",
+    ]
+    for doc in docs:
+        two_tier_results = detector.find_ableist_language(doc, mode="two_tier")
+        full_results = detector.find_ableist_language(doc)
+        assert sorted((m.text, m.start, m.end) for m in two_tier_results) == sorted(
+            (m.text, m.start, m.end) for m in full_results
+        )
+
+
+def test_find_ableist_language_windowed_mode():
+    """Test that windowed parsing reports each match once with document positions,
+    and that full mode falls back to it for documents over the length limit.
+    """
+    doc = (
+        "Must be able to move your hands repeatedly. Climb ladders daily.\n\n"
+        "You will be lifting heavy boxes. Answer calls from customers.\n\n"
+        "Stand for long periods and bend your arms."
+    )
+    full_results = detector.find_ableist_language(doc)
+    windowed_results = detector.find_ableist_language_windowed(
+        doc, window_chars=40, overlap_chars=30
+    )
+    assert sorted(
+        (m.text, m.start, m.end, m.start_char, m.end_char) for m in windowed_results
+    ) == sorted(
+        (m.text, m.start, m.end, m.start_char, m.end_char) for m in full_results
+    )
+
+    # Cores that start inside whitespace runs with newlines tokenize differently from
+    # the whole document; positions still follow the whole document
+    for separator in (" \n \n ", "\n\n\n \n \n"):
+        doc = separator.join(["lift boxes", "climb ladders", "lift boxes"] * 3)
+        full_results = detector.find_ableist_language(doc)
+        for window_chars in (5, 9, 20):
+            windowed_results = detector.find_ableist_language_windowed(
+                doc, window_chars=window_chars, overlap_chars=0
+            )
+            assert [
+                (m.text, m.start, m.end, m.start_char, m.end_char)
+                for m in windowed_results
+            ] == [
+                (m.text, m.start, m.end, m.start_char, m.end_char) for m in full_results
+            ]
+
+    pipeline = spacy_models.get_nlp()
+    max_length = pipeline.max_length
+    pipeline.max_length = len(doc) - 1
+    try:
+        assert len(detector.find_ableist_language(doc)) == len(full_results)
+    finally:
+        pipeline.max_length = max_length
+
+
+def test_iter_windows_keeps_tokens_whole():
+    """Test that cores end at token boundaries when a range has no whitespace, and
+    are only cut inside a token longer than the window.
+    """
+
+    def cores(text, window_chars):
+        return [
+            (window.core_start, window.core_end)
+            for window in iter_windows(text, window_chars, 20)
+        ]
+
+    # The second half of the first core falls inside a long token
+    assert cores("lift " * 10 + "a" * 80 + " boxes", 100) == [(0, 50), (50, 136)]
+    # Punctuation is a boundary in text without whitespace
+    assert cores("word," * 30, 100) == [(0, 95), (95, 150)]
+    # A token longer than the window cannot be kept whole
+    text = "a" * 250 + " lift boxes"
+    assert cores(text, 100) == [(0, 100), (100, 200), (200, len(text))]
+
+
+def test_match_engines_and_phrases():
+    """Test that the index engine finds the same matches as the spacy matchers, and
+    that multi-word entries match any form of their first word.
+    """
+    doc = nlp(
+        "Must be able to move your hands repeatedly. Comfortable with lifting heavy "
+        "boxes. Stands for long periods and bend your arms."
+    )
+    ableist_verbs = {
+        "move": AbleistLanguage(
+            verb="move",
+            object_dependent=True,
+            alternative_verbs=["alt", "verbs"],
+            example="",
+            objects=["hand", "foot"],
+        ),
+        "lift": AbleistLanguage(
+            verb="lift",
+            object_dependent=False,
+            alternative_verbs=["move"],
+            example="",
+            objects=None,
+        ),
+        "stand for long periods": AbleistLanguage(
+            verb="stand for long periods",
+            object_dependent=False,
+            alternative_verbs=["remain in one place"],
+            example="",
+            objects=None,
+        ),
+    }
+    compiled = detector.compile_wordlist(ableist_verbs, nlp.vocab)
+    matcher_results = detector.match_compiled_wordlist(doc, compiled, engine="matcher")
+    index_results = detector.match_compiled_wordlist(doc, compiled, engine="index")
+    assert sorted((m.text, m.start, m.end) for m in index_results) == sorted(
+        (m.text, m.start, m.end) for m in matcher_results
+    )
+    assert "Stands for long periods" in [m.text for m in index_results]
+
+    with pytest.raises(ValueError):
+        detector.set_match_engine("regex")
+
+
+def test_find_ableist_language_segment_cache_mode():
+    """Test that cached sentences are reused at their position in a new document."""
+    boilerplate = "You must be able to lift heavy boxes. "
+    docs = [
+        "We are a growing company. " + boilerplate,
+        boilerplate + "Comfortable with climbing ladders. " + boilerplate,
+    ]
+    detector.set_segment_cache_size(100)
+    try:
+        for doc in docs:
+            cached_results = detector.find_ableist_language(doc, mode="segment_cache")
+            sentence_results = detector.find_ableist_language(doc, mode="sentences")
+            assert [
+                (m.text, m.start, m.end, m.start_char, m.end_char)
+                for m in cached_results
+            ] == [
+                (m.text, m.start, m.end, m.start_char, m.end_char)
+                for m in sentence_results
+            ]
+        stats = detector.get_segment_cache_stats()
+        assert (stats.hits, stats.misses) == (2, 2)
+    finally:
+        detector.set_segment_cache_size()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+
+"""Tests for incremental detection while editing."""
+
+import pytest
+
+from ableist_language_detector import detector
+from ableist_language_detector.editing import EditSession
+from ableist_language_detector.segmentation import split_paragraphs
+
+DRAFT = (
+    "You must be able to move your hands repeatedly.\n\n"
+    "The role involves answering calls from customers.\n\n"
+    "Candidates should lift heavy boxes.\n"
+)
+
+
+def test_edit_session_reparses_changed_paragraphs():
+    """Test that only edited paragraphs are parsed and offsets follow the edit."""
+    session = EditSession(DRAFT)
+    assert session.paragraphs_analyzed == 3
+
+    position = DRAFT.index("answering")
+    matches = session.apply_edit(position, position, "standing and ")
+    assert (session.paragraphs_analyzed, session.paragraphs_reused) == (4, 2)
+
+    expected = detector.stitch_segments(
+        detector.analyze_segments(split_paragraphs(session.text))
+    )
+    assert matches == expected
+    assert "stand" in [match.lemma for match in matches]
+    for match in matches:
+        assert session.text[match.start_char : match.end_char] == match.text
+
+
+def test_edit_session_invalid_edit():
+    """Test that an edit outside the text is rejected."""
+    session = EditSession("lift heavy boxes")
+    with pytest.raises(ValueError):
+        session.apply_edit(5, 100, "")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+"""Tests for term counting over O*NET database files."""
+
+from ableist_language_detector.extract_onet_database import (
+    count_onet_terms,
+    expand_data_paths,
+    write_term_counts,
+)
+
+
+def test_count_onet_terms(tmp_path):
+    """Test that rows of several files are counted by file and section."""
+    data_dir = tmp_path / "onet"
+    data_dir.mkdir()
+    (data_dir / "Content Model Reference.txt").write_text(
+        "Element ID\tElement Name\tDescription\n"
+        "1.A.1.a.1\tMove\tThe ability to quickly move your hands.\n"
+        "1.A.1.a.2\tLift\tThe ability to lift heavy objects.\n"
+        "2.A.1.a\tTalk\tTalking to others to convey information.\n"
+    )
+    (data_dir / "Task Statements.txt").write_text(
+        "O*NET-SOC Code\tTask ID\tTask\tTask Type\n"
+        '11-1011.00\t1\tMove heavy boxes to the "dock".\tCore\n'
+        "11-1011.00\t2\t\tCore\n"
+        "11-1011.00\t3\tAnalyze reports and move files.\tSupplemental\n"
+    )
+    data_paths = expand_data_paths([str(data_dir)])
+    assert len(data_paths) == 2
+
+    counts = count_onet_terms(data_paths, chunk_size=1, batch_size=2)
+    assert sorted(counts) == [
+        ("Content Model Reference.txt", "1.A"),
+        ("Content Model Reference.txt", "2.A"),
+        ("Task Statements.txt", "Core"),
+        ("Task Statements.txt", "Supplemental"),
+    ]
+    assert counts[("Content Model Reference.txt", "1.A")].documents == 2
+    assert counts[("Task Statements.txt", "Core")].documents == 1
+
+    output_dir = tmp_path / "output"
+    write_term_counts(counts, str(output_dir))
+    assert (
+        (output_dir / "term_counts.csv")
+        .read_text()
+        .startswith("file,section,documents,kind,term,count\n")
+    )
+    verbs = (output_dir / "verbs.txt").read_text().split()
+    assert verbs[0] == "move"
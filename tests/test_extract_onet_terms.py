@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""Tests for O*NET term extraction."""
+
+import numpy as np
+
+from ableist_language_detector import term_stats, utils
+from ableist_language_detector.extract_onet_terms import (
+    extract_corpus_terms,
+    rank_representative_terms,
+)
+from ableist_language_detector.spacy_models import get_nlp
+
+ABILITIES = [
+    "The ability to quickly move your hands and lift heavy objects.",
+    "The ability to see details at a distance and move your arms.",
+]
+SKILLS = ["Talking to others to convey information effectively and move ideas."]
+
+
+def test_extract_corpus_terms():
+    """Test that one pass collects the same terms as the separate token filters."""
+    terms = extract_corpus_terms(ABILITIES, batch_size=1)
+    docs = list(get_nlp().pipe(ABILITIES))
+    assert terms.verbs == [t.lemma_ for doc in docs for t in utils.get_verbs(doc)]
+    assert terms.objects == [t.lemma_ for doc in docs for t in utils.get_objects(doc)]
+    assert terms.nouns == [t.lemma_ for doc in docs for t in utils.get_nouns(doc)]
+
+    abilities_verbs, skills_verbs = rank_representative_terms(
+        ["move", "lift", "move", "see"], ["move", "talk"]
+    )
+    assert abilities_verbs[0] in {"lift", "see"} and "move" not in abilities_verbs
+    assert skills_verbs == ["talk"]
+
+
+def test_score_terms():
+    """Test that terms used in both corpora are ranked by how skewed they are."""
+    abilities = [["lift", "see"], ["lift", "lift"], ["see", "see", "move"]] * 20
+    skills = [["write", "move"], ["move", "see"], ["analyze", "write"]] * 20
+    (abilities_matrix, _), vocabulary = term_stats.build_term_matrices(
+        abilities, skills
+    )
+    assert abilities_matrix[1, list(vocabulary).index("lift")] == 2
+
+    scores = term_stats.score_terms(abilities, skills)
+    assert scores.set_index("term").loc["see", "skills_count"] == 20
+    abilities_verbs, skills_verbs = term_stats.select_representative_terms(scores)
+    assert abilities_verbs == ["lift", "see"]
+    assert skills_verbs == ["write", "analyze"]
+
+    # A single term has no odds to compare and is not representative of either
+    with np.errstate(all="raise"):
+        scores = term_stats.score_terms([["lift"]], [["lift"]])
+    assert scores.log_odds_z.tolist() == [0.0]
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+"""Tests for pipeline memory management."""
+
+from ableist_language_detector import detector, spacy_models
+from ableist_language_detector.memory import VocabManager
+
+TEXT = "must be able to move your hands repeatedly and lift heavy boxes"
+
+
+def test_vocab_manager_reloads_pipeline():
+    """Test that the pipeline is reloaded after the document limit and matchers are
+    rebuilt with the new vocab.
+    """
+    expected = detector.find_ableist_language(TEXT)
+    old_nlp = spacy_models.get_nlp()
+    manager = VocabManager(max_documents=2)
+    assert not manager.record(1)
+    assert manager.record(1)
+
+    nlp = spacy_models.get_nlp()
+    assert nlp is not old_nlp
+    compiled = detector._compile_default_wordlist(nlp.vocab)
+    assert compiled.verb_matcher.vocab is nlp.vocab
+    assert detector.find_ableist_language(TEXT) == expected
+
+    metrics = manager.metrics()
+    assert (metrics["resets"], metrics["documents_since_reset"]) == (1, 0)
+    assert metrics["vocab_strings"] == len(nlp.vocab.strings)
+    assert metrics["rss_bytes"] > 0
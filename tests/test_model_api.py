@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+
+"""Tests for the mlflow model."""
+
+import pandas as pd
+
+from ableist_language_detector import detector
+from ableist_language_detector.model_api import MLflowLanguageModel
+
+
+def test_predict_all_rows():
+    """Test that every row is processed and fields keep their types."""
+    texts = [
+        "must be able to move your hands repeatedly and lift heavy boxes",
+        "excellent communication skills",
+    ]
+    result = MLflowLanguageModel().predict(None, pd.DataFrame({"data": texts}))
+    assert len(result) == len(texts)
+    assert result[1] == []
+    assert result[0] == [
+        match.to_dict() for match in detector.find_ableist_language(texts[0])
+    ]
+    for match in result[0]:
+        assert isinstance(match["start"], int)
+        assert isinstance(match["alternative_verbs"], list)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""Tests for near-duplicate result reuse."""
+
+from ableist_language_detector import detector
+from ableist_language_detector.segmentation import split_paragraphs
+from ableist_language_detector.near_duplicates import MinHasher, NearDuplicateDetector
+
+POSTING = (
+    "Senior Warehouse Associate\n\n"
+    "Location: Springfield, IL\n\n"
+    "You must be able to move your hands repeatedly and lift heavy boxes in a busy "
+    "warehouse with a friendly team of associates who ship orders every day.\n\n"
+    "Candidates should stand for long periods and walk the floor during each shift "
+    "while keeping the aisles clean and the inventory accurate.\n\n"
+    "Benefits include health insurance, paid time off and a retirement plan with an "
+    "employer match for all full time employees of the company.\n"
+)
+
+
+def test_minhash_similarity():
+    """Test that similar texts have similar signatures."""
+    hasher = MinHasher()
+    signature = hasher.signature(POSTING)
+    repost = hasher.signature(POSTING.replace("Springfield, IL", "Dayton, OH"))
+    unrelated = hasher.signature(
+        "Write quarterly reports and present them to the board."
+    )
+    assert (signature == repost).mean() > 0.6
+    assert (signature == unrelated).mean() < 0.2
+
+
+def test_near_duplicate_reuse():
+    """Test that only changed paragraphs of a repost are analyzed and that offsets of
+    reused matches are moved to their new position.
+    """
+    near_duplicate_detector = NearDuplicateDetector(threshold=0.5)
+    first = near_duplicate_detector.find_ableist_language(POSTING)
+    assert near_duplicate_detector.stats.near_duplicates == 0
+
+    repost = POSTING.replace("Springfield, IL", "Lake Havasu City, Arizona")
+    result = near_duplicate_detector.find_ableist_language(repost)
+    stats = near_duplicate_detector.stats
+    assert (stats.near_duplicates, stats.paragraphs_analyzed) == (1, 6)
+    assert stats.paragraphs_reused == 4
+
+    expected = detector.stitch_segments(
+        detector.analyze_segments(split_paragraphs(repost))
+    )
+    assert [m.lemma for m in result] == [m.lemma for m in first]
+    assert result == expected
+    for match in result:
+        assert repost[match.start_char : match.end_char] == match.text
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""Tests for the detector worker pool."""
+
+import gc
+
+from ableist_language_detector import ableist_word_list, detector, spacy_models
+from ableist_language_detector.pool import DetectorPool, chunked, warm_worker
+
+TEXTS = [
+    "must be able to move your hands repeatedly",
+    "answer calls from customers",
+    "lift heavy boxes and stand for long periods",
+]
+
+
+def test_detector_pool():
+    """Test that pooled results match the in-process results, in order, when
+    workers are recycled after every chunk.
+    """
+    texts = TEXTS * 5
+    with DetectorPool(2, chunk_size=2, max_tasks_per_child=1) as pool:
+        results = list(pool.find_ableist_language_batch(iter(texts)))
+        lengths = sorted(pool.imap(len, chunked(texts, 4), ordered=False))
+    assert results == list(detector.find_ableist_language_batch(texts))
+    assert lengths == [3, 4, 4, 4]
+
+
+def test_pools_share_frozen_heap():
+    """Test that closing one pool keeps the heap frozen for another live pool."""
+    first = DetectorPool(1).start()
+    second = DetectorPool(1).start()
+    first.close()
+    assert gc.get_freeze_count() > 0
+    assert list(second.imap(len, [[1, 2]])) == [2]
+    second.close()
+    assert gc.get_freeze_count() == 0
+
+
+def test_warm_worker_applies_parent_configuration(tmp_path):
+    """Test that spawned workers are set up with the parent's wordlist and model."""
+    wordlist_csv_path = tmp_path / "wordlist.csv"
+    wordlist_csv_path.write_text(
+        "verb,object_dependent,objects,alternative_verbs,example\n"
+        "lift,False,,move,Move boxes\n"
+    )
+    model_name, exclude = spacy_models.get_default_model()
+    try:
+        warm_worker(model_name, exclude, str(wordlist_csv_path))
+        assert list(ableist_word_list.get_ableist_verbs()) == ["lift"]
+        assert [m.text for m in detector.find_ableist_language(TEXTS[2])] == ["lift"]
+    finally:
+        ableist_word_list.set_default_wordlist()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+"""Tests for the lexical prefilter."""
+
+from ableist_language_detector.ableist_word_list import AbleistLanguage
+from ableist_language_detector.prefilter import LexicalPrefilter, inflect_verb
+
+
+def test_inflect_verb():
+    """Test regular and irregular surface form generation."""
+    assert {"climb", "climbs", "climbed", "climbing"} <= inflect_verb("climb")
+    assert {"carries", "carried", "carrying"} <= inflect_verb("carry")
+    assert {"moves", "moved", "moving"} <= inflect_verb("move")
+    assert {"runs", "ran", "running"} <= inflect_verb("run")
+    assert {"stood", "standing"} <= inflect_verb("stand")
+
+
+def test_lexical_prefilter():
+    """Test candidate detection and skip statistics."""
+    ableist_verbs = {
+        "lift": AbleistLanguage(
+            verb="lift",
+            object_dependent=False,
+            alternative_verbs=["move"],
+            example="",
+            objects="",
+        )
+    }
+    lexical_prefilter = LexicalPrefilter(ableist_verbs)
+    assert lexical_prefilter.has_candidates("Comfortable LIFTING heavy boxes")
+    assert not lexical_prefilter.has_candidates("excellent communication skills")
+    assert not lexical_prefilter.has_candidates("uplifting team culture")
+    assert lexical_prefilter.stats.documents_checked == 3
+    assert lexical_prefilter.stats.documents_skipped == 2
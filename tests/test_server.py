@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+"""Tests for the micro-batching server."""
+
+import asyncio
+import json
+import time
+
+from ableist_language_detector.server import DetectorServer, MicroBatcher
+
+
+def fake_process_batch(texts):
+    """Return the text length and batch size for each text."""
+    return [(len(text), len(texts)) for text in texts]
+
+
+def test_micro_batcher_groups_concurrent_requests():
+    """Test that concurrent requests share a batch and get their own results."""
+
+    async def run():
+        batcher = MicroBatcher(fake_process_batch, max_batch_size=8, max_wait_ms=50)
+        await batcher.start()
+        results = await asyncio.gather(
+            batcher.submit(["a"]), batcher.submit(["bb", "ccc"]), batcher.submit([])
+        )
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(run()) == [[(1, 3)], [(2, 3), (3, 3)], []]
+
+
+def test_micro_batcher_respects_max_batch_size():
+    """Test that batches never exceed the maximum size."""
+
+    async def run():
+        batcher = MicroBatcher(fake_process_batch, max_batch_size=2, max_wait_ms=50)
+        await batcher.start()
+        results = await batcher.submit(["a", "b", "c", "d", "e"])
+        await batcher.stop()
+        return results
+
+    assert [batch_size for _, batch_size in asyncio.run(run())] == [2, 2, 2, 2, 1]
+
+
+def test_server_invocations():
+    """Test the request and response format of the invocations endpoint."""
+
+    async def run():
+        batcher = MicroBatcher(fake_process_batch, max_wait_ms=1)
+        await batcher.start()
+        server = await asyncio.start_server(
+            DetectorServer(batcher).handle_connection, "127.0.0.1", 0
+        )
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        # Raw newline inside the JSON string, as sent by predictAPI.sh
+        body = b'{"data": ["line one\nline two", "x"]}'
+        writer.write(
+            b"POST /invocations HTTP/1.1\r\nHost: localhost\r\n"
+            b"Content-Type: application/json; format=pandas-records\r\n"
+            b"Connection: close\r\nContent-Length: %d\r\n\r\n" % len(body) + body
+        )
+        response = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        await batcher.stop()
+        return response
+
+    response = asyncio.run(run())
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert json.loads(body) == [[17, 2], [1, 2]]
+
+
+def test_micro_batcher_stop_waits_for_batches():
+    """Test that stopping the batcher lets the batches being processed finish."""
+
+    def slow_process_batch(texts):
+        time.sleep(0.05)
+        return fake_process_batch(texts)
+
+    async def run():
+        batcher = MicroBatcher(slow_process_batch, max_wait_ms=1)
+        await batcher.start()
+        submitted = asyncio.ensure_future(batcher.submit(["a", "bb"]))
+        while not batcher._dispatches:
+            await asyncio.sleep(0.001)
+        await batcher.stop()
+        assert not batcher._dispatches
+        return submitted.result()
+
+    assert asyncio.run(run()) == [(1, 2), (2, 2)]
+
+
+def test_server_metrics_error(monkeypatch):
+    """Test that a failure to collect metrics is reported as a server error."""
+
+    def failing_get_metrics():
+        raise RuntimeError("worker died")
+
+    monkeypatch.setattr(
+        "ableist_language_detector.memory.get_metrics", failing_get_metrics
+    )
+
+    async def run():
+        return await DetectorServer(MicroBatcher(fake_process_batch))._route(
+            "GET", "/metrics", b""
+        )
+
+    assert asyncio.run(run()) == (500, {"error": "Failed to collect metrics."})
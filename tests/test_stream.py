@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+"""Tests for the streaming command line tool."""
+
+import json
+
+import pytest
+
+from ableist_language_detector import detector, stream
+
+TEXTS = [
+    "must be able to move your hands repeatedly",
+    "answer calls from customers",
+    "lift heavy boxes and stand for long periods",
+]
+
+
+def test_read_records(tmp_path):
+    """Test reading JSON lines and file paths."""
+    lines = [json.dumps({"request_id": "a", "body": TEXTS[0]}), "", '{"body": "x"}']
+    records = list(stream.read_records(lines, "jsonl", "request_id", "body"))
+    assert records == [("a", TEXTS[0]), (3, "x")]
+    with pytest.raises(ValueError):
+        list(stream.read_records(['{"text": "x"}'], "jsonl", text_field="body"))
+
+    for i, text in enumerate(TEXTS):
+        (tmp_path / f"{i}.txt").write_text(text)
+    records = list(stream.read_records([str(tmp_path / "*.txt")], "paths"))
+    assert [text for _, text in records] == TEXTS
+
+
+@pytest.mark.parametrize("workers,ordered", [(0, True), (2, True), (2, False)])
+def test_stream_results(workers, ordered):
+    """Test that every record gets its own result, in order unless unordered."""
+    records = [(i, TEXTS[i % len(TEXTS)]) for i in range(10)]
+    results = list(
+        stream.stream_results(records, batch_size=3, workers=workers, ordered=ordered)
+    )
+    if not ordered:
+        results.sort(key=lambda result: result[0])
+    assert [record_id for record_id, _ in results] == list(range(10))
+    for record_id, matches in results:
+        expected = detector.find_ableist_language(records[record_id][1])
+        assert matches == [match.to_dict() for match in expected]